@@ -0,0 +1,84 @@
+"""Benchmark due-date parsing: the old inline dateparser call vs src.due_dates.
+
+Run from the repo root:  python -m benchmarks.bench_due_dates [rounds]
+
+Reports per-input latency for each path and, for the service, how long the
+event loop was actually blocked (the part not spent in the worker thread).
+"""
+
+import asyncio
+import statistics
+import sys
+import time
+
+import dateparser
+
+from src import due_dates
+
+INPUTS = [
+    "2026-11-03", "tomorrow", "today", "friday", "next friday", "mon",
+    "in 3 days", "in 2 weeks", "next week", "march 5", "the 15th",
+    "3 days from now", "dec 24 2026",
+]
+OLD_SETTINGS = {"TIMEZONE": "UTC", "RETURN_AS_TIMEZONE_AWARE": True}
+
+
+def _old_path(text: str) -> None:
+    dateparser.parse(text, settings=OLD_SETTINGS)
+
+
+def _ms(samples: list[float]) -> str:
+    return f"median {statistics.median(samples) * 1000:7.3f} ms  max {max(samples) * 1000:7.3f} ms"
+
+
+async def _service(rounds: int) -> tuple[list[float], list[float]]:
+    loop = asyncio.get_running_loop()
+    latency, blocked = [], []
+    for _ in range(rounds):
+        due_dates._cache.clear()  # measure the uncached cost each round
+        for text in INPUTS:
+            # A ticker measures the longest gap the loop went without running
+            gaps, last = [], loop.time()
+
+            async def tick():
+                nonlocal last
+                while True:
+                    await asyncio.sleep(0)
+                    now = loop.time()
+                    gaps.append(now - last)
+                    last = now
+
+            ticker = asyncio.create_task(tick())
+            await asyncio.sleep(0)
+            start = time.perf_counter()
+            await due_dates.parse_due_date(text)
+            latency.append(time.perf_counter() - start)
+            ticker.cancel()
+            blocked.append(max(gaps, default=0.0))
+    return latency, blocked
+
+
+def main(rounds: int = 20) -> None:
+    start = time.perf_counter()
+    _old_path("next friday")
+    print(f"old path, first call (loads language data): {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    old = []
+    for _ in range(rounds):
+        for text in INPUTS:
+            start = time.perf_counter()
+            _old_path(text)
+            old.append(time.perf_counter() - start)
+
+    latency, blocked = asyncio.run(_service(rounds))
+    fast = sum(due_dates.parse_fast(t, 0) is not None for t in INPUTS)
+
+    print(f"{len(INPUTS)} inputs x {rounds} rounds, {fast} on the fast path")
+    print(f"  old path latency (all on the loop):  {_ms(old)}")
+    print(f"  service latency, uncached:           {_ms(latency)}")
+    print(f"  service event-loop blocking:         {_ms(blocked)}")
+    print(f"  service stats: {due_dates.stats}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
@@ -0,0 +1,81 @@
+"""Benchmark next-occurrence computation over 100k recurring series.
+
+Run from the repo root:  python -m benchmarks.bench_recurrence [series]
+
+Compares recurrence.next_occurrences() (one parse per distinct rule, O(1)
+arithmetic per series) with calling parse() + next_occurrence() per series,
+and spot-checks both against a day-by-day reference.
+"""
+
+import calendar
+import datetime
+import random
+import sys
+import time
+
+from src import recurrence
+from src.dates import EPOCH, to_day_number
+
+RULES = [
+    "daily",
+    "weekly",
+    "FREQ=DAILY;INTERVAL=3",
+    "FREQ=WEEKLY;BYDAY=MO,WE,FR",
+    "FREQ=WEEKLY;INTERVAL=2;BYDAY=TU,TH",
+    "FREQ=MONTHLY;BYMONTHDAY=15",
+    "FREQ=MONTHLY;INTERVAL=3;BYMONTHDAY=31",
+]
+
+
+def _reference(rule: recurrence.Rule, base: int, after: int) -> int:
+    """Test each day in turn for membership; slow but obviously correct."""
+    base_date = datetime.date.fromordinal(EPOCH.toordinal() + base)
+    day = max(base, after) + 1
+    while True:
+        date = datetime.date.fromordinal(EPOCH.toordinal() + day)
+        if rule.freq == recurrence.DAILY:
+            hit = (day - base) % rule.interval == 0
+        elif rule.freq == recurrence.WEEKLY:
+            # Whole weeks between the Mondays starting each day's week
+            weeks = ((day - date.weekday()) - (base - base_date.weekday())) // 7
+            weekdays = rule.weekdays or (base_date.weekday(),)
+            hit = date.weekday() in weekdays and weeks % rule.interval == 0
+        else:
+            months = (date.year - base_date.year) * 12 + date.month - base_date.month
+            last = calendar.monthrange(date.year, date.month)[1]
+            hit = months % rule.interval == 0 and date.day == min(rule.month_day, last)
+        if hit:
+            return day
+        day += 1
+
+
+def main(count: int = 100_000) -> None:
+    rng = random.Random(42)
+    start_day = to_day_number("2024-01-01")
+    texts = [rng.choice(RULES) for _ in range(count)]
+    bases = [start_day + rng.randrange(730) for _ in range(count)]
+    after = start_day + 800  # most series have missed occurrences to skip
+
+    t0 = time.perf_counter()
+    batch = recurrence.next_occurrences(texts, bases, after)
+    t_batch = time.perf_counter() - t0
+
+    recurrence.parse.cache_clear()
+    t0 = time.perf_counter()
+    single = [
+        recurrence.next_occurrence(recurrence.parse(text), base, after)
+        for text, base in zip(texts, bases)
+    ]
+    t_single = time.perf_counter() - t0
+
+    assert batch == single
+    for i in rng.sample(range(count), 200):
+        assert batch[i] == _reference(recurrence.parse(texts[i]), bases[i], after), texts[i]
+
+    print(f"{count} series, {len(RULES)} rules")
+    print(f"  next_occurrences (batch): {t_batch * 1000:8.1f} ms  {count / t_batch:12,.0f} series/s")
+    print(f"  next_occurrence per series: {t_single * 1000:6.1f} ms  {count / t_single:12,.0f} series/s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,359 @@
+"""Accountability board pipeline: assembling board data, publishing it as
+one or more page messages, and coalescing refresh requests. Delegates to embeds.py, db.py and messaging.py."""
+
+import asyncio
+import collections
+import hashlib
+import json
+import logging
+from typing import Callable
+
+import discord
+from discord.ext import commands
+
+from src import db
+from src import events
+from src.constants import BOARD_RECENT_COMPLETED, BOARD_REFRESH_INTERVAL
+from src.embeds import build_board_pages
+from src.messaging import LANE_BOARD, delete_message, edit_message, send_message
+
+log = logging.getLogger("bother-bot")
+
+# Running totals since startup
+stats = {"edits_skipped": 0}
+
+
+def board_content_hash(embed: discord.Embed) -> str:
+    """Return a stable hash of the embed's visible content, ignoring its timestamp."""
+    data = embed.to_dict()
+    data.pop("timestamp", None)
+    payload = json.dumps(data, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def build_users_data(guild: discord.Guild, rows: list) -> list[dict]:
+    """Group flat get_all_users_with_tasks() rows into build_board_embed() input."""
+    users_map: dict[str, dict] = {}
+    for row in rows:
+        uid = row["discord_id"]
+        if uid not in users_map:
+            member = guild.get_member(int(uid))
+            name = member.display_name if member else f"User {uid}"
+            users_map[uid] = {"name": name, "score": row["score"], "tasks": []}
+        if row["task_id"] is not None:
+            users_map[uid]["tasks"].append({
+                "description": row["description"],
+                "status": row["status"],
+            })
+    return list(users_map.values())
+
+
+class BoardModel:
+    """In-memory board state, loaded once and updated in O(1) per task change.
+
+    Mirrors get_all_users_with_tasks() so a refresh renders from memory
+    instead of re-querying every task ever created. Like that query it keeps
+    only each user's `recent_completed` newest completions. Every mutation
+    calls on_change (the scheduler's mark_dirty) so the board re-renders.
+    """
+
+    def __init__(
+        self,
+        on_change: Callable[[], None] | None = None,
+        recent_completed: int = BOARD_RECENT_COMPLETED,
+    ):
+        self.on_change = on_change
+        self.recent_completed = recent_completed
+        self.loaded = False
+        self._scores: dict[str, int] = {}
+        self._tasks: dict[str, dict[int, dict]] = {}
+        self._owners: dict[int, str] = {}
+        self._completed: dict[str, collections.deque[int]] = {}
+
+    async def load(self) -> None:
+        """(Re)build the model from the database."""
+        rows = await db.get_all_users_with_tasks(self.recent_completed)
+        self._scores.clear()
+        self._tasks.clear()
+        self._owners.clear()
+        self._completed.clear()
+        for row in sorted(rows, key=lambda r: r["task_id"] or 0):
+            uid = row["discord_id"]
+            self._scores[uid] = row["score"]
+            self._tasks.setdefault(uid, {})
+            if row["task_id"] is not None:
+                self._put(row["task_id"], uid, row["description"], row["status"])
+        self.loaded = True
+        self._changed()
+
+    def _changed(self) -> None:
+        if self.on_change is not None:
+            self.on_change()
+
+    def _put(self, task_id: int, uid: str, description: str, status: str) -> None:
+        self._tasks.setdefault(uid, {})[task_id] = {
+            "description": description,
+            "status": status,
+        }
+        self._owners[task_id] = uid
+        if status == "completed":
+            self._track_completed(task_id, uid)
+
+    def _track_completed(self, task_id: int, uid: str) -> None:
+        """Remember a completion, evicting the user's oldest beyond the cap."""
+        completed = self._completed.setdefault(uid, collections.deque())
+        completed.append(task_id)
+        while len(completed) > self.recent_completed:
+            oldest = completed.popleft()
+            del self._tasks[uid][oldest]
+            del self._owners[oldest]
+
+    def user_added(self, uid: str) -> None:
+        if uid not in self._scores:
+            self._scores[uid] = 0
+            self._tasks[uid] = {}
+            self._changed()
+
+    def task_added(self, task_id: int, uid: str, description: str, status: str = "pending") -> None:
+        self._scores.setdefault(uid, 0)
+        self._put(task_id, uid, description, status)
+        self._changed()
+
+    def task_updated(
+        self, task_id: int, *, status: str | None = None, description: str | None = None
+    ) -> None:
+        uid = self._owners.get(task_id)
+        if uid is None:
+            return
+        task = self._tasks[uid][task_id]
+        if description is not None:
+            task["description"] = description
+        if status is not None and status != task["status"]:
+            if task["status"] == "completed":
+                self._completed[uid].remove(task_id)
+            task["status"] = status
+            if status == "completed":
+                self._track_completed(task_id, uid)
+        self._changed()
+
+    def task_removed(self, task_id: int) -> None:
+        uid = self._owners.pop(task_id, None)
+        if uid is None:
+            return
+        task = self._tasks[uid].pop(task_id)
+        if task["status"] == "completed":
+            self._completed[uid].remove(task_id)
+        self._changed()
+
+    def score_changed(self, uid: str, delta: int) -> None:
+        if not delta:
+            return
+        self._scores[uid] = self._scores.get(uid, 0) + delta
+        self._tasks.setdefault(uid, {})
+        self._changed()
+
+    async def handle_event(self, event: events.Event) -> None:
+        """Event bus subscriber: apply one task lifecycle event."""
+        p = event.payload
+        if event.name == events.TASK_CREATED:
+            self.task_added(p["task_id"], p["discord_id"], p["description"])
+        elif event.name == events.TASK_EDITED:
+            self.task_updated(p["task_id"], description=p["description"])
+        elif event.name == events.TASK_COMPLETED:
+            self.task_updated(p["task_id"], status="completed")
+            self.score_changed(p["discord_id"], p["score_delta"])
+        elif event.name == events.TASK_SNOOZED:
+            self.task_updated(p["task_id"], status="pending")
+            self.score_changed(p["discord_id"], p["score_delta"])
+        elif event.name == events.TASK_OVERDUE:
+            self.task_updated(p["task_id"], status="overdue")
+            self.score_changed(p["discord_id"], p["score_delta"])
+        elif event.name == events.TASK_DELETED:
+            self.task_removed(p["task_id"])
+        elif event.name == events.USER_OPTED_IN:
+            self.user_added(p["discord_id"])
+
+    def users_data(self, guild: discord.Guild) -> list[dict]:
+        """Return build_board_embed() input for the current state."""
+        users = []
+        for uid, score in self._scores.items():
+            member = guild.get_member(int(uid))
+            name = member.display_name if member else f"User {uid}"
+            users.append({
+                "name": name,
+                "score": score,
+                "tasks": [dict(t) for t in self._tasks[uid].values()],
+            })
+        return users
+
+
+async def get_board_message_ids() -> list[str]:
+    """Return the board's page message IDs, in page order."""
+    raw = await db.get_config("board_message_ids")
+    if raw:
+        return json.loads(raw)
+    # Boards published before pagination stored a single message ID
+    legacy = await db.get_config("board_message_id")
+    return [legacy] if legacy else []
+
+
+async def clear_board_messages() -> None:
+    """Forget the published board so the next render posts it afresh."""
+    await db.delete_config("board_message_ids")
+    await db.delete_config("board_content_hashes")
+    await db.delete_config("board_message_id")
+    await db.delete_config("board_content_hash")
+
+
+async def refresh_board(bot: commands.Bot) -> bool:
+    """Re-render the accountability board, one message per page.
+
+    Fetches board_channel_id and the page message IDs from config, builds
+    fresh page embeds, and edits only the pages whose content hash differs
+    from the last published one. Pages are posted or deleted as the board
+    grows or shrinks. If a page message was deleted, it and every later page
+    are re-posted so the pages stay in order.
+    Silently returns if the board is not yet set up.
+
+    Returns False if some page could not be published (or the channel isn't
+    cached yet), so the board may be behind and needs another render.
+    """
+    channel_id = await db.get_config("board_channel_id")
+    if not channel_id:
+        return True
+
+    channel = bot.get_channel(int(channel_id))
+    if not channel:
+        return False
+
+    model: BoardModel | None = getattr(bot, "board_model", None)
+    if model is not None and model.loaded:
+        users_data = model.users_data(channel.guild)
+    else:
+        users_data = build_users_data(channel.guild, await db.get_all_users_with_tasks())
+    pages = build_board_pages(users_data)
+    hashes = [board_content_hash(embed) for embed in pages]
+
+    raw_ids = await db.get_config("board_message_ids")
+    old_ids = await get_board_message_ids()
+    raw_hashes = await db.get_config("board_content_hashes")
+    old_hashes = json.loads(raw_hashes) if raw_hashes else []
+
+    new_ids: list[str] = []
+    published: list[str] = []
+    reposting = False
+    complete = True
+    for i, embed in enumerate(pages):
+        if i < len(old_ids) and not reposting:
+            if i < len(old_hashes) and old_hashes[i] == hashes[i]:
+                stats["edits_skipped"] += 1
+                new_ids.append(old_ids[i])
+                published.append(hashes[i])
+                continue
+            try:
+                if await edit_message(channel, old_ids[i], lane=LANE_BOARD, embed=embed):
+                    new_ids.append(old_ids[i])
+                    published.append(hashes[i])
+                    continue
+                # Page was deleted: re-post it and everything after it
+                reposting = True
+            except (discord.Forbidden, discord.HTTPException) as e:
+                log.warning("Failed to edit board page %d: %s", i + 1, e)
+                new_ids.append(old_ids[i])
+                published.append("")  # unknown content, retry next time
+                continue
+
+        try:
+            msg = await send_message(channel, lane=LANE_BOARD, embed=embed)
+        except (discord.Forbidden, discord.HTTPException) as e:
+            log.error("Failed to send board page %d: %s", i + 1, e)
+            complete = False
+            break
+        new_ids.append(str(msg.id))
+        published.append(hashes[i])
+
+    for stale_id in old_ids:
+        if stale_id in new_ids:
+            continue
+        try:
+            await delete_message(channel, stale_id, lane=LANE_BOARD)
+        except (discord.Forbidden, discord.HTTPException) as e:
+            log.warning("Failed to delete old board page %s: %s", stale_id, e)
+
+    if json.dumps(new_ids) != raw_ids:
+        await db.set_config("board_message_ids", json.dumps(new_ids))
+        await db.delete_config("board_message_id")
+    if json.dumps(published) != raw_hashes:
+        await db.set_config("board_content_hashes", json.dumps(published))
+        await db.delete_config("board_content_hash")
+    log.debug("Board rendered: %d pages (%d edits skipped so far)", len(pages), stats["edits_skipped"])
+    return complete and "" not in published
+
+
+class BoardRefreshScheduler:
+    """Coalesces board refresh requests into at most one render per window.
+
+    Callers only mark the board dirty. A single background task renders as
+    soon as the board is dirty, then sits out the rest of the window; any
+    requests arriving meanwhile collapse into one render at the end of it.
+    Renders come from the in-memory BoardModel, not the DB; /board reloads
+    the model from the DB before forcing a render.
+    """
+
+    def __init__(self, bot: commands.Bot, interval: float = BOARD_REFRESH_INTERVAL):
+        self.bot = bot
+        self.interval = interval
+        self.requests = 0
+        self.renders = 0
+        # The last render failed or was partial, so the board may be behind
+        self.stale = False
+        self._dirty = asyncio.Event()
+        self._render_lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="board-refresh")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def mark_dirty(self) -> None:
+        """Request a refresh. Returns immediately; the render happens later."""
+        self.requests += 1
+        self._dirty.set()
+
+    async def flush(self) -> None:
+        """Render right now, absorbing any refresh that was already pending."""
+        self._dirty.clear()
+        await self._render()
+
+    def retry_if_stale(self) -> None:
+        """Request a refresh only if the last render failed (e.g. while offline)."""
+        if self.stale:
+            self.mark_dirty()
+
+    async def _render(self) -> None:
+        async with self._render_lock:
+            try:
+                self.stale = not await refresh_board(self.bot)
+                self.renders += 1
+            except Exception as e:
+                self.stale = True
+                log.warning("Board refresh failed: %s", e)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            await self._dirty.wait()
+            self._dirty.clear()
+            started = loop.time()
+            await self._render()
+            await asyncio.sleep(max(0.0, self.interval - (loop.time() - started)))
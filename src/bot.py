@@ -2,6 +2,7 @@
 
 import os
 import logging
+import time
 
 import discord
 from discord import app_commands
@@ -11,8 +12,22 @@ from dotenv import load_dotenv
 # MUST load dotenv before importing src modules so they can read DB_PATH
 load_dotenv()
 
-from src.db import init_db, get_active_task_ids
-from src.views import TaskView
+from src import due_dates
+from src.board import BoardModel, BoardRefreshScheduler
+from src.command_sync import sync_commands
+from src.db import init_db, open_pool, close_pool, prime_user_cache
+from src.events import EventBus, EventCounter, TASK_COMPLETED, TASK_CREATED, TASK_SNOOZED
+from src.lifecycle import Lifecycle
+from src.messaging import outbound
+from src.notifications import MeatGrinderNotifier
+from src.outbox import OutboxWorker
+from src.views import TaskButton
+
+# Startup clock: the CPU time used so far is interpreter start-up plus the
+# imports above, which are almost entirely CPU-bound
+_import_seconds = time.process_time()
+lifecycle = Lifecycle(started=time.perf_counter() - _import_seconds)
+lifecycle.timings["imports"] = _import_seconds * 1000
 
 TOKEN = os.environ["DISCORD_TOKEN"]
 GUILD_ID = os.environ.get("GUILD_ID")
@@ -23,42 +38,60 @@ intents.members = True
 intents.guilds = True
 
 bot = commands.Bot(command_prefix="!", intents=intents)
+# Where slash commands are registered: the dev guild if set, else globally
+bot.command_scope = discord.Object(id=int(GUILD_ID)) if GUILD_ID else None
+# One-time warm-up on the first on_ready, cheap catch-up on reconnects
+bot.lifecycle = lifecycle
 
 log = logging.getLogger("bother-bot")
 
 
 @bot.event
 async def on_ready():
-    """Sync command tree, refresh board, and log startup."""
-    if GUILD_ID:
-        guild = discord.Object(id=int(GUILD_ID))
-        bot.tree.copy_global_to(guild=guild)
-        await bot.tree.sync(guild=guild)
-        log.info("Synced command tree to guild %s", GUILD_ID)
-    else:
-        await bot.tree.sync()
-        log.info("Synced command tree globally")
-
-    # Refresh the board on startup to ensure it's current after restart
-    try:
-        from src.cogs.accountability import refresh_board
-        await refresh_board(bot)
-        log.info("Board refreshed on startup")
-    except Exception as e:
-        log.warning("Failed to refresh board on startup: %s", e)
-
+    """Warm up on the first ready; afterwards only catch up on pending work."""
     log.info("Logged in as %s (ID: %s)", bot.user, bot.user.id)
+    await bot.lifecycle.on_ready()
 
 
 async def setup_hook():
-    """Register persistent views and load cogs."""
-    await init_db()
+    """Open the DB pool, register task buttons and load cogs."""
+    with bot.lifecycle.phase("db"):
+        await open_pool()
+        await init_db()
+
+    # Private channel lookups on every task command read from memory
+    with bot.lifecycle.phase("users"):
+        log.info("User cache primed with %d users", await prime_user_cache())
+
+    bot.board_scheduler = BoardRefreshScheduler(bot)
+    bot.board_model = BoardModel(on_change=bot.board_scheduler.mark_dirty)
+    await bot.board_model.load()
+    bot.board_scheduler.start()
+
+    # Channel sends/edits/deletes are prioritised and paced per channel
+    outbound.start()
+
+    # Task lifecycle events fan out to the board, notifications and metrics
+    bot.events = EventBus()
+    bot.event_metrics = EventCounter()
+    bot.events.subscribe("board", bot.board_model.handle_event)
+    bot.events.subscribe(
+        "meat-grinder",
+        MeatGrinderNotifier(bot).handle_event,
+        events=(TASK_COMPLETED, TASK_SNOOZED),
+    )
+    bot.events.subscribe("metrics", bot.event_metrics.handle_event)
+
+    # Posts task embeds recorded in the outbox, including any left over
+    # from before a restart; each new task kicks it
+    bot.outbox = OutboxWorker(bot)
+    bot.events.subscribe("outbox", bot.outbox.handle_event, events=(TASK_CREATED,))
+    bot.outbox.start()
+    bot.events.start()
 
-    # Re-register persistent TaskViews so buttons survive restarts
-    task_ids = await get_active_task_ids()
-    for tid in task_ids:
-        bot.add_view(TaskView(task_id=tid))
-    log.info("Re-registered %d persistent TaskViews", len(task_ids))
+    # One pattern-matched handler serves every task's Done/Snooze buttons
+    with bot.lifecycle.phase("views"):
+        bot.add_dynamic_items(TaskButton)
 
     cog_extensions = [
         "src.cogs.tasks",
@@ -67,17 +100,51 @@ async def setup_hook():
     ]
     for ext in cog_extensions:
         try:
-            await bot.load_extension(ext)
+            with bot.lifecycle.phase("cogs"):
+                await bot.load_extension(ext)
             log.info("Loaded extension: %s", ext)
         except commands.ExtensionNotFound:
             log.warning("Extension not found (skipped): %s", ext)
         except commands.ExtensionFailed as e:
             log.error("Extension failed to load: %s — %s", ext, e)
 
+    if bot.command_scope:
+        bot.tree.copy_global_to(guild=bot.command_scope)
+
+    # First ready: sync commands if they changed, render the whole board
+    # (reconciling its pages after a restart), deliver posts left in the
+    # outbox, then load dateparser in the background
+    bot.lifecycle.add_warm_up("sync", lambda: sync_commands(bot.tree, bot.command_scope))
+    bot.lifecycle.add_warm_up("board", bot.board_scheduler.flush)
+    bot.lifecycle.add_warm_up("outbox", bot.outbox.kick)
+    bot.lifecycle.add_warm_up("dateparser", due_dates.start_warm_up)
+    # Reconnects: nothing was lost but renders and posts that failed while
+    # we were offline, so retry just those
+    bot.lifecycle.add_reconnect("board", bot.board_scheduler.retry_if_stale)
+    bot.lifecycle.add_reconnect("outbox", bot.outbox.kick)
+
 
 bot.setup_hook = setup_hook
 
 
+async def close():
+    """Disconnect from Discord, then stop background work and close the DB pool."""
+    try:
+        await commands.Bot.close(bot)
+    finally:
+        if hasattr(bot, "events"):
+            await bot.events.stop()
+        if hasattr(bot, "outbox"):
+            await bot.outbox.stop()
+        if hasattr(bot, "board_scheduler"):
+            await bot.board_scheduler.stop()
+        await outbound.stop()
+        await close_pool()
+
+
+bot.close = close
+
+
 @bot.tree.error
 async def on_app_command_error(
     interaction: discord.Interaction,
@@ -1,4 +1,4 @@
-"""/opt-in, /board refresh, /prod, /config commands. Delegates to embeds.py and db.py."""
+"""/opt-in, /board refresh, /prod, /config, /sync-commands commands. Delegates to embeds.py and db.py."""
 
 import random
 import logging
@@ -7,68 +7,16 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 
-from src import db
+from src import db, events
+from src.board import clear_board_messages, get_board_message_ids
+from src.command_sync import sync_commands
 from src.constants import PROD_PENDING_MESSAGES, PROD_OVERDUE_MESSAGES
-from src.embeds import build_board_embed, build_welcome_embed, build_info_embed
+from src.embeds import build_welcome_embed, build_info_embed
+from src.messaging import LANE_BOARD, LANE_INTERACTIVE, delete_message, send_message
 
 log = logging.getLogger("bother-bot")
 
 
-async def refresh_board(bot: commands.Bot) -> None:
-    """Re-render the accountability board embed.
-
-    Fetches board_channel_id and board_message_id from config,
-    builds a fresh embed, and edits the existing message.
-    If the message was deleted, sends a new one and updates config.
-    Silently returns if the board is not yet set up.
-    """
-    channel_id = await db.get_config("board_channel_id")
-    if not channel_id:
-        return
-
-    channel = bot.get_channel(int(channel_id))
-    if not channel:
-        return
-
-    # Build users_data from flat DB rows
-    rows = await db.get_all_users_with_tasks()
-    users_map: dict[str, dict] = {}
-    guild = channel.guild
-
-    for row in rows:
-        uid = row["discord_id"]
-        if uid not in users_map:
-            member = guild.get_member(int(uid))
-            name = member.display_name if member else f"User {uid}"
-            users_map[uid] = {"name": name, "score": row["score"], "tasks": []}
-        if row["task_id"] is not None:
-            users_map[uid]["tasks"].append({
-                "description": row["description"],
-                "status": row["status"],
-            })
-
-    users_data = list(users_map.values())
-    embed = build_board_embed(users_data)
-
-    message_id = await db.get_config("board_message_id")
-    if message_id:
-        try:
-            msg = await channel.fetch_message(int(message_id))
-            await msg.edit(embed=embed)
-            return
-        except discord.NotFound:
-            pass  # Message was deleted, send a new one
-        except (discord.Forbidden, discord.HTTPException) as e:
-            log.warning("Failed to edit board message: %s", e)
-            return
-
-    try:
-        msg = await channel.send(embed=embed)
-        await db.set_config("board_message_id", str(msg.id))
-    except (discord.Forbidden, discord.HTTPException) as e:
-        log.error("Failed to send board embed: %s", e)
-
-
 class AccountabilityCog(commands.Cog):
     """Handles user registration, board management, and config."""
 
@@ -96,6 +44,7 @@ class AccountabilityCog(commands.Cog):
         # Register user if not in DB
         if not user:
             await db.add_user(uid)
+            await self.bot.events.publish(events.USER_OPTED_IN, discord_id=uid)
 
         # Create private channel with permission overrides
         guild = interaction.guild
@@ -126,7 +75,7 @@ class AccountabilityCog(commands.Cog):
         # Send welcome embed to the new channel
         embed = build_welcome_embed(channel.mention)
         try:
-            await channel.send(embed=embed)
+            await send_message(channel, lane=LANE_INTERACTIVE, embed=embed)
         except (discord.Forbidden, discord.HTTPException) as e:
             log.warning("Failed to send welcome embed to %s: %s", channel.id, e)
 
@@ -135,12 +84,6 @@ class AccountabilityCog(commands.Cog):
         )
         log.info("User %s opted in, channel %s created", uid, channel.id)
 
-        # Auto-refresh the board
-        try:
-            await refresh_board(self.bot)
-        except Exception as e:
-            log.warning("Failed to refresh board after user %s opt-in: %s", uid, e)
-
     @app_commands.command(
         name="board",
         description="Force refresh the accountability board (admin only)",
@@ -149,40 +92,21 @@ class AccountabilityCog(commands.Cog):
     async def board_refresh(self, interaction: discord.Interaction) -> None:
         # Store the channel where the board lives
         await db.set_config("board_channel_id", str(interaction.channel_id))
+        await interaction.response.defer(ephemeral=True)
 
-        # Build and send the board
-        rows = await db.get_all_users_with_tasks()
-        users_map: dict[str, dict] = {}
-        guild = interaction.guild
-
-        for row in rows:
-            uid = row["discord_id"]
-            if uid not in users_map:
-                member = guild.get_member(int(uid))
-                name = member.display_name if member else f"User {uid}"
-                users_map[uid] = {"name": name, "score": row["score"], "tasks": []}
-            if row["task_id"] is not None:
-                users_map[uid]["tasks"].append({
-                    "description": row["description"],
-                    "status": row["status"],
-                })
-
-        users_data = list(users_map.values())
-        embed = build_board_embed(users_data)
-
-        # Delete old board message if it exists in this channel
-        old_msg_id = await db.get_config("board_message_id")
-        if old_msg_id:
+        # Delete old board pages if they exist in this channel
+        for old_msg_id in await get_board_message_ids():
             try:
-                old_msg = await interaction.channel.fetch_message(int(old_msg_id))
-                await old_msg.delete()
-            except (discord.NotFound, discord.Forbidden, discord.HTTPException):
+                await delete_message(interaction.channel, old_msg_id, lane=LANE_BOARD)
+            except (discord.Forbidden, discord.HTTPException):
                 pass
+        await clear_board_messages()
 
-        await interaction.response.send_message(embed=embed)
-        # Fetch the response message to store its ID
-        msg = await interaction.original_response()
-        await db.set_config("board_message_id", str(msg.id))
+        # Resync the in-memory board, then force a render; with no pages
+        # on record it posts a fresh board here
+        await self.bot.board_model.load()
+        await self.bot.board_scheduler.flush()
+        await interaction.followup.send("Board refreshed.")
         log.info("Board refreshed in channel %s", interaction.channel_id)
 
     @app_commands.command(
@@ -271,10 +195,26 @@ class AccountabilityCog(commands.Cog):
     @app_commands.checks.has_permissions(administrator=True)
     async def post_info(self, interaction: discord.Interaction) -> None:
         embed = build_info_embed()
-        await interaction.channel.send(embed=embed)
+        await send_message(interaction.channel, lane=LANE_INTERACTIVE, embed=embed)
         await interaction.response.send_message("Info embed posted successfully!", ephemeral=True)
         log.info("Info embed posted in channel %s", interaction.channel_id)
 
+    @app_commands.command(
+        name="sync-commands",
+        description="Re-register slash commands with Discord even if unchanged (admin)",
+    )
+    @app_commands.checks.has_permissions(administrator=True)
+    async def force_sync(self, interaction: discord.Interaction) -> None:
+        await interaction.response.defer(ephemeral=True)
+        try:
+            await sync_commands(self.bot.tree, self.bot.command_scope, force=True)
+        except discord.HTTPException as e:
+            log.error("Forced command sync failed: %s", e)
+            await interaction.followup.send(f"Command sync failed: {e.status} {e.text}")
+            return
+        await interaction.followup.send("Slash commands synced.")
+        log.info("Command sync forced by %s", interaction.user.id)
+
 
 async def setup(bot: commands.Bot) -> None:
     await bot.add_cog(AccountabilityCog(bot))
@@ -1,16 +1,26 @@
-"""All discord.ext.tasks loops. Overdue checker (hourly), Wall of Shame (9PM), Daily Reset (midnight)."""
+"""All discord.ext.tasks loops. Overdue checker (deadline-driven, with a safety sweep), Wall of Shame (9PM), Daily Reset (midnight)."""
 
+import asyncio
 import datetime
 import logging
+import time
 from zoneinfo import ZoneInfo
 
 import discord
 from discord.ext import commands, tasks
 
-from src import db
+from src import db, events, recurrence
+from src.constants import OVERDUE_SAFETY_SWEEP_HOURS
+from src.dates import from_day_number, today_day_number
+from src.deadlines import DeadlineScheduler
 from src.embeds import build_task_embed, build_shame_embed
-from src.scoring import calculate_days_overdue, calculate_overdue_penalty
-from src.views import TaskView
+from src.messaging import (
+    LANE_BULK,
+    edit_task_message,
+    outbound,
+    send_message,
+    stats as message_stats,
+)
 
 log = logging.getLogger("bother-bot")
 
@@ -22,72 +32,105 @@ class LoopsCog(commands.Cog):
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        self.deadlines = DeadlineScheduler(self._on_deadline)
 
     async def cog_load(self) -> None:
+        self.bot.events.subscribe(
+            "deadlines",
+            self.deadlines.handle_event,
+            events=(events.TASK_CREATED, events.TASK_EDITED, events.TASK_SNOOZED),
+        )
+        self.deadlines.start()
         self.check_overdue.start()
         self.wall_of_shame.start()
         self.daily_reset.start()
 
     async def cog_unload(self) -> None:
+        await self.bot.events.unsubscribe("deadlines")
+        await self.deadlines.stop()
         self.check_overdue.cancel()
         self.wall_of_shame.cancel()
         self.daily_reset.cancel()
 
-    # ── Overdue Checker (hourly) ─────────────────────────────────
+    # ── Overdue Checker ──────────────────────────────────────────
 
-    @tasks.loop(hours=1)
+    async def _on_deadline(self, today: int) -> None:
+        """A pending task's due day just began."""
+        await self.bot.wait_until_ready()
+        await self.flag_overdue(today)
+
+    @tasks.loop(hours=OVERDUE_SAFETY_SWEEP_HOURS)
     async def check_overdue(self) -> None:
+        """Safety sweep behind the deadline scheduler: flag anything it missed."""
+        await self.flag_overdue(today_day_number())
+        await self.deadlines.rebuild()
+
+    async def flag_overdue(self, today: int) -> None:
         """Mark pending tasks past due as overdue, deduct points, update embeds."""
-        candidates = await db.get_overdue_candidates()
-        if not candidates:
+        # Atomic, so the scheduler and the sweep can't flag a task twice
+        overdue = await db.mark_overdue_tasks(today)
+        if not overdue:
             return
 
-        board_dirty = False
-        now = datetime.datetime.now(datetime.timezone.utc)
+        for task in overdue:
+            await self.bot.events.publish(
+                events.TASK_OVERDUE,
+                task_id=task["id"],
+                discord_id=task["discord_id"],
+                score_delta=task["penalty"],
+            )
+            log.info(
+                "Task %d marked overdue for user %s (%d pts)",
+                task["id"], task["discord_id"], task["penalty"],
+            )
 
-        for task in candidates:
-            task_id = task["id"]
-            uid = task["discord_id"]
+        await self._update_overdue_embeds(overdue)
+
+    async def _update_overdue_embeds(self, overdue: list[dict]) -> None:
+        """Queue edits for the embeds of newly overdue tasks.
+
+        All edits go to the outbound queue's bulk lane at once; the queue
+        paces them per channel and caps how many are in flight overall.
+        """
+        jobs = [t for t in overdue if t["message_id"] and t["private_channel_id"]]
+        if not jobs:
+            return
 
-            # Mark overdue
-            await db.update_task_status(task_id, "overdue")
-
-            # Calculate and apply penalty
-            due_dt = datetime.datetime.strptime(task["due_date"], "%Y-%m-%d")
-            days = calculate_days_overdue(due_dt, now)
-            if days > 0:
-                penalty = calculate_overdue_penalty(days)
-                await db.update_score(uid, penalty)
-
-            # Update the embed in the user's private channel
-            if task["message_id"]:
-                user = await db.get_user(uid)
-                if user and user["private_channel_id"]:
-                    channel = self.bot.get_channel(int(user["private_channel_id"]))
-                    if channel:
-                        try:
-                            msg = await channel.fetch_message(int(task["message_id"]))
-                            embed = build_task_embed(
-                                task["description"],
-                                "overdue",
-                                task["due_date"],
-                                task["recurrence"],
-                            )
-                            await msg.edit(embed=embed)
-                        except discord.NotFound:
-                            log.warning("Task %d message not found in channel", task_id)
-                        except (discord.Forbidden, discord.HTTPException) as e:
-                            log.warning("Failed to update task %d embed: %s", task_id, e)
-
-            board_dirty = True
-            log.info("Task %d marked overdue for user %s", task_id, uid)
-
-        if board_dirty:
+        started = time.monotonic()
+        failed = 0
+
+        async def update(task: dict) -> None:
+            nonlocal failed
+            task_id = task["id"]
+            channel = self.bot.get_channel(int(task["private_channel_id"]))
+            if not channel:
+                failed += 1
+                return
             try:
-                from src.cogs.accountability import refresh_board
-                await refresh_board(self.bot)
-            except Exception as e:
-                log.warning("Failed to refresh board after overdue check: %s", e)
+                embed = build_task_embed(
+                    task["description"],
+                    "overdue",
+                    task["due_date"],
+                    task["recurrence"],
+                )
+                if not await edit_task_message(
+                    channel, task_id, task["message_id"], lane=LANE_BULK, embed=embed
+                ):
+                    failed += 1
+            except (discord.Forbidden, discord.HTTPException) as e:
+                failed += 1
+                log.warning("Failed to update task %d embed: %s", task_id, e)
+
+        await asyncio.gather(*(update(t) for t in jobs))
+
+        elapsed = time.monotonic() - started
+        log.info(
+            "Overdue sweep updated %d/%d embeds (%d failed) in %.1fs (%.1f/s); "
+            "%d message fetches saved since startup; outbound queue depth %s",
+            len(jobs) - failed, len(jobs), failed, elapsed,
+            len(jobs) / elapsed if elapsed else 0.0,
+            message_stats["fetches_saved"], outbound.depth(),
+        )
 
     @check_overdue.before_loop
     async def before_check_overdue(self) -> None:
@@ -125,7 +168,9 @@ class LoopsCog(commands.Cog):
 
             embed = build_shame_embed(name, task_descs)
             try:
-                await channel.send(
+                await send_message(
+                    channel,
+                    lane=LANE_BULK,
                     content=f"<@{uid}>",
                     embed=embed,
                 )
@@ -141,63 +186,42 @@ class LoopsCog(commands.Cog):
 
     @tasks.loop(time=datetime.time(hour=0, minute=0, tzinfo=TZ))
     async def daily_reset(self) -> None:
-        """Regenerate completed recurring tasks for the next cycle."""
-        completed = await db.get_completed_recurring_tasks()
-        if not completed:
+        """Create the next instance of every recurring series due by today.
+
+        The Done button normally does this straight away; this catches any
+        series it missed. Series that already have their next instance are
+        skipped, so running it again is harmless.
+        """
+        today = today_day_number()
+        due = await db.get_series_due_for_next_instance(today)
+        if not due:
             return
 
-        for task in completed:
-            uid = task["discord_id"]
-            recurrence = task["recurrence"]
-
-            # Calculate next due date
-            if task["due_date"]:
-                try:
-                    base = datetime.datetime.strptime(task["due_date"], "%Y-%m-%d")
-                except ValueError:
-                    base = datetime.datetime.now(datetime.timezone.utc)
-            else:
-                base = datetime.datetime.now(datetime.timezone.utc)
-
-            if recurrence == "daily":
-                next_due = base + datetime.timedelta(days=1)
-            elif recurrence == "weekly":
-                next_due = base + datetime.timedelta(weeks=1)
-            else:
-                continue
-
-            next_due_str = next_due.strftime("%Y-%m-%d")
-
-            # Create new task
-            new_id = await db.add_task(uid, task["description"], next_due_str, recurrence)
-
-            # Send to user's private channel
-            user = await db.get_user(uid)
-            if user and user["private_channel_id"]:
-                channel = self.bot.get_channel(int(user["private_channel_id"]))
-                if channel:
-                    try:
-                        embed = build_task_embed(
-                            task["description"], "pending", next_due_str, recurrence
-                        )
-                        view = TaskView(task_id=new_id)
-                        msg = await channel.send(embed=embed, view=view)
-                        await db.update_task_message_id(new_id, str(msg.id))
-                        self.bot.add_view(view)
-                    except (discord.Forbidden, discord.HTTPException) as e:
-                        log.warning("Failed to send recurring task %d: %s", new_id, e)
-
+        next_days = recurrence.next_occurrences(
+            [task["recurrence"] for task in due],
+            [task["due_day"] if task["due_day"] is not None else today for task in due],
+        )
+        next_due_dates = {
+            task["id"]: from_day_number(day)
+            for task, day in zip(due, next_days)
+            if day is not None
+        }
+
+        # One transaction; the outbox worker posts each to its owner's channel
+        created = await db.create_next_instances(next_due_dates, post_lane=LANE_BULK)
+        for new in created:
+            await self.bot.events.publish(
+                events.TASK_CREATED,
+                task_id=new["id"],
+                discord_id=new["discord_id"],
+                description=new["description"],
+                due_date=new["due_date"],
+            )
             log.info(
                 "Recurring task regenerated: %d -> %d (%s, due %s)",
-                task["id"], new_id, recurrence, next_due_str,
+                new["previous_id"], new["id"], new["recurrence"], new["due_date"],
             )
 
-        try:
-            from src.cogs.accountability import refresh_board
-            await refresh_board(self.bot)
-        except Exception as e:
-            log.warning("Failed to refresh board after daily reset: %s", e)
-
     @daily_reset.before_loop
     async def before_daily_reset(self) -> None:
         await self.bot.wait_until_ready()
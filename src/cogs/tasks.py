@@ -2,18 +2,25 @@
 
 import datetime
 import logging
-import dateparser
 
 import discord
 from discord import app_commands
 from discord.ext import commands
 
-from src import db
+from src import db, events, recurrence as recurrence_rules
+from src.constants import RECURRENCE_PRESETS
+from src.dates import to_day_number
+from src.due_dates import parse_due_date
 from src.embeds import build_task_embed
-from src.views import TaskView
+from src.messaging import LANE_INTERACTIVE, delete_message, edit_task_message
 
 log = logging.getLogger("bother-bot")
 
+RECURRENCE_HELP = (
+    "I don't understand that recurrence. Try `daily`, `every 3 days`, "
+    "`mon, wed, fri`, `every 2 weeks` or `monthly on 15`."
+)
+
 
 class TasksCog(commands.Cog):
     """Handles task creation and button interactions."""
@@ -27,22 +34,16 @@ class TasksCog(commands.Cog):
     @app_commands.describe(
         description="What do you need to do?",
         due_date="Due date (YYYY-MM-DD). Defaults to tomorrow.",
-        recurrence="How often does this repeat?",
+        recurrence="How often does this repeat? e.g. daily, every 3 days, mon wed fri, monthly on 15",
     )
-    @app_commands.choices(recurrence=[
-        app_commands.Choice(name="None", value="none"),
-        app_commands.Choice(name="Daily", value="daily"),
-        app_commands.Choice(name="Weekly", value="weekly"),
-    ])
     async def task_add(
         self,
         interaction: discord.Interaction,
         description: str,
         due_date: str | None = None,
-        recurrence: app_commands.Choice[str] | None = None,
+        recurrence: str | None = None,
     ) -> None:
         uid = str(interaction.user.id)
-        recurrence_val = recurrence.value if recurrence else "none"
 
         # Check registration
         user = await db.get_user(uid)
@@ -57,71 +58,49 @@ class TasksCog(commands.Cog):
         # Parse or default due_date
         now = datetime.datetime.now(datetime.timezone.utc)
         if due_date:
-            parsed_date = dateparser.parse(due_date, settings={'TIMEZONE': 'UTC', 'RETURN_AS_TIMEZONE_AWARE': True})
-            if parsed_date:
-                due_date_str = parsed_date.strftime("%Y-%m-%d")
-            else:
-                due_date_str = due_date
+            due_date_str = await parse_due_date(due_date) or due_date
         else:
             tomorrow = now + datetime.timedelta(days=1)
             due_date_str = tomorrow.strftime("%Y-%m-%d")
 
-        # Create task in DB
-        task_id = await db.add_task(uid, description, due_date_str, recurrence_val)
-
-        # Build embed and view
-        embed = build_task_embed(description, "pending", due_date_str, recurrence_val)
-        view = TaskView(task_id=task_id)
-
-        # Send to user's private channel
-        channel = self.bot.get_channel(int(user["private_channel_id"]))
-        if not channel:
-            await interaction.followup.send(
-                "Couldn't find your task channel. Contact an admin."
-            )
-            return
-
         try:
-            msg = await channel.send(embed=embed, view=view)
-            await db.update_task_message_id(task_id, str(msg.id))
-        except (discord.Forbidden, discord.HTTPException) as e:
-            log.error("Failed to send task %d to channel: %s", task_id, e)
-            await interaction.followup.send(
-                "Task saved but couldn't send to your channel. Contact an admin."
-            )
+            recurrence_val = recurrence_rules.normalize(recurrence, to_day_number(due_date_str))
+        except ValueError:
+            await interaction.followup.send(RECURRENCE_HELP)
             return
 
+        # Create task in DB along with its outbox entry; the outbox worker
+        # posts it to the user's private channel, retrying if Discord fails
+        task_id = await db.add_task(
+            uid, description, due_date_str, recurrence_val, post_lane=LANE_INTERACTIVE
+        )
+        await self.bot.events.publish(
+            events.TASK_CREATED,
+            task_id=task_id,
+            discord_id=uid,
+            description=description,
+            due_date=due_date_str,
+        )
+
         await interaction.followup.send(
-            f"Task added! Check {channel.mention}"
+            f"Task added! Check <#{user['private_channel_id']}>"
         )
         log.info("Task %d created for user %s: %s", task_id, uid, description)
 
-        # Auto-refresh the board
-        try:
-            from src.cogs.accountability import refresh_board
-            await refresh_board(self.bot)
-        except Exception as e:
-            log.warning("Failed to refresh board after task %d add: %s", task_id, e)
-
     @task_group.command(name="edit", description="Edit an existing task")
     @app_commands.describe(
         task="The task you want to edit",
         new_description="The new description (optional)",
         new_due_date="The new due date (e.g., 'tomorrow', 'next friday') (optional)",
-        new_recurrence="The new recurrence (optional)"
+        new_recurrence="The new recurrence, e.g. daily, every 3 days, mon wed fri (optional)"
     )
-    @app_commands.choices(new_recurrence=[
-        app_commands.Choice(name="None", value="none"),
-        app_commands.Choice(name="Daily", value="daily"),
-        app_commands.Choice(name="Weekly", value="weekly"),
-    ])
     async def task_edit(
         self,
         interaction: discord.Interaction,
         task: str,
         new_description: str | None = None,
         new_due_date: str | None = None,
-        new_recurrence: app_commands.Choice[str] | None = None,
+        new_recurrence: str | None = None,
     ) -> None:
         await interaction.response.defer(ephemeral=True)
         uid = str(interaction.user.id)
@@ -140,17 +119,27 @@ class TasksCog(commands.Cog):
 
         task_id = target["id"]
         description = new_description if new_description is not None else target["description"]
-        recurrence_val = new_recurrence.value if new_recurrence is not None else target["recurrence"]
 
         due_date_str = target["due_date"]
         if new_due_date:
-            parsed_date = dateparser.parse(new_due_date, settings={'TIMEZONE': 'UTC', 'RETURN_AS_TIMEZONE_AWARE': True})
-            if parsed_date:
-                due_date_str = parsed_date.strftime("%Y-%m-%d")
-            else:
-                due_date_str = new_due_date
+            due_date_str = await parse_due_date(new_due_date) or new_due_date
+
+        recurrence_val = target["recurrence"]
+        if new_recurrence is not None:
+            try:
+                recurrence_val = recurrence_rules.normalize(new_recurrence, to_day_number(due_date_str))
+            except ValueError:
+                await interaction.followup.send(RECURRENCE_HELP)
+                return
 
         await db.update_task_details(task_id, description, due_date_str, recurrence_val)
+        await self.bot.events.publish(
+            events.TASK_EDITED,
+            task_id=task_id,
+            discord_id=uid,
+            description=description,
+            due_date=due_date_str,
+        )
 
         # Edit the message if possible
         if target["message_id"]:
@@ -159,25 +148,21 @@ class TasksCog(commands.Cog):
                 channel = self.bot.get_channel(int(user_data["private_channel_id"]))
                 if channel:
                     try:
-                        msg = await channel.fetch_message(int(target["message_id"]))
                         embed = build_task_embed(
                             description,
                             target["status"],
                             due_date_str,
                             recurrence_val
                         )
-                        await msg.edit(embed=embed)
-                    except (discord.NotFound, discord.Forbidden, discord.HTTPException) as e:
+                        await edit_task_message(
+                            channel, task_id, target["message_id"],
+                            lane=LANE_INTERACTIVE, embed=embed,
+                        )
+                    except (discord.Forbidden, discord.HTTPException) as e:
                         log.warning("Failed to edit task message for task %d: %s", task_id, e)
 
         await interaction.followup.send("Task updated!")
 
-        try:
-            from src.cogs.accountability import refresh_board
-            await refresh_board(self.bot)
-        except Exception as e:
-            log.warning("Failed to refresh board after task edit: %s", e)
-
     @task_group.command(name="remove", description="Remove a task")
     @app_commands.describe(task="The task you want to remove")
     async def task_remove(
@@ -208,23 +193,17 @@ class TasksCog(commands.Cog):
                 channel = self.bot.get_channel(int(user_data["private_channel_id"]))
                 if channel:
                     try:
-                        msg = await channel.fetch_message(int(target["message_id"]))
-                        await msg.delete()
-                    except (discord.NotFound, discord.Forbidden, discord.HTTPException):
+                        await delete_message(channel, target["message_id"], lane=LANE_INTERACTIVE)
+                    except (discord.Forbidden, discord.HTTPException):
                         pass
 
         await db.delete_task(task_id)
+        await self.bot.events.publish(events.TASK_DELETED, task_id=task_id, discord_id=uid)
         await interaction.followup.send(
             f"Task removed: **{target['description']}**"
         )
         log.info("Task %d removed by user %s", task_id, uid)
 
-        try:
-            from src.cogs.accountability import refresh_board
-            await refresh_board(self.bot)
-        except Exception as e:
-            log.warning("Failed to refresh board after task %d removal: %s", task_id, e)
-
     @task_remove.autocomplete("task")
     async def task_remove_autocomplete(
         self,
@@ -275,6 +254,28 @@ class TasksCog(commands.Cog):
             log.error("task_edit autocomplete failed for user %s: %s", interaction.user.id, e)
             return []
 
+    @task_add.autocomplete("recurrence")
+    @task_edit.autocomplete("new_recurrence")
+    async def recurrence_autocomplete(
+        self,
+        interaction: discord.Interaction,
+        current: str,
+    ) -> list[app_commands.Choice[str]]:
+        choices = []
+        # Echo a valid custom rule back in words so the user can confirm it
+        try:
+            typed = recurrence_rules.normalize(current) if current.strip() else None
+        except ValueError:
+            typed = None
+        if typed and typed not in (value for _, value in RECURRENCE_PRESETS):
+            choices.append(app_commands.Choice(
+                name=recurrence_rules.describe(typed)[:100], value=typed
+            ))
+        for name, value in RECURRENCE_PRESETS:
+            if current.lower() in name.lower() or value == typed:
+                choices.append(app_commands.Choice(name=name, value=value))
+        return choices[:25]
+
 
 async def setup(bot: commands.Bot) -> None:
     await bot.add_cog(TasksCog(bot))
@@ -0,0 +1,58 @@
+"""Application command sync, skipped when the command tree hasn't changed.
+
+tree.sync() is a rate-limited bulk overwrite, and on_ready fires again on
+every reconnect. The payload sync() would send is hashed and stored in the
+config table per scope ("command_tree_hash:<guild id>" or ":global"); a
+sync only goes out when that hash changes, or when an admin forces one.
+"""
+
+import hashlib
+import json
+import logging
+
+import discord
+from discord import app_commands
+
+from src import db
+
+log = logging.getLogger("bother-bot")
+
+# Running totals since startup
+stats = {"synced": 0, "skipped": 0}
+
+
+def _config_key(guild: discord.abc.Snowflake | None) -> str:
+    return f"command_tree_hash:{guild.id if guild else 'global'}"
+
+
+def tree_fingerprint(
+    tree: app_commands.CommandTree, guild: discord.abc.Snowflake | None = None
+) -> str:
+    """SHA-256 of the command payloads tree.sync(guild=guild) would upload."""
+    payload = sorted(
+        (command.to_dict(tree) for command in tree.get_commands(guild=guild)),
+        key=lambda c: (c.get("type", 1), c["name"]),
+    )
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+async def sync_commands(
+    tree: app_commands.CommandTree,
+    guild: discord.abc.Snowflake | None = None,
+    *,
+    force: bool = False,
+) -> bool:
+    """Sync the tree for one scope if its fingerprint changed; True if synced."""
+    key = _config_key(guild)
+    fingerprint = tree_fingerprint(tree, guild)
+    if not force and await db.get_config(key) == fingerprint:
+        stats["skipped"] += 1
+        log.info("Command tree unchanged (%s), sync skipped", key.split(":", 1)[1])
+        return False
+
+    await tree.sync(guild=guild)
+    await db.set_config(key, fingerprint)
+    stats["synced"] += 1
+    log.info("Synced command tree (%s)%s", key.split(":", 1)[1], " (forced)" if force else "")
+    return True
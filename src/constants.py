@@ -15,6 +15,61 @@ SCORE_SNOOZE = -2
 
 # ── Database Path ─────────────────────────────────────────────
 DB_PATH = os.environ.get("DB_PATH", "/app/data/database.db")
+DB_READER_POOL_SIZE = int(os.environ.get("DB_READER_POOL_SIZE", "4"))
+DB_STATEMENT_CACHE_SIZE = 256
+
+# ── Discord Throughput ────────────────────────────────────────
+# Pending tasks are flagged the moment their due day starts; this sweep is
+# only the safety net behind the deadline scheduler
+OVERDUE_SAFETY_SWEEP_HOURS = float(os.environ.get("OVERDUE_SAFETY_SWEEP_HOURS", "6"))
+# Longest the deadline scheduler sleeps before re-checking the clock
+DEADLINE_MAX_SLEEP = 3600.0
+# Minimum seconds between two accountability board edits
+BOARD_REFRESH_INTERVAL = float(os.environ.get("BOARD_REFRESH_INTERVAL", "5"))
+
+# Per-subscriber event queue size; publishers wait when a queue is full
+EVENT_QUEUE_SIZE = 1000
+
+# Outbound Discord queue: requests in flight at once, and a per-channel
+# token bucket matching Discord's 5 messages per 5 seconds per channel
+OUTBOUND_CONCURRENCY = int(os.environ.get("OUTBOUND_CONCURRENCY", "8"))
+OUTBOUND_CHANNEL_BURST = 5
+OUTBOUND_CHANNEL_PERIOD = 5.0
+
+# Outbox retries: exponential backoff from BASE seconds, capped at MAX,
+# given up after MAX_ATTEMPTS
+OUTBOX_RETRY_BASE = 5.0
+OUTBOX_RETRY_MAX = 3600.0
+OUTBOX_MAX_ATTEMPTS = 12
+OUTBOX_BATCH_SIZE = 50
+
+# ── Due Date Parsing ──────────────────────────────────────────
+# Parsed due dates remembered per (input, UTC day)
+DUE_DATE_CACHE_SIZE = 512
+# Import dateparser in the background once connected, rather than on the
+# first unusual due date someone types. Set to 0 to load it only on demand.
+WARM_UP_DATEPARSER = os.environ.get("WARM_UP_DATEPARSER", "1") != "0"
+
+# ── Recurrence Presets ────────────────────────────────────────
+# Offered by /task autocomplete; users may also type their own rule
+RECURRENCE_PRESETS = [
+    ("None", "none"),
+    ("Daily", "daily"),
+    ("Weekly", "weekly"),
+    ("Weekdays (Mon-Fri)", "FREQ=WEEKLY;BYDAY=MO,TU,WE,TH,FR"),
+    ("Every 2 days", "FREQ=DAILY;INTERVAL=2"),
+    ("Every 2 weeks", "FREQ=WEEKLY;INTERVAL=2"),
+    ("Monthly (same day)", "monthly"),
+]
+
+# ── Board Limits ──────────────────────────────────────────────
+# Completed tasks shown per user, most recent first
+BOARD_RECENT_COMPLETED = int(os.environ.get("BOARD_RECENT_COMPLETED", "3"))
+BOARD_LINE_LIMIT = 200
+# Discord's hard limits for a single embed
+EMBED_FIELD_VALUE_LIMIT = 1024
+EMBED_TOTAL_LIMIT = 6000
+EMBED_MAX_FIELDS = 25
 
 # ── Status Emojis ─────────────────────────────────────────────
 STATUS_EMOJI = {
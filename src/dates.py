@@ -0,0 +1,52 @@
+"""Pure due-date helpers. No DB calls, no Discord API, no side effects.
+
+Due dates are calendar days in UTC. Besides the "YYYY-MM-DD" display string,
+each task stores its due date as a day number (days since 1970-01-01) so
+range filters on it can seek an index.
+"""
+
+import datetime
+
+DATE_FORMAT = "%Y-%m-%d"
+EPOCH = datetime.date(1970, 1, 1)
+
+# Weekday names and abbreviations users type, Monday = 0
+WEEKDAY_WORDS = {
+    "monday": 0, "mon": 0,
+    "tuesday": 1, "tue": 1, "tues": 1,
+    "wednesday": 2, "wed": 2, "weds": 2,
+    "thursday": 3, "thu": 3, "thur": 3, "thurs": 3,
+    "friday": 4, "fri": 4,
+    "saturday": 5, "sat": 5,
+    "sunday": 6, "sun": 6,
+}
+
+
+def to_day_number(due_date: str | None) -> int | None:
+    """Return the day number for a "YYYY-MM-DD" string, or None if unparseable."""
+    if not due_date:
+        return None
+    try:
+        parsed = datetime.datetime.strptime(due_date[:10], DATE_FORMAT).date()
+    except ValueError:
+        return None
+    return (parsed - EPOCH).days
+
+
+def from_day_number(day: int) -> str:
+    """Return the "YYYY-MM-DD" string for a day number."""
+    return (EPOCH + datetime.timedelta(days=day)).strftime(DATE_FORMAT)
+
+
+def weekday(day: int) -> int:
+    """Return the weekday of a day number, Monday = 0."""
+    return (day + 3) % 7  # 1970-01-01 was a Thursday
+
+
+def today_day_number(now: datetime.datetime | None = None) -> int:
+    """Return today's day number in UTC."""
+    if now is None:
+        now = datetime.datetime.now(datetime.timezone.utc)
+    elif now.tzinfo is not None:
+        now = now.astimezone(datetime.timezone.utc)
+    return (now.date() - EPOCH).days
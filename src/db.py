@@ -1,80 +1,345 @@
 """Database operations. ALL SQL lives here and nowhere else."""
 
+import asyncio
+import contextlib
+import json
+import time
+from typing import AsyncIterator
+
 import aiosqlite
-from src.constants import DB_PATH
+from src.constants import (
+    BOARD_RECENT_COMPLETED,
+    DB_PATH,
+    DB_READER_POOL_SIZE,
+    DB_STATEMENT_CACHE_SIZE,
+)
+from src.dates import to_day_number, today_day_number
+from src.scoring import calculate_overdue_penalty
 
 
 async def get_connection() -> aiosqlite.Connection:
     """Open a connection with WAL mode and foreign keys enabled."""
-    db = await aiosqlite.connect(DB_PATH)
+    db = await aiosqlite.connect(DB_PATH, cached_statements=DB_STATEMENT_CACHE_SIZE)
     db.row_factory = aiosqlite.Row
     await db.execute("PRAGMA journal_mode=WAL")
     await db.execute("PRAGMA foreign_keys = ON")
+    await db.execute("PRAGMA busy_timeout = 5000")
     return db
 
 
+class ConnectionPool:
+    """One writer connection plus N reader connections, opened once and shared.
+
+    SQLite allows a single writer at a time, so every write goes through the
+    writer connection under a lock; WAL mode lets the readers run alongside it.
+    Pragmas are applied once per connection, and each connection keeps its own
+    prepared-statement cache for the lifetime of the pool.
+    """
+
+    def __init__(self, readers: int):
+        self.reader_count = max(1, readers)
+        self._writer: aiosqlite.Connection | None = None
+        self._write_lock = asyncio.Lock()
+        self._readers: asyncio.Queue[aiosqlite.Connection] = asyncio.Queue()
+        self._reader_conns: list[aiosqlite.Connection] = []
+
+    async def open(self) -> None:
+        self._writer = await get_connection()
+        for _ in range(self.reader_count):
+            conn = await get_connection()
+            await conn.execute("PRAGMA query_only = ON")
+            self._reader_conns.append(conn)
+            self._readers.put_nowait(conn)
+
+    async def close(self) -> None:
+        async with self._write_lock:
+            for conn in self._reader_conns:
+                await conn.close()
+            self._reader_conns.clear()
+            if self._writer is not None:
+                await self._writer.close()
+                self._writer = None
+
+    @contextlib.asynccontextmanager
+    async def reader(self) -> AsyncIterator[aiosqlite.Connection]:
+        conn = await self._readers.get()
+        try:
+            yield conn
+        finally:
+            self._readers.put_nowait(conn)
+
+    @contextlib.asynccontextmanager
+    async def writer(self) -> AsyncIterator[aiosqlite.Connection]:
+        async with self._write_lock:
+            try:
+                yield self._writer
+            except BaseException:
+                await self._writer.rollback()
+                raise
+
+
+_pool: ConnectionPool | None = None
+
+
+async def open_pool(readers: int = DB_READER_POOL_SIZE) -> None:
+    """Open the shared connection pool. Called once from setup_hook()."""
+    global _pool
+    if _pool is not None:
+        return
+    pool = ConnectionPool(readers)
+    await pool.open()
+    _pool = pool
+    _clear_user_cache()
+
+
+async def close_pool() -> None:
+    """Close the shared connection pool. Called once on shutdown."""
+    global _pool
+    if _pool is None:
+        return
+    pool, _pool = _pool, None
+    await pool.close()
+    _clear_user_cache()
+
+
+@contextlib.asynccontextmanager
+async def _one_shot() -> AsyncIterator[aiosqlite.Connection]:
+    """Fallback for scripts that never open the pool: a per-call connection."""
+    db = await get_connection()
+    try:
+        yield db
+    finally:
+        await db.close()
+
+
+def _reader() -> contextlib.AbstractAsyncContextManager[aiosqlite.Connection]:
+    return _pool.reader() if _pool is not None else _one_shot()
+
+
+def _writer() -> contextlib.AbstractAsyncContextManager[aiosqlite.Connection]:
+    return _pool.writer() if _pool is not None else _one_shot()
+
+
+# ── Schema Migrations ────────────────────────────────────────
+# Ordered (version, description, statements). Append new steps to the end;
+# never edit a migration that has already shipped. Migration 1 is the
+# original schema, written idempotently so pre-migration deployments adopt it.
+
+MIGRATIONS: list[tuple[int, str, tuple[str, ...]]] = [
+    (1, "baseline tables", (
+        """
+        CREATE TABLE IF NOT EXISTS users (
+            discord_id TEXT PRIMARY KEY,
+            score INTEGER DEFAULT 0,
+            private_channel_id TEXT
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS tasks (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            discord_id TEXT REFERENCES users(discord_id),
+            description TEXT NOT NULL,
+            status TEXT DEFAULT 'pending',
+            message_id TEXT,
+            due_date DATETIME,
+            recurrence TEXT DEFAULT 'none',
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS config (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL
+        )
+        """,
+    )),
+    (2, "index tasks by owner and status", (
+        "CREATE INDEX IF NOT EXISTS idx_tasks_user_status ON tasks(discord_id, status)",
+    )),
+    (3, "index tasks by status and due date", (
+        "CREATE INDEX IF NOT EXISTS idx_tasks_status_due ON tasks(status, due_date)",
+    )),
+    (4, "index tasks by status and recurrence", (
+        "CREATE INDEX IF NOT EXISTS idx_tasks_status_recurrence ON tasks(status, recurrence)",
+    )),
+    (5, "store due dates as UTC day numbers", (
+        "ALTER TABLE tasks ADD COLUMN due_day INTEGER",
+        # julianday() of 1970-01-01 is 2440587.5; only well-formed dates convert
+        """
+        UPDATE tasks
+        SET due_day = CAST(julianday(substr(due_date, 1, 10)) - 2440587.5 AS INTEGER)
+        WHERE due_date GLOB '[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]*'
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_tasks_status_due_day ON tasks(status, due_day)",
+        "DROP INDEX IF EXISTS idx_tasks_status_due",
+    )),
+    (6, "outbox for Discord side effects", (
+        """
+        CREATE TABLE IF NOT EXISTS outbox (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            task_id INTEGER NOT NULL REFERENCES tasks(id) ON DELETE CASCADE,
+            kind TEXT NOT NULL DEFAULT 'post_task',
+            lane INTEGER NOT NULL DEFAULT 2,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            next_attempt_at REAL NOT NULL,
+            last_error TEXT,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_outbox_next_attempt ON outbox(next_attempt_at)",
+        "CREATE INDEX IF NOT EXISTS idx_outbox_task ON outbox(task_id)",
+    )),
+    (7, "link recurring task instances into series", (
+        # series_id is the first instance's ID (NULL on the first instance
+        # itself); successor_id marks that the next instance exists
+        "ALTER TABLE tasks ADD COLUMN series_id INTEGER",
+        "ALTER TABLE tasks ADD COLUMN successor_id INTEGER",
+        # Legacy copies of a recurring task share owner, description and
+        # recurrence; the oldest one roots the series
+        """
+        UPDATE tasks SET series_id = (
+            SELECT MIN(s.id) FROM tasks s
+            WHERE s.discord_id = tasks.discord_id
+              AND s.description = tasks.description
+              AND s.recurrence = tasks.recurrence
+        )
+        WHERE recurrence != 'none'
+        """,
+        "UPDATE tasks SET series_id = NULL WHERE series_id = id",
+        """
+        UPDATE tasks SET successor_id = (
+            SELECT MIN(n.id) FROM tasks n
+            WHERE n.discord_id = tasks.discord_id
+              AND n.description = tasks.description
+              AND n.recurrence = tasks.recurrence
+              AND n.id > tasks.id
+        )
+        WHERE status = 'completed' AND recurrence != 'none'
+        """,
+        # Only completed instances still waiting for a successor are indexed,
+        # so the nightly scan never touches history
+        "CREATE INDEX IF NOT EXISTS idx_tasks_series_open ON tasks(due_day) "
+        "WHERE status = 'completed' AND recurrence != 'none' AND successor_id IS NULL",
+    )),
+]
+
+
 async def init_db() -> None:
-    """Create tables if they don't exist."""
-    async with aiosqlite.connect(DB_PATH) as db:
-        await db.execute("PRAGMA journal_mode=WAL")
-        await db.execute("PRAGMA foreign_keys = ON")
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS users (
-                discord_id TEXT PRIMARY KEY,
-                score INTEGER DEFAULT 0,
-                private_channel_id TEXT
-            )
-        """)
+    """Bring the schema up to date by applying any pending migrations."""
+    async with _writer() as db:
         await db.execute("""
-            CREATE TABLE IF NOT EXISTS tasks (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                discord_id TEXT REFERENCES users(discord_id),
+            CREATE TABLE IF NOT EXISTS schema_version (
+                version INTEGER PRIMARY KEY,
                 description TEXT NOT NULL,
-                status TEXT DEFAULT 'pending',
-                message_id TEXT,
-                due_date DATETIME,
-                recurrence TEXT DEFAULT 'none',
-                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS config (
-                key TEXT PRIMARY KEY,
-                value TEXT NOT NULL
+                applied_at DATETIME DEFAULT CURRENT_TIMESTAMP
             )
         """)
         await db.commit()
+        cursor = await db.execute("SELECT COALESCE(MAX(version), 0) FROM schema_version")
+        current = (await cursor.fetchone())[0]
+
+        for version, description, statements in MIGRATIONS:
+            if version <= current:
+                continue
+            # Each migration and its version row commit together or not at all
+            await db.execute("BEGIN")
+            for statement in statements:
+                await db.execute(statement)
+            await db.execute(
+                "INSERT INTO schema_version (version, description) VALUES (?, ?)",
+                (version, description),
+            )
+            await db.commit()
+
+
+async def get_schema_version() -> int:
+    """Return the highest applied migration version (0 for a fresh DB)."""
+    async with _reader() as db:
+        cursor = await db.execute(
+            "SELECT COALESCE(MAX(version), 0) FROM schema_version"
+        )
+        return (await cursor.fetchone())[0]
+
+
+# ── User Cache ───────────────────────────────────────────────
+# User rows (score, private_channel_id) are read on every task command but
+# change rarely, so get_user() reads through an in-memory cache while the
+# pool is open. Every write below that touches a users row drops that
+# user's entry after committing. The generation counter stops a read that
+# raced such a write from caching the row it saw before the write.
+
+_users: dict[str, dict | None] = {}
+_users_generation = 0
+user_cache_stats = {"hits": 0, "misses": 0}
+
+
+def _invalidate_users(*discord_ids: str) -> None:
+    """Forget the given users' cached rows."""
+    global _users_generation
+    _users_generation += 1
+    for discord_id in discord_ids:
+        _users.pop(discord_id, None)
+
+
+def _clear_user_cache() -> None:
+    global _users_generation
+    _users_generation += 1
+    _users.clear()
+
+
+async def prime_user_cache() -> int:
+    """Load every user into the cache. Called once from setup_hook()."""
+    if _pool is None:
+        return 0
+    generation = _users_generation
+    async with _reader() as db:
+        cursor = await db.execute("SELECT * FROM users")
+        rows = await cursor.fetchall()
+    if generation == _users_generation:
+        for row in rows:
+            _users[row["discord_id"]] = dict(row)
+    return len(rows)
 
 
 async def add_user(discord_id: str) -> None:
     """Insert a new user. Ignores if already exists."""
-    async with aiosqlite.connect(DB_PATH) as db:
+    async with _writer() as db:
         await db.execute(
             "INSERT OR IGNORE INTO users (discord_id) VALUES (?)",
             (discord_id,),
         )
         await db.commit()
+    _invalidate_users(discord_id)
 
 
-async def get_user(discord_id: str):
-    """Return a user row or None."""
-    async with aiosqlite.connect(DB_PATH) as db:
-        db.row_factory = aiosqlite.Row
+async def get_user(discord_id: str) -> dict | None:
+    """Return a user as a dict of columns, or None."""
+    if discord_id in _users:
+        user_cache_stats["hits"] += 1
+        return _users[discord_id]
+    user_cache_stats["misses"] += 1
+    generation = _users_generation
+    async with _reader() as db:
         cursor = await db.execute(
             "SELECT * FROM users WHERE discord_id = ?",
             (discord_id,),
         )
-        return await cursor.fetchone()
+        row = await cursor.fetchone()
+    user = dict(row) if row else None
+    if _pool is not None and generation == _users_generation:
+        _users[discord_id] = user
+    return user
 
 
 async def set_user_private_channel(discord_id: str, channel_id: str) -> None:
     """Store the private channel ID for a user."""
-    async with aiosqlite.connect(DB_PATH) as db:
+    async with _writer() as db:
         await db.execute(
             "UPDATE users SET private_channel_id = ? WHERE discord_id = ?",
             (channel_id, discord_id),
         )
         await db.commit()
+    _invalidate_users(discord_id)
 
 
 async def add_task(
@@ -82,22 +347,33 @@ async def add_task(
     description: str,
     due_date: str,
     recurrence: str = "none",
+    post_lane: int | None = None,
 ) -> int:
-    """Insert a task and return its ID."""
-    async with aiosqlite.connect(DB_PATH) as db:
+    """Insert a task and return its ID.
+
+    With post_lane, an outbox row asking for the task embed to be posted in
+    that outbound lane is written in the same transaction as the task.
+    """
+    async with _writer() as db:
+        await db.execute("BEGIN")
         cursor = await db.execute(
-            "INSERT INTO tasks (discord_id, description, due_date, recurrence) "
-            "VALUES (?, ?, ?, ?)",
-            (discord_id, description, due_date, recurrence),
+            "INSERT INTO tasks (discord_id, description, due_date, due_day, recurrence) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (discord_id, description, due_date, to_day_number(due_date), recurrence),
         )
+        task_id = cursor.lastrowid
+        if post_lane is not None:
+            await db.execute(
+                "INSERT INTO outbox (task_id, lane, next_attempt_at) VALUES (?, ?, ?)",
+                (task_id, post_lane, time.time()),
+            )
         await db.commit()
-        return cursor.lastrowid
+        return task_id
 
 
 async def get_task(task_id: int):
     """Return a task row or None."""
-    async with aiosqlite.connect(DB_PATH) as db:
-        db.row_factory = aiosqlite.Row
+    async with _reader() as db:
         cursor = await db.execute(
             "SELECT * FROM tasks WHERE id = ?",
             (task_id,),
@@ -107,8 +383,7 @@ async def get_task(task_id: int):
 
 async def get_tasks_for_user(discord_id: str, status: str | None = None) -> list:
     """Return all tasks for a user, optionally filtered by status."""
-    async with aiosqlite.connect(DB_PATH) as db:
-        db.row_factory = aiosqlite.Row
+    async with _reader() as db:
         if status:
             cursor = await db.execute(
                 "SELECT * FROM tasks WHERE discord_id = ? AND status = ?",
@@ -124,7 +399,7 @@ async def get_tasks_for_user(discord_id: str, status: str | None = None) -> list
 
 async def update_task_status(task_id: int, status: str) -> None:
     """Update a task's status."""
-    async with aiosqlite.connect(DB_PATH) as db:
+    async with _writer() as db:
         await db.execute(
             "UPDATE tasks SET status = ? WHERE id = ?",
             (status, task_id),
@@ -132,9 +407,9 @@ async def update_task_status(task_id: int, status: str) -> None:
         await db.commit()
 
 
-async def update_task_message_id(task_id: int, message_id: str) -> None:
-    """Store the Discord message ID for a task embed."""
-    async with aiosqlite.connect(DB_PATH) as db:
+async def update_task_message_id(task_id: int, message_id: str | None) -> None:
+    """Store the Discord message ID for a task embed (None clears it)."""
+    async with _writer() as db:
         await db.execute(
             "UPDATE tasks SET message_id = ? WHERE id = ?",
             (message_id, task_id),
@@ -144,64 +419,253 @@ async def update_task_message_id(task_id: int, message_id: str) -> None:
 
 async def update_score(discord_id: str, delta: int) -> None:
     """Add delta to a user's score."""
-    async with aiosqlite.connect(DB_PATH) as db:
+    async with _writer() as db:
         await db.execute(
             "UPDATE users SET score = score + ? WHERE discord_id = ?",
             (delta, discord_id),
         )
         await db.commit()
+    _invalidate_users(discord_id)
+
+
+async def complete_task(task_id: int, score_delta: int):
+    """Atomically complete an active task and award score_delta to its owner.
+
+    The status change is a compare-and-set, so of several concurrent calls
+    for the same task exactly one wins. Returns the completed task row for
+    the winner, or None if the task is missing or no longer active.
+    """
+    async with _writer() as db:
+        await db.execute("BEGIN")
+        cursor = await db.execute(
+            "UPDATE tasks SET status = 'completed' "
+            "WHERE id = ? AND status IN ('pending', 'overdue') RETURNING *",
+            (task_id,),
+        )
+        task = await cursor.fetchone()
+        if task is None:
+            await db.rollback()
+            return None
+        await db.execute(
+            "UPDATE users SET score = score + ? WHERE discord_id = ?",
+            (score_delta, task["discord_id"]),
+        )
+        await db.commit()
+    _invalidate_users(task["discord_id"])
+    return task
+
+
+async def snooze_task(
+    task_id: int, expected_due_day: int | None, new_due_date: str, score_delta: int
+):
+    """Atomically move an active task's due date and apply score_delta.
+
+    Only succeeds if the task is still active and its due_day still equals
+    expected_due_day (the value the caller computed new_due_date from), so
+    a second concurrent snooze of the same task loses instead of stacking.
+    Overdue tasks go back to pending. Returns the updated task row for the
+    winner, or None if the caller lost.
+    """
+    async with _writer() as db:
+        await db.execute("BEGIN")
+        cursor = await db.execute(
+            "UPDATE tasks SET due_date = ?, due_day = ?, status = 'pending' "
+            "WHERE id = ? AND status IN ('pending', 'overdue') AND due_day IS ? "
+            "RETURNING *",
+            (new_due_date, to_day_number(new_due_date), task_id, expected_due_day),
+        )
+        task = await cursor.fetchone()
+        if task is None:
+            await db.rollback()
+            return None
+        await db.execute(
+            "UPDATE users SET score = score + ? WHERE discord_id = ?",
+            (score_delta, task["discord_id"]),
+        )
+        await db.commit()
+    _invalidate_users(task["discord_id"])
+    return task
+
 
+async def get_all_users_with_tasks(recent_completed: int = BOARD_RECENT_COMPLETED) -> list:
+    """Return all users joined with their board tasks, for the accountability board.
 
-async def get_all_users_with_tasks() -> list:
-    """Return all users joined with their tasks, for the accountability board."""
-    async with aiosqlite.connect(DB_PATH) as db:
-        db.row_factory = aiosqlite.Row
+    Board tasks are every pending/overdue task plus each user's
+    `recent_completed` most recently created completed tasks.
+    """
+    async with _reader() as db:
         cursor = await db.execute("""
+            WITH board_tasks AS (
+                SELECT id, discord_id, description, status, due_date, recurrence
+                FROM tasks
+                WHERE status IN ('pending', 'overdue')
+                UNION ALL
+                SELECT id, discord_id, description, status, due_date, recurrence
+                FROM (
+                    SELECT *, ROW_NUMBER() OVER (
+                        PARTITION BY discord_id ORDER BY id DESC
+                    ) AS recency
+                    FROM tasks
+                    WHERE status = 'completed'
+                )
+                WHERE recency <= ?
+            )
             SELECT u.discord_id, u.score, t.id AS task_id, t.description,
                    t.status, t.due_date, t.recurrence
             FROM users u
-            LEFT JOIN tasks t ON u.discord_id = t.discord_id
-            ORDER BY u.score DESC, u.discord_id
-        """)
+            LEFT JOIN board_tasks t ON u.discord_id = t.discord_id
+            ORDER BY u.score DESC, u.discord_id, t.id
+        """, (recent_completed,))
         return await cursor.fetchall()
 
 
-async def get_overdue_candidates() -> list:
-    """Return pending tasks where due_date is in the past."""
-    async with aiosqlite.connect(DB_PATH) as db:
-        db.row_factory = aiosqlite.Row
+async def get_pending_due_days() -> list[int]:
+    """Return the distinct due days of pending tasks, for the deadline scheduler."""
+    async with _reader() as db:
         cursor = await db.execute(
-            "SELECT * FROM tasks WHERE status = 'pending' "
-            "AND due_date < datetime('now')"
+            "SELECT DISTINCT due_day FROM tasks "
+            "WHERE status = 'pending' AND due_day IS NOT NULL"
         )
-        return await cursor.fetchall()
+        return [row[0] for row in await cursor.fetchall()]
+
 
+async def mark_overdue_tasks(today: int | None = None) -> list[dict]:
+    """Flip every pending task due by today to overdue and apply penalties.
 
-async def get_pending_tasks_due_today() -> list:
+    Runs as one transaction: a single UPDATE ... RETURNING for the status
+    change, one score UPDATE per affected user, and one lookup of those
+    users' private channels. Returns the affected tasks as dicts with
+    private_channel_id and the applied penalty attached.
+    """
+    if today is None:
+        today = today_day_number()
+    async with _writer() as db:
+        await db.execute("BEGIN")
+        cursor = await db.execute(
+            "UPDATE tasks SET status = 'overdue' "
+            "WHERE status = 'pending' AND due_day <= ? "
+            "RETURNING id, discord_id, description, due_date, due_day, "
+            "recurrence, message_id",
+            (today,),
+        )
+        tasks = [dict(row) for row in await cursor.fetchall()]
+        if not tasks:
+            await db.commit()
+            return []
+
+        penalties: dict[str, int] = {}
+        for task in tasks:
+            days = today - task["due_day"]
+            task["penalty"] = calculate_overdue_penalty(days) if days > 0 else 0
+            uid = task["discord_id"]
+            penalties[uid] = penalties.get(uid, 0) + task["penalty"]
+
+        await db.executemany(
+            "UPDATE users SET score = score + ? WHERE discord_id = ?",
+            [(delta, uid) for uid, delta in penalties.items() if delta],
+        )
+        cursor = await db.execute(
+            "SELECT discord_id, private_channel_id FROM users "
+            "WHERE discord_id IN (SELECT value FROM json_each(?))",
+            (json.dumps(list(penalties)),),
+        )
+        channels = {row[0]: row[1] for row in await cursor.fetchall()}
+        await db.commit()
+    _invalidate_users(*(uid for uid, delta in penalties.items() if delta))
+
+    for task in tasks:
+        task["private_channel_id"] = channels.get(task["discord_id"])
+    return tasks
+
+
+async def get_pending_tasks_due_today(today: int | None = None) -> list:
     """Return tasks due today that are still pending or overdue (for Wall of Shame)."""
-    async with aiosqlite.connect(DB_PATH) as db:
-        db.row_factory = aiosqlite.Row
+    if today is None:
+        today = today_day_number()
+    async with _reader() as db:
         cursor = await db.execute(
             "SELECT * FROM tasks WHERE status IN ('pending', 'overdue') "
-            "AND date(due_date) <= date('now')"
+            "AND due_day <= ?",
+            (today,),
         )
         return await cursor.fetchall()
 
 
-async def get_completed_recurring_tasks() -> list:
-    """Return completed tasks that have a recurrence pattern."""
-    async with aiosqlite.connect(DB_PATH) as db:
-        db.row_factory = aiosqlite.Row
+async def get_series_due_for_next_instance(today: int | None = None) -> list:
+    """Return completed recurring tasks due by today whose next instance doesn't exist yet."""
+    if today is None:
+        today = today_day_number()
+    async with _reader() as db:
+        # Without stats the planner prefers idx_tasks_status_due_day, which
+        # walks every completed task ever; the partial index holds only the
+        # handful still waiting for a successor
         cursor = await db.execute(
-            "SELECT * FROM tasks WHERE status = 'completed' "
-            "AND recurrence != 'none'"
+            "SELECT * FROM tasks INDEXED BY idx_tasks_series_open "
+            "WHERE status = 'completed' "
+            "AND recurrence != 'none' AND successor_id IS NULL AND due_day <= ?",
+            (today,),
         )
         return await cursor.fetchall()
 
 
+async def create_next_instances(
+    next_due_dates: dict[int, str], post_lane: int | None = None
+) -> list[dict]:
+    """Create the next instance of each recurring task in one transaction.
+
+    next_due_dates maps a task ID to its successor's due date. Tasks that
+    already have a successor are skipped, so calling this twice for the same
+    task creates one instance. With post_lane each new instance also gets an
+    outbox row. Returns the created tasks as dicts with a `previous_id` key.
+    """
+    if not next_due_dates:
+        return []
+    placeholders = ", ".join("?" * len(next_due_dates))
+    async with _writer() as db:
+        await db.execute("BEGIN")
+        cursor = await db.execute(
+            "SELECT id, discord_id, description, recurrence, series_id FROM tasks "
+            f"WHERE id IN ({placeholders}) AND recurrence != 'none' AND successor_id IS NULL",
+            tuple(next_due_dates),
+        )
+        created = []
+        for prev in await cursor.fetchall():
+            due_date = next_due_dates[prev["id"]]
+            cursor = await db.execute(
+                "INSERT INTO tasks "
+                "(discord_id, description, due_date, due_day, recurrence, series_id) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    prev["discord_id"], prev["description"], due_date,
+                    to_day_number(due_date), prev["recurrence"],
+                    prev["series_id"] or prev["id"],
+                ),
+            )
+            created.append({
+                "id": cursor.lastrowid,
+                "previous_id": prev["id"],
+                "discord_id": prev["discord_id"],
+                "description": prev["description"],
+                "due_date": due_date,
+                "recurrence": prev["recurrence"],
+            })
+        await db.executemany(
+            "UPDATE tasks SET successor_id = ? WHERE id = ?",
+            [(t["id"], t["previous_id"]) for t in created],
+        )
+        if post_lane is not None:
+            now = time.time()
+            await db.executemany(
+                "INSERT INTO outbox (task_id, lane, next_attempt_at) VALUES (?, ?, ?)",
+                [(t["id"], post_lane, now) for t in created],
+            )
+        await db.commit()
+        return created
+
+
 async def get_config(key: str) -> str | None:
     """Return a config value or None."""
-    async with aiosqlite.connect(DB_PATH) as db:
+    async with _reader() as db:
         cursor = await db.execute(
             "SELECT value FROM config WHERE key = ?",
             (key,),
@@ -212,7 +676,7 @@ async def get_config(key: str) -> str | None:
 
 async def set_config(key: str, value: str) -> None:
     """Insert or update a config value."""
-    async with aiosqlite.connect(DB_PATH) as db:
+    async with _writer() as db:
         await db.execute(
             "INSERT OR REPLACE INTO config (key, value) VALUES (?, ?)",
             (key, value),
@@ -220,38 +684,86 @@ async def set_config(key: str, value: str) -> None:
         await db.commit()
 
 
-async def update_task_due_date(task_id: int, new_due_date: str) -> None:
-    """Update a task's due date."""
-    async with aiosqlite.connect(DB_PATH) as db:
-        await db.execute(
-            "UPDATE tasks SET due_date = ? WHERE id = ?",
-            (new_due_date, task_id),
-        )
+async def delete_config(key: str) -> None:
+    """Remove a config value if present."""
+    async with _writer() as db:
+        await db.execute("DELETE FROM config WHERE key = ?", (key,))
         await db.commit()
 
 
 async def update_task_details(task_id: int, description: str, due_date: str, recurrence: str) -> None:
     """Update all main details of a task."""
-    async with aiosqlite.connect(DB_PATH) as db:
+    async with _writer() as db:
         await db.execute(
-            "UPDATE tasks SET description = ?, due_date = ?, recurrence = ? WHERE id = ?",
-            (description, due_date, recurrence, task_id),
+            "UPDATE tasks SET description = ?, due_date = ?, due_day = ?, recurrence = ? "
+            "WHERE id = ?",
+            (description, due_date, to_day_number(due_date), recurrence, task_id),
         )
         await db.commit()
 
 
 async def delete_task(task_id: int) -> None:
     """Delete a task by ID."""
-    async with aiosqlite.connect(DB_PATH) as db:
+    async with _writer() as db:
         await db.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
         await db.commit()
 
 
-async def get_active_task_ids() -> list[int]:
-    """Return IDs of all pending/overdue tasks (for persistent view re-registration)."""
-    async with aiosqlite.connect(DB_PATH) as db:
+# ── Outbox ────────────────────────────────────────────────────
+
+async def get_due_outbox(now: float, limit: int) -> list:
+    """Return outbox rows due by now, joined with their task and owner's channel.
+
+    Ordered by lane, then by when they became due.
+    """
+    async with _reader() as db:
         cursor = await db.execute(
-            "SELECT id FROM tasks WHERE status IN ('pending', 'overdue')"
+            "SELECT o.id, o.task_id, o.kind, o.lane, o.attempts, "
+            "t.status, t.description, t.due_date, t.recurrence, t.message_id, "
+            "u.private_channel_id "
+            "FROM outbox o "
+            "JOIN tasks t ON t.id = o.task_id "
+            "LEFT JOIN users u ON u.discord_id = t.discord_id "
+            "WHERE o.next_attempt_at <= ? "
+            "ORDER BY o.lane, o.next_attempt_at, o.id LIMIT ?",
+            (now, limit),
         )
-        rows = await cursor.fetchall()
-        return [row[0] for row in rows]
+        return await cursor.fetchall()
+
+
+async def get_next_outbox_attempt() -> float | None:
+    """Return the earliest next_attempt_at in the outbox, or None if it's empty."""
+    async with _reader() as db:
+        cursor = await db.execute("SELECT MIN(next_attempt_at) FROM outbox")
+        row = await cursor.fetchone()
+        return row[0]
+
+
+async def complete_outbox(outbox_id: int, task_id: int, message_id: str) -> None:
+    """Record a posted task message and remove its outbox row in one transaction."""
+    async with _writer() as db:
+        await db.execute("BEGIN")
+        await db.execute(
+            "UPDATE tasks SET message_id = ? WHERE id = ?",
+            (message_id, task_id),
+        )
+        await db.execute("DELETE FROM outbox WHERE id = ?", (outbox_id,))
+        await db.commit()
+
+
+async def retry_outbox(outbox_id: int, next_attempt_at: float, error: str) -> None:
+    """Count a failed attempt and schedule the next one."""
+    async with _writer() as db:
+        await db.execute(
+            "UPDATE outbox SET attempts = attempts + 1, next_attempt_at = ?, last_error = ? "
+            "WHERE id = ?",
+            (next_attempt_at, error, outbox_id),
+        )
+        await db.commit()
+
+
+async def delete_outbox(outbox_id: int) -> None:
+    """Remove an outbox row that is done with or given up on."""
+    async with _writer() as db:
+        await db.execute("DELETE FROM outbox WHERE id = ?", (outbox_id,))
+        await db.commit()
@@ -0,0 +1,110 @@
+"""Deadline scheduler: wakes when pending tasks fall due instead of polling.
+
+A task due on day D becomes overdue when UTC day D begins. The scheduler
+keeps a min-heap of the distinct due days of pending tasks, rebuilt from the
+DB on start, and sleeps until the earliest one begins. New, edited and
+snoozed tasks push their due day through the event bus. Stale days (their
+tasks were completed or moved) cost one no-op wake at most, and the loops
+cog still runs a low-frequency safety sweep behind it.
+"""
+
+import asyncio
+import heapq
+import logging
+import time
+from typing import Awaitable, Callable
+
+from src import db, events
+from src.constants import DEADLINE_MAX_SLEEP
+from src.dates import to_day_number
+
+log = logging.getLogger("bother-bot")
+
+SECONDS_PER_DAY = 86400
+
+
+class DeadlineScheduler:
+    """Calls on_deadline(today) as soon as a pending task's due day begins."""
+
+    def __init__(
+        self,
+        on_deadline: Callable[[int], Awaitable[None]],
+        clock: Callable[[], float] = time.time,
+    ):
+        self.on_deadline = on_deadline
+        self.clock = clock
+        self.wakeups = 0
+        self._heap: list[int] = []
+        self._queued: set[int] = set()
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    def today(self) -> int:
+        return int(self.clock() // SECONDS_PER_DAY)
+
+    def next_deadline(self) -> int | None:
+        """Earliest due day still queued, if any."""
+        return self._heap[0] if self._heap else None
+
+    async def rebuild(self) -> None:
+        """Reload the queued due days from the DB.
+
+        Days already queued are kept, so one added while the query runs
+        isn't lost; a stale day costs a single no-op wake.
+        """
+        days = set(await db.get_pending_due_days()) | self._queued
+        self._heap = list(days)
+        heapq.heapify(self._heap)
+        self._queued = days
+        self._wakeup.set()
+
+    def add(self, due_day: int | None) -> None:
+        """Queue a due day; wakes the scheduler if it is the new earliest."""
+        if due_day is None or due_day in self._queued:
+            return
+        heapq.heappush(self._heap, due_day)
+        self._queued.add(due_day)
+        if self._heap[0] == due_day:
+            self._wakeup.set()
+
+    async def handle_event(self, event: events.Event) -> None:
+        """Event bus subscriber: a task got a new due date."""
+        self.add(to_day_number(event.payload.get("due_date")))
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="deadlines")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        await self.rebuild()
+        while True:
+            self._wakeup.clear()
+            today = self.today()
+            if self._heap and self._heap[0] <= today:
+                while self._heap and self._heap[0] <= today:
+                    self._queued.discard(heapq.heappop(self._heap))
+                self.wakeups += 1
+                try:
+                    await self.on_deadline(today)
+                except Exception as e:
+                    log.exception("Deadline handler failed: %s", e)
+                continue
+
+            # Capped so a wall clock jump can't leave us asleep past a boundary
+            timeout = DEADLINE_MAX_SLEEP
+            if self._heap:
+                timeout = min(timeout, self._heap[0] * SECONDS_PER_DAY - self.clock())
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), max(0.0, timeout))
+            except asyncio.TimeoutError:
+                pass
@@ -0,0 +1,140 @@
+"""Due-date parsing for /task add and /task edit, kept off the event loop.
+
+Common inputs (ISO dates, "today", "tomorrow", weekday names, "next friday",
+"in 3 days") are handled by a pure fast path. Anything else goes to
+dateparser, restricted to English, in a worker thread. Results are cached per
+(input, UTC day), since the same words mean a different date tomorrow.
+
+dateparser itself is imported on first use, or ahead of time by start_warm_up()
+once the bot is connected, so it never adds to cold start.
+"""
+
+import asyncio
+import collections
+import datetime
+import logging
+import re
+import time
+
+from src.constants import DUE_DATE_CACHE_SIZE, WARM_UP_DATEPARSER
+from src.dates import EPOCH, WEEKDAY_WORDS, from_day_number, today_day_number, weekday
+
+log = logging.getLogger("bother-bot")
+
+# Running totals since startup
+stats = {"fast": 0, "cached": 0, "slow": 0, "unparsed": 0}
+
+DATEPARSER_SETTINGS = {
+    "TIMEZONE": "UTC",
+    "RETURN_AS_TIMEZONE_AWARE": True,
+    "PREFER_DATES_FROM": "future",
+}
+DATEPARSER_LANGUAGES = ["en"]
+
+_RELATIVE_DAYS = {"today": 0, "tonight": 0, "tomorrow": 1, "tmrw": 1, "tmr": 1, "yesterday": -1}
+_ISO_DATE = re.compile(r"(\d{4})[-/](\d{1,2})[-/](\d{1,2})")
+_IN_N = re.compile(r"in\s+(\d{1,3})\s+(day|week)s?")
+_WEEKDAY_PHRASE = re.compile(r"(?:(next|this)\s+)?([a-z]+)")
+
+_cache: collections.OrderedDict[tuple[str, int], str | None] = collections.OrderedDict()
+_dateparser = None
+_warm_up_task: asyncio.Task | None = None
+
+
+def parse_fast(text: str, today: int) -> int | None:
+    """Day number for the common phrasings, or None if dateparser is needed.
+
+    A bare weekday means the coming one (today if it matches); "next" skips
+    today, so on a Friday "friday" is today and "next friday" is in a week.
+    """
+    phrase = " ".join(text.lower().split())
+    if phrase in _RELATIVE_DAYS:
+        return today + _RELATIVE_DAYS[phrase]
+    if m := _ISO_DATE.fullmatch(phrase):
+        try:
+            date = datetime.date(int(m[1]), int(m[2]), int(m[3]))
+        except ValueError:
+            return None
+        return (date - EPOCH).days
+    if m := _IN_N.fullmatch(phrase):
+        return today + int(m[1]) * (7 if m[2] == "week" else 1)
+    if (m := _WEEKDAY_PHRASE.fullmatch(phrase)) and m[2] in WEEKDAY_WORDS:
+        ahead = (WEEKDAY_WORDS[m[2]] - weekday(today)) % 7
+        if m[1] == "next" and ahead == 0:
+            ahead = 7
+        return today + ahead
+    return None
+
+
+def _load_dateparser():
+    """Import dateparser on first use; the import alone takes ~0.5s."""
+    global _dateparser
+    if _dateparser is None:
+        import dateparser
+        _dateparser = dateparser
+    return _dateparser
+
+
+def _parse_slow(text: str) -> str | None:
+    parsed = _load_dateparser().parse(
+        text, languages=DATEPARSER_LANGUAGES, settings=DATEPARSER_SETTINGS
+    )
+    return parsed.strftime("%Y-%m-%d") if parsed else None
+
+
+async def warm_up() -> float:
+    """Import dateparser and load its English data in a worker thread.
+
+    Returns the seconds it took (0 if already warm).
+    """
+    if _dateparser is not None:
+        return 0.0
+    started = time.perf_counter()
+    await asyncio.to_thread(_parse_slow, "next tuesday at noon")
+    return time.perf_counter() - started
+
+
+def start_warm_up() -> None:
+    """Start warm_up() in the background, unless WARM_UP_DATEPARSER is off.
+
+    Doesn't return the task, so a startup step calling this never waits on it.
+    """
+    global _warm_up_task
+    if WARM_UP_DATEPARSER and _warm_up_task is None:
+        _warm_up_task = asyncio.create_task(_log_warm_up(), name="dateparser-warm-up")
+
+
+async def _log_warm_up() -> None:
+    try:
+        seconds = await warm_up()
+    except Exception as e:
+        log.warning("dateparser warm-up failed: %s", e)
+        return
+    log.info("dateparser warmed up in %.0f ms", seconds * 1000)
+
+
+async def parse_due_date(text: str, today: int | None = None) -> str | None:
+    """Return "YYYY-MM-DD" for a user-typed due date, or None if it can't be read."""
+    if today is None:
+        today = today_day_number()
+    key = (" ".join(text.lower().split()), today)
+    if key in _cache:
+        _cache.move_to_end(key)
+        stats["cached"] += 1
+        return _cache[key]
+
+    day = parse_fast(text, today)
+    if day is not None:
+        stats["fast"] += 1
+        result = from_day_number(day)
+    else:
+        stats["slow"] += 1
+        result = await asyncio.to_thread(_parse_slow, text)
+        if result is None:
+            stats["unparsed"] += 1
+            log.info("Could not parse due date %r", text)
+
+    _cache[key] = result
+    if len(_cache) > DUE_DATE_CACHE_SIZE:
+        _cache.popitem(last=False)
+    return result
@@ -6,15 +6,20 @@ import random
 import discord
 
 from src.constants import (
+    BOARD_LINE_LIMIT,
     CELEBRATION_MESSAGES,
     COLOR_BOARD,
     COLOR_COMPLETE,
     COLOR_DEFAULT_TASK,
     COLOR_OVERDUE,
+    EMBED_FIELD_VALUE_LIMIT,
+    EMBED_MAX_FIELDS,
+    EMBED_TOTAL_LIMIT,
     SHAME_MESSAGES,
     SNOOZE_MESSAGES,
     STATUS_EMOJI,
 )
+from src.recurrence import describe as describe_recurrence
 
 
 def build_task_embed(
@@ -45,41 +50,113 @@ def build_task_embed(
         embed.add_field(name="Due Date", value=due_date, inline=True)
 
     if recurrence != "none":
-        embed.add_field(name="Recurrence", value=recurrence.capitalize(), inline=True)
+        embed.add_field(name="Recurrence", value=describe_recurrence(recurrence), inline=True)
 
     return embed
 
 
-def build_board_embed(users_data: list[dict]) -> discord.Embed:
-    """Build the accountability board embed.
+def _truncate(text: str, limit: int) -> str:
+    return text if len(text) <= limit else text[: limit - 1] + "\u2026"
+
+
+def _fit_lines(lines: list[str], limit: int) -> str:
+    """Join lines within limit chars, ending with "+N more" for any that don't fit."""
+    kept: list[str] = []
+    used = 0
+    for i, line in enumerate(lines):
+        remaining = len(lines) - i - 1
+        reserve = len(f"\n+{remaining} more") if remaining else 0
+        needed = len(line) + (1 if kept else 0)
+        if used + needed + reserve > limit:
+            kept.append(f"+{len(lines) - i} more")
+            break
+        kept.append(line)
+        used += needed
+    return "\n".join(kept)
+
+
+def _board_field(user: dict) -> tuple[str, str]:
+    """Return the (name, value) board field for one user, within field limits."""
+    task_lines = []
+    for task in user["tasks"]:
+        emoji = STATUS_EMOJI.get(task["status"], "")
+        task_lines.append(_truncate(f"{emoji} {task['description']}", BOARD_LINE_LIMIT))
+
+    task_text = _fit_lines(task_lines, EMBED_FIELD_VALUE_LIMIT) if task_lines else "*No tasks*"
+    field_name = f"**{user['name']}** — \U0001f3c6 {user['score']} pts"
+    return field_name, task_text
+
+
+def _board_title(page: int, pages: int) -> str:
+    return "Accountability Board" if pages == 1 else f"Accountability Board ({page}/{pages})"
+
+
+def build_board_embed(
+    users_data: list[dict], page: int = 1, pages: int = 1
+) -> discord.Embed:
+    """Build the accountability board embed (or one page of it).
 
     users_data: list of dicts with keys: name, score, tasks
         where tasks is a list of dicts with keys: description, status
-    Users are sorted by score descending.
+    Users are sorted by score descending. Each field and the embed as a
+    whole stay within Discord's size limits; tasks or users that don't fit
+    are summarised as "+N more".
     """
     now = datetime.datetime.now(datetime.timezone.utc)
     embed = discord.Embed(
-        title="Accountability Board",
+        title=_board_title(page, pages),
         color=COLOR_BOARD,
         timestamp=now,
     )
 
     sorted_users = sorted(users_data, key=lambda u: u["score"], reverse=True)
 
-    for user in sorted_users:
-        task_lines = []
-        for task in user["tasks"]:
-            emoji = STATUS_EMOJI.get(task["status"], "")
-            task_lines.append(f"{emoji} {task['description']}")
-
-        task_text = "\n".join(task_lines) if task_lines else "*No tasks*"
-        field_name = f"**{user['name']}** — \U0001f3c6 {user['score']} pts"
+    footer = "Last updated"
+    more_users = " \u00b7 +{} more users"
+    budget = EMBED_TOTAL_LIMIT - len(embed.title) - len(footer)
+    budget -= len(more_users.format(len(sorted_users)))
+    for i, user in enumerate(sorted_users):
+        field_name, task_text = _board_field(user)
+        size = len(field_name) + len(task_text)
+        if size > budget or len(embed.fields) == EMBED_MAX_FIELDS:
+            footer += more_users.format(len(sorted_users) - i)
+            break
         embed.add_field(name=field_name, value=task_text, inline=False)
+        budget -= size
 
-    embed.set_footer(text="Last updated")
+    embed.set_footer(text=footer)
     return embed
 
 
+def build_board_pages(users_data: list[dict]) -> list[discord.Embed]:
+    """Split the accountability board across as many embeds as it needs.
+
+    Users keep their score order across pages; each page holds at most
+    EMBED_MAX_FIELDS users and stays within the embed character limit.
+    Always returns at least one page.
+    """
+    sorted_users = sorted(users_data, key=lambda u: u["score"], reverse=True)
+
+    # Worst-case title/footer overhead, so page numbering never overflows a page
+    overhead = len(_board_title(999, 999)) + len("Last updated \u00b7 +99999 more users")
+    budget = EMBED_TOTAL_LIMIT - overhead
+
+    groups: list[list[dict]] = [[]]
+    used = 0
+    for user in sorted_users:
+        size = sum(len(part) for part in _board_field(user))
+        if groups[-1] and (used + size > budget or len(groups[-1]) == EMBED_MAX_FIELDS):
+            groups.append([])
+            used = 0
+        groups[-1].append(user)
+        used += size
+
+    return [
+        build_board_embed(group, page=i, pages=len(groups))
+        for i, group in enumerate(groups, start=1)
+    ]
+
+
 def build_celebration_embed(
     user_name: str, task_description: str
 ) -> discord.Embed:
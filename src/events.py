@@ -0,0 +1,154 @@
+"""In-process task lifecycle event bus.
+
+Publishers hand an event to every interested subscriber's bounded queue and
+move on; each subscriber drains its own queue in its own background task.
+A full queue makes publish() wait (back-pressure), and an exception in one
+subscriber is logged without affecting the others or the publisher.
+"""
+
+import asyncio
+import collections
+import dataclasses
+import logging
+from typing import Awaitable, Callable, Iterable
+
+from src.constants import EVENT_QUEUE_SIZE
+
+log = logging.getLogger("bother-bot")
+
+# ── Event Names ───────────────────────────────────────────────
+TASK_CREATED = "task_created"      # task_id, discord_id, description, due_date
+TASK_EDITED = "task_edited"        # task_id, discord_id, description, due_date
+TASK_COMPLETED = "task_completed"  # task_id, discord_id, description, score_delta
+TASK_SNOOZED = "task_snoozed"      # task_id, discord_id, description, due_date, score_delta
+TASK_OVERDUE = "task_overdue"      # task_id, discord_id, score_delta
+TASK_DELETED = "task_deleted"      # task_id, discord_id
+USER_OPTED_IN = "user_opted_in"    # discord_id
+
+ALL_EVENTS = (
+    TASK_CREATED,
+    TASK_EDITED,
+    TASK_COMPLETED,
+    TASK_SNOOZED,
+    TASK_OVERDUE,
+    TASK_DELETED,
+    USER_OPTED_IN,
+)
+
+
+@dataclasses.dataclass(frozen=True)
+class Event:
+    name: str
+    payload: dict
+
+
+Handler = Callable[[Event], Awaitable[None]]
+
+
+class _Subscriber:
+    def __init__(self, name: str, handler: Handler, events: frozenset[str], maxsize: int):
+        self.name = name
+        self.handler = handler
+        self.events = events
+        self.queue: asyncio.Queue[Event] = asyncio.Queue(maxsize=maxsize)
+        self.processed = 0
+        self.failed = 0
+        self.task: asyncio.Task | None = None
+
+    async def run(self) -> None:
+        while True:
+            event = await self.queue.get()
+            try:
+                await self.handler(event)
+                self.processed += 1
+            except Exception as e:
+                self.failed += 1
+                log.exception("Event subscriber %s failed on %s: %s", self.name, event.name, e)
+            finally:
+                self.queue.task_done()
+
+
+class EventBus:
+    """Fans task lifecycle events out to subscribers, each with its own queue."""
+
+    def __init__(self, maxsize: int = EVENT_QUEUE_SIZE):
+        self.maxsize = maxsize
+        self.published: collections.Counter[str] = collections.Counter()
+        self._subscribers: list[_Subscriber] = []
+        self._running = False
+
+    def subscribe(
+        self, name: str, handler: Handler, events: Iterable[str] = ALL_EVENTS
+    ) -> None:
+        """Register handler for the given event names under a unique name."""
+        sub = _Subscriber(name, handler, frozenset(events), self.maxsize)
+        self._subscribers.append(sub)
+        if self._running:
+            sub.task = asyncio.create_task(sub.run(), name=f"events-{name}")
+
+    async def unsubscribe(self, name: str) -> None:
+        """Remove a subscriber and stop its consumer; events still queued are dropped."""
+        for sub in [s for s in self._subscribers if s.name == name]:
+            self._subscribers.remove(sub)
+            if sub.task is not None:
+                sub.task.cancel()
+                try:
+                    await sub.task
+                except asyncio.CancelledError:
+                    pass
+                sub.task = None
+
+    def start(self) -> None:
+        self._running = True
+        for sub in self._subscribers:
+            if sub.task is None:
+                sub.task = asyncio.create_task(sub.run(), name=f"events-{sub.name}")
+
+    async def stop(self) -> None:
+        self._running = False
+        for sub in self._subscribers:
+            if sub.task is not None:
+                sub.task.cancel()
+        for sub in self._subscribers:
+            if sub.task is not None:
+                try:
+                    await sub.task
+                except asyncio.CancelledError:
+                    pass
+                sub.task = None
+
+    async def publish(self, name: str, **payload) -> None:
+        """Queue an event for every subscriber of it, waiting only if a queue is full."""
+        event = Event(name, payload)
+        self.published[name] += 1
+        for sub in self._subscribers:
+            if name in sub.events:
+                await sub.queue.put(event)
+
+    async def drain(self) -> None:
+        """Wait until every queued event has been handled."""
+        for sub in self._subscribers:
+            await sub.queue.join()
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Per-subscriber processed/failed counts and current queue depth."""
+        return {
+            sub.name: {
+                "processed": sub.processed,
+                "failed": sub.failed,
+                "queued": sub.queue.qsize(),
+            }
+            for sub in self._subscribers
+        }
+
+
+class EventCounter:
+    """Metrics subscriber: counts handled events per name and net score change."""
+
+    def __init__(self):
+        self.counts: collections.Counter[str] = collections.Counter()
+        self.score_delta = 0
+
+    async def handle_event(self, event: Event) -> None:
+        self.counts[event.name] += 1
+        self.score_delta += event.payload.get("score_delta", 0)
@@ -0,0 +1,79 @@
+"""Startup lifecycle: one-time warm-up on the first on_ready, cheap catch-up after.
+
+discord.py fires on_ready again whenever the gateway re-identifies, so work
+that only needs doing once per process (command sync, the first full board
+render, cache priming) is registered as a warm-up step, and anything that
+should happen after a reconnect (flushing work that failed while offline) as
+a reconnect step. Each step is timed; the first ready logs a startup report
+and each reconnect logs its own.
+"""
+
+import contextlib
+import inspect
+import logging
+import time
+from typing import Any, Awaitable, Callable
+
+log = logging.getLogger("bother-bot")
+
+Step = Callable[[], Awaitable[Any] | Any]
+
+
+class Lifecycle:
+    """Runs warm-up steps on the first ready and reconnect steps on later ones."""
+
+    def __init__(self, started: float | None = None):
+        # perf_counter() at process start, for the time-to-ready total
+        self.started = time.perf_counter() if started is None else started
+        # Milliseconds per startup phase, in the order they ran
+        self.timings: dict[str, float] = {}
+        self.warmed_up = False
+        self.reconnects = 0
+        self._warm_up: list[tuple[str, Step]] = []
+        self._reconnect: list[tuple[str, Step]] = []
+
+    def add_warm_up(self, name: str, step: Step) -> None:
+        """Run `step` once, the first time the bot becomes ready."""
+        self._warm_up.append((name, step))
+
+    def add_reconnect(self, name: str, step: Step) -> None:
+        """Run `step` every time the bot becomes ready again after that."""
+        self._reconnect.append((name, step))
+
+    @contextlib.contextmanager
+    def phase(self, name: str, timings: dict[str, float] | None = None):
+        """Add the block's wall time, in ms, to timings[name]."""
+        timings = self.timings if timings is None else timings
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = (time.perf_counter() - started) * 1000
+            timings[name] = timings.get(name, 0) + elapsed
+
+    async def on_ready(self) -> None:
+        if not self.warmed_up:
+            self.warmed_up = True
+            await self._run_steps(self._warm_up, self.timings)
+            self.timings["to_ready"] = (time.perf_counter() - self.started) * 1000
+            log.info("Startup timing: %s", _format(self.timings))
+        else:
+            self.reconnects += 1
+            timings: dict[str, float] = {}
+            with self.phase("total", timings):
+                await self._run_steps(self._reconnect, timings)
+            log.info("Reconnect #%d handled: %s", self.reconnects, _format(timings))
+
+    async def _run_steps(self, steps: list[tuple[str, Step]], timings: dict[str, float]) -> None:
+        for name, step in steps:
+            with self.phase(name, timings):
+                try:
+                    result = step()
+                    if inspect.isawaitable(result):
+                        await result
+                except Exception as e:
+                    log.exception("Startup step %r failed: %s", name, e)
+
+
+def _format(timings: dict[str, float]) -> str:
+    return ", ".join(f"{name} {ms:.0f} ms" for name, ms in timings.items())
@@ -0,0 +1,306 @@
+"""Discord message helpers shared by cogs, views and loops.
+
+Messages are edited and deleted by ID through partial messages, so no
+fetch_message() round trip is spent (or rate limit consumed) beforehand.
+Channel sends, edits and deletes go through the prioritised outbound queue
+once it has been started; interaction responses bypass it, since Discord
+rate limits those separately.
+"""
+
+import asyncio
+import collections
+import logging
+
+import discord
+
+from src import db
+from src.constants import (
+    OUTBOUND_CHANNEL_BURST,
+    OUTBOUND_CHANNEL_PERIOD,
+    OUTBOUND_CONCURRENCY,
+)
+
+log = logging.getLogger("bother-bot")
+
+# Running totals since startup, for the sweep summaries in loops.py
+stats = {"fetches_saved": 0, "stale_ids_cleared": 0}
+
+# ── Outbound Queue ────────────────────────────────────────────
+LANE_INTERACTIVE = 0  # a user is waiting on it: slash commands, buttons
+LANE_BOARD = 1        # accountability board pages
+LANE_NOTIFY = 2       # meat grinder posts, regenerated recurring tasks
+LANE_BULK = 3         # loop sweeps: overdue edits, shame posts, daily reset
+LANE_NAMES = ("interactive", "board", "notify", "bulk")
+
+
+class _Job:
+    __slots__ = ("lane", "channel_id", "run", "fields", "key", "enqueued", "future")
+
+    def __init__(self, lane, channel_id, run, fields, key, enqueued):
+        self.lane = lane
+        self.channel_id = channel_id
+        self.run = run
+        self.fields = fields
+        self.key = key
+        self.enqueued = enqueued
+        self.future = asyncio.get_running_loop().create_future()
+
+
+class _Bucket:
+    """Token bucket for one channel: burst requests, refilled over period seconds."""
+
+    def __init__(self, burst: int, period: float, now: float):
+        self.capacity = float(burst)
+        self.tokens = float(burst)
+        self.rate = burst / period
+        self.updated = now
+
+    def wait_time(self, now: float) -> float:
+        """Seconds until a token is available (0 if one is available now)."""
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        return 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+
+
+class OutboundQueue:
+    """Central, prioritised queue for channel sends, edits and deletes.
+
+    Jobs run lowest lane number first, oldest first within a lane. Each
+    channel has at most one request in flight and spends tokens from its own
+    bucket, so a midnight sweep can't crowd out a button click and stays
+    under Discord's per-channel limit. An edit to a message that already has
+    an edit waiting is merged into it, and both callers get its result.
+
+    Until start() is called every operation runs inline, unqueued.
+    """
+
+    def __init__(
+        self,
+        concurrency: int = OUTBOUND_CONCURRENCY,
+        burst: int = OUTBOUND_CHANNEL_BURST,
+        period: float = OUTBOUND_CHANNEL_PERIOD,
+    ):
+        self.concurrency = concurrency
+        self.burst = burst
+        self.period = period
+        self.stats = {"submitted": 0, "completed": 0, "failed": 0, "coalesced": 0}
+        self._lanes: list[collections.deque[_Job]] = [collections.deque() for _ in LANE_NAMES]
+        self._pending_edits: dict[tuple[int, int], _Job] = {}
+        self._buckets: dict[int, _Bucket] = {}
+        self._busy: set[int] = set()
+        self._workers: set[asyncio.Task] = set()
+        self._wait_ms_total = [0.0] * len(LANE_NAMES)
+        self._wait_ms_max = [0.0] * len(LANE_NAMES)
+        self._started = [0] * len(LANE_NAMES)
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._dispatch(), name="outbound-queue")
+
+    async def stop(self) -> None:
+        """Stop dispatching, cancel waiting jobs and let in-flight ones finish."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        for lane in self._lanes:
+            for job in lane:
+                job.future.cancel()
+            lane.clear()
+        self._pending_edits.clear()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+
+    def depth(self) -> dict[str, int]:
+        """Jobs waiting per lane."""
+        return {name: len(lane) for name, lane in zip(LANE_NAMES, self._lanes)}
+
+    def snapshot(self) -> dict:
+        """Queue depth, in-flight count, per-lane wait times and totals."""
+        waits = {
+            name: {
+                "started": self._started[i],
+                "avg_wait_ms": self._wait_ms_total[i] / self._started[i] if self._started[i] else 0.0,
+                "max_wait_ms": self._wait_ms_max[i],
+            }
+            for i, name in enumerate(LANE_NAMES)
+        }
+        return {"depth": self.depth(), "in_flight": len(self._busy), "waits": waits, **self.stats}
+
+    async def submit(self, lane: int, channel, run, fields: dict, message_id: int | None = None):
+        """Run run(**fields) against channel in the given lane and return its result.
+
+        Passing message_id marks the job as an edit of that message, which
+        later edits of the same message merge into while it is still waiting.
+        """
+        if self._task is None:
+            return await run(**fields)
+
+        key = (channel.id, message_id) if message_id is not None else None
+        job = self._pending_edits.get(key) if key else None
+        if job is not None:
+            job.fields.update(fields)
+            self.stats["coalesced"] += 1
+            if lane < job.lane:
+                self._lanes[job.lane].remove(job)
+                job.lane = lane
+                self._lanes[lane].append(job)
+                self._wakeup.set()
+        else:
+            now = asyncio.get_running_loop().time()
+            job = _Job(lane, channel.id, run, dict(fields), key, now)
+            self._lanes[lane].append(job)
+            if key:
+                self._pending_edits[key] = job
+            self.stats["submitted"] += 1
+            self._wakeup.set()
+        # Shielded: the job may be shared with another caller
+        return await asyncio.shield(job.future)
+
+    def _next_ready(self, now: float) -> tuple[_Job | None, float | None]:
+        """Pop the first job whose channel is free and has a token.
+
+        Otherwise return how long until a token frees up, or None if every
+        waiting job is behind a busy channel.
+        """
+        soonest = None
+        blocked: set[int] = set()
+        for lane in self._lanes:
+            for job in lane:
+                cid = job.channel_id
+                if cid in self._busy or cid in blocked:
+                    continue
+                bucket = self._buckets.get(cid)
+                if bucket is None:
+                    bucket = self._buckets[cid] = _Bucket(self.burst, self.period, now)
+                wait = bucket.wait_time(now)
+                if wait == 0.0:
+                    lane.remove(job)
+                    return job, None
+                blocked.add(cid)
+                soonest = wait if soonest is None else min(soonest, wait)
+        return None, soonest
+
+    async def _dispatch(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            self._wakeup.clear()
+            delay = None
+            if len(self._busy) < self.concurrency:
+                job, delay = self._next_ready(loop.time())
+                if job is not None:
+                    self._launch(job, loop.time())
+                    continue
+            if delay is None:
+                await self._wakeup.wait()
+            else:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+
+    def _launch(self, job: _Job, now: float) -> None:
+        if job.key:
+            self._pending_edits.pop(job.key, None)
+        self._buckets[job.channel_id].tokens -= 1
+        self._busy.add(job.channel_id)
+        wait_ms = (now - job.enqueued) * 1000
+        self._started[job.lane] += 1
+        self._wait_ms_total[job.lane] += wait_ms
+        self._wait_ms_max[job.lane] = max(self._wait_ms_max[job.lane], wait_ms)
+        worker = asyncio.create_task(self._run(job), name=f"outbound-{LANE_NAMES[job.lane]}")
+        self._workers.add(worker)
+        worker.add_done_callback(self._workers.discard)
+
+    async def _run(self, job: _Job) -> None:
+        try:
+            result = await job.run(**job.fields)
+        except Exception as e:
+            self.stats["failed"] += 1
+            if not job.future.done():
+                job.future.set_exception(e)
+        else:
+            self.stats["completed"] += 1
+            if not job.future.done():
+                job.future.set_result(result)
+        finally:
+            self._busy.discard(job.channel_id)
+            self._wakeup.set()
+
+
+outbound = OutboundQueue()
+
+
+async def send_message(
+    channel: discord.abc.Messageable, *, lane: int = LANE_NOTIFY, **fields
+) -> discord.Message:
+    """channel.send(**fields) through the outbound queue."""
+    return await outbound.submit(lane, channel, channel.send, fields)
+
+
+async def edit_message(
+    channel: discord.abc.Messageable, message_id: int | str, *, lane: int = LANE_NOTIFY, **fields
+) -> bool:
+    """Edit a message by ID without fetching it first.
+
+    Returns False if the message no longer exists. Forbidden and other
+    HTTPExceptions propagate to the caller.
+    """
+    message_id = int(message_id)
+
+    async def run(**fields) -> bool:
+        partial = channel.get_partial_message(message_id)
+        stats["fetches_saved"] += 1
+        try:
+            await partial.edit(**fields)
+        except discord.NotFound:
+            return False
+        return True
+
+    return await outbound.submit(lane, channel, run, fields, message_id=message_id)
+
+
+async def delete_message(
+    channel: discord.abc.Messageable, message_id: int | str, *, lane: int = LANE_NOTIFY
+) -> bool:
+    """Delete a message by ID without fetching it first.
+
+    Returns False if the message was already gone. Forbidden and other
+    HTTPExceptions propagate to the caller.
+    """
+    async def run() -> bool:
+        partial = channel.get_partial_message(int(message_id))
+        stats["fetches_saved"] += 1
+        try:
+            await partial.delete()
+        except discord.NotFound:
+            return False
+        return True
+
+    return await outbound.submit(lane, channel, run, {})
+
+
+async def edit_task_message(
+    channel: discord.abc.Messageable,
+    task_id: int,
+    message_id: int | str,
+    *,
+    lane: int = LANE_NOTIFY,
+    **fields,
+) -> bool:
+    """edit_message() for a task embed that clears the stored ID if the message is gone."""
+    if await edit_message(channel, message_id, lane=lane, **fields):
+        return True
+    await db.update_task_message_id(task_id, None)
+    stats["stale_ids_cleared"] += 1
+    log.warning("Task %d message %s no longer exists, cleared stale message_id", task_id, message_id)
+    return False
@@ -0,0 +1,46 @@
+"""Event bus subscribers that post task activity to shared channels."""
+
+import logging
+
+import discord
+
+from src import db, events
+from src.embeds import build_celebration_embed, build_snooze_embed
+from src.messaging import LANE_NOTIFY, send_message
+
+log = logging.getLogger("bother-bot")
+
+
+class MeatGrinderNotifier:
+    """Posts completions and snoozes to the configured meat grinder channel."""
+
+    def __init__(self, bot: discord.Client):
+        self.bot = bot
+
+    async def handle_event(self, event: events.Event) -> None:
+        if event.name == events.TASK_COMPLETED:
+            build = build_celebration_embed
+        elif event.name == events.TASK_SNOOZED:
+            build = build_snooze_embed
+        else:
+            return
+
+        meat_grinder_id = await db.get_config("meat_grinder_channel_id")
+        if not meat_grinder_id:
+            return
+        channel = self.bot.get_channel(int(meat_grinder_id))
+        if not channel:
+            return
+
+        uid = event.payload["discord_id"]
+        member = channel.guild.get_member(int(uid))
+        name = member.display_name if member else f"User {uid}"
+        try:
+            await send_message(
+                channel, lane=LANE_NOTIFY, embed=build(name, event.payload["description"])
+            )
+        except (discord.Forbidden, discord.HTTPException) as e:
+            log.warning(
+                "Failed to post %s for task %d: %s",
+                event.name, event.payload["task_id"], e,
+            )
@@ -0,0 +1,150 @@
+"""Outbox worker: delivers Discord side effects recorded alongside task changes.
+
+db.add_task(..., post_lane=...) writes an outbox row in the same transaction
+as the task. This worker posts the task embed, stores its message ID and
+removes the row; transient failures (5xx, 429, network, channel not cached
+yet) are retried with exponential backoff, including after a restart.
+Delivery is at-least-once: a crash between the send and the bookkeeping can
+post a task twice.
+"""
+
+import asyncio
+import logging
+import time
+
+import discord
+from discord.ext import commands
+
+from src import db, events
+from src.constants import (
+    OUTBOX_BATCH_SIZE,
+    OUTBOX_MAX_ATTEMPTS,
+    OUTBOX_RETRY_BASE,
+    OUTBOX_RETRY_MAX,
+)
+from src.embeds import build_task_embed
+from src.messaging import send_message
+from src.views import TaskView
+
+log = logging.getLogger("bother-bot")
+
+
+def backoff_delay(attempts: int) -> float:
+    """Seconds to wait before the next try, after `attempts` failed ones."""
+    return min(OUTBOX_RETRY_MAX, OUTBOX_RETRY_BASE * 2 ** attempts)
+
+
+class OutboxWorker:
+    """Drains due outbox rows whenever kicked and whenever a retry falls due."""
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self.stats = {"posted": 0, "retried": 0, "dropped": 0}
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="outbox")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def kick(self) -> None:
+        """Deliver anything due now without waiting for the next retry."""
+        self._wakeup.set()
+
+    async def handle_event(self, event: events.Event) -> None:
+        """Event bus subscriber: a new task may have queued a post."""
+        self.kick()
+
+    async def drain(self) -> int:
+        """Attempt every row that is due now; return how many were attempted."""
+        attempted = 0
+        while rows := await db.get_due_outbox(time.time(), OUTBOX_BATCH_SIZE):
+            await asyncio.gather(*(self._deliver(row) for row in rows))
+            attempted += len(rows)
+        return attempted
+
+    async def _run(self) -> None:
+        # Channels aren't cached until the gateway is ready
+        await self.bot.wait_until_ready()
+        while True:
+            self._wakeup.clear()
+            try:
+                await self.drain()
+                next_at = await db.get_next_outbox_attempt()
+            except Exception as e:
+                log.exception("Outbox drain failed: %s", e)
+                next_at = time.time() + OUTBOX_RETRY_BASE
+            timeout = None if next_at is None else max(0.0, next_at - time.time())
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _deliver(self, row) -> None:
+        # Anything unexpected still counts as an attempt and backs off, rather
+        # than aborting the batch and being retried at the base delay forever
+        try:
+            await self._attempt(row)
+        except Exception as e:
+            await self._retry(row, repr(e))
+
+    async def _attempt(self, row) -> None:
+        task_id = row["task_id"]
+        if row["status"] not in ("pending", "overdue") or row["message_id"]:
+            # Completed, or already posted, before we got to it
+            await db.delete_outbox(row["id"])
+            return
+        if not row["private_channel_id"]:
+            await self._drop(row, "owner has no private channel")
+            return
+
+        channel = self.bot.get_channel(int(row["private_channel_id"]))
+        if channel is None:
+            await self._retry(row, "channel not in cache")
+            return
+
+        embed = build_task_embed(
+            row["description"], row["status"], row["due_date"], row["recurrence"]
+        )
+        try:
+            msg = await send_message(
+                channel, lane=row["lane"], embed=embed, view=TaskView(task_id=task_id)
+            )
+        except discord.HTTPException as e:
+            if e.status == 429 or e.status >= 500:
+                await self._retry(row, f"{e.status} {e.text}")
+            else:
+                await self._drop(row, f"{e.status} {e.text}")
+            return
+        except (OSError, asyncio.TimeoutError) as e:
+            await self._retry(row, repr(e))
+            return
+
+        await db.complete_outbox(row["id"], task_id, str(msg.id))
+        self.stats["posted"] += 1
+        if row["attempts"]:
+            log.info("Task %d posted after %d retries", task_id, row["attempts"])
+
+    async def _retry(self, row, error: str) -> None:
+        if row["attempts"] + 1 >= OUTBOX_MAX_ATTEMPTS:
+            await self._drop(row, f"gave up after {row['attempts'] + 1} attempts: {error}")
+            return
+        delay = backoff_delay(row["attempts"])
+        await db.retry_outbox(row["id"], time.time() + delay, error)
+        self.stats["retried"] += 1
+        log.warning("Posting task %d failed (%s), retrying in %.0fs", row["task_id"], error, delay)
+
+    async def _drop(self, row, reason: str) -> None:
+        await db.delete_outbox(row["id"])
+        self.stats["dropped"] += 1
+        log.error("Dropped post for task %d: %s", row["task_id"], reason)
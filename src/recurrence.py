@@ -0,0 +1,337 @@
+"""Recurrence rules for repeating tasks. No DB calls, no Discord API, no side effects.
+
+A task's `recurrence` column holds either "none", one of the legacy presets
+"daily" and "weekly", or a subset of an iCalendar RRULE:
+
+    FREQ=DAILY;INTERVAL=3                 every 3 days
+    FREQ=WEEKLY;BYDAY=MO,WE,FR            Mondays, Wednesdays and Fridays
+    FREQ=WEEKLY;INTERVAL=2;BYDAY=TU       every other Tuesday
+    FREQ=MONTHLY;BYMONTHDAY=15            the 15th of every month
+
+Only the next instance of a series is ever materialized: it is computed from
+the current instance's due day when that instance completes. Days are the
+UTC day numbers from src.dates; weeks start on Monday. A BYMONTHDAY past the
+end of a month falls on the month's last day (31 means "last day"); a
+monthly rule without one repeats on the current instance's day of month, so
+anchor() pins it to the first due date when a task is created.
+"""
+
+import bisect
+import dataclasses
+import datetime
+import functools
+import re
+from typing import Sequence
+
+from src.dates import EPOCH, WEEKDAY_WORDS, weekday
+
+DAILY = "DAILY"
+WEEKLY = "WEEKLY"
+MONTHLY = "MONTHLY"
+
+WEEKDAY_CODES = ("MO", "TU", "WE", "TH", "FR", "SA", "SU")
+_WEEKDAY_NAMES = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+# Day names, plus the RRULE codes ("mo", "tu", ...) since stored rules use them
+_WEEKDAY_WORDS = {
+    **WEEKDAY_WORDS,
+    **{code.lower(): i for i, code in enumerate(WEEKDAY_CODES)},
+}
+_EPOCH_ORDINAL = EPOCH.toordinal()
+
+
+@dataclasses.dataclass(frozen=True)
+class Rule:
+    freq: str
+    interval: int = 1
+    weekdays: tuple[int, ...] = ()  # Monday = 0, sorted
+    month_day: int | None = None    # 1-31
+
+
+# ── Parsing ───────────────────────────────────────────────────
+
+@functools.lru_cache(maxsize=1024)
+def parse(text: str | None) -> Rule | None:
+    """Parse a stored or user-typed recurrence; None means it doesn't repeat.
+
+    Accepts the stored forms above plus friendly input such as "every 3
+    days", "every 2 weeks", "mon, wed, fri", "weekdays" and "monthly on 15".
+    Raises ValueError for anything else.
+    """
+    if text is None:
+        return None
+    raw = text.strip()
+    lowered = raw.lower()
+    if lowered in ("", "none", "never"):
+        return None
+    if lowered == "daily":
+        return Rule(DAILY)
+    if lowered == "weekly":
+        return Rule(WEEKLY)
+    if lowered == "monthly":
+        return Rule(MONTHLY)
+    if lowered == "weekdays":
+        return Rule(WEEKLY, weekdays=(0, 1, 2, 3, 4))
+    if "=" in raw:
+        return _parse_rrule(raw)
+
+    if m := re.fullmatch(r"every\s+(\d+)\s+(day|week)s?", lowered):
+        interval = _positive(m[1])
+        return Rule(DAILY, interval) if m[2] == "day" else Rule(WEEKLY, interval)
+    if m := re.fullmatch(r"monthly(?:\s+on)?(?:\s+(?:the|day))?\s+(\d{1,2})(?:st|nd|rd|th)?", lowered):
+        return Rule(MONTHLY, month_day=_month_day(m[1]))
+    words = [w for w in re.split(r"[\s,]+", lowered) if w]
+    if words and all(w in _WEEKDAY_WORDS for w in words):
+        return Rule(WEEKLY, weekdays=tuple(sorted({_WEEKDAY_WORDS[w] for w in words})))
+    raise ValueError(f"Unrecognised recurrence: {text!r}")
+
+
+def _parse_rrule(raw: str) -> Rule:
+    parts = {}
+    for part in raw.upper().removeprefix("RRULE:").split(";"):
+        key, sep, value = part.partition("=")
+        if not sep or not value:
+            raise ValueError(f"Malformed RRULE part: {part!r}")
+        parts[key.strip()] = value.strip()
+
+    freq = parts.pop("FREQ", None)
+    if freq not in (DAILY, WEEKLY, MONTHLY):
+        raise ValueError(f"Unsupported FREQ: {freq!r}")
+    interval = _positive(parts.pop("INTERVAL", "1"))
+    weekdays: tuple[int, ...] = ()
+    month_day = None
+    if "BYDAY" in parts:
+        if freq != WEEKLY:
+            raise ValueError("BYDAY is only supported with FREQ=WEEKLY")
+        codes = parts.pop("BYDAY").split(",")
+        if any(code not in WEEKDAY_CODES for code in codes):
+            raise ValueError(f"Unsupported BYDAY: {','.join(codes)!r}")
+        weekdays = tuple(sorted({WEEKDAY_CODES.index(code) for code in codes}))
+    if "BYMONTHDAY" in parts:
+        if freq != MONTHLY:
+            raise ValueError("BYMONTHDAY is only supported with FREQ=MONTHLY")
+        month_day = _month_day(parts.pop("BYMONTHDAY"))
+    if parts:
+        raise ValueError(f"Unsupported RRULE parts: {', '.join(sorted(parts))}")
+    return Rule(freq, interval, weekdays, month_day)
+
+
+def _positive(value: str) -> int:
+    if not value.isdigit() or int(value) < 1:
+        raise ValueError(f"Interval must be a positive whole number, not {value!r}")
+    return int(value)
+
+
+def _month_day(value: str) -> int:
+    if not value.isdigit() or not 1 <= int(value) <= 31:
+        raise ValueError(f"Day of month must be 1-31, not {value!r}")
+    return int(value)
+
+
+def anchor(rule: Rule | None, first_day: int | None) -> Rule | None:
+    """Pin a monthly rule without a day of month to first_day's day of month."""
+    if rule is None or rule.freq != MONTHLY or rule.month_day or first_day is None:
+        return rule
+    return dataclasses.replace(rule, month_day=_month_index(first_day)[1])
+
+
+def format_rule(rule: Rule | None) -> str:
+    """Return the canonical stored form of a rule."""
+    if rule is None:
+        return "none"
+    if rule == Rule(DAILY):
+        return "daily"
+    if rule == Rule(WEEKLY):
+        return "weekly"
+    parts = [f"FREQ={rule.freq}"]
+    if rule.interval != 1:
+        parts.append(f"INTERVAL={rule.interval}")
+    if rule.weekdays:
+        parts.append("BYDAY=" + ",".join(WEEKDAY_CODES[d] for d in rule.weekdays))
+    if rule.month_day is not None:
+        parts.append(f"BYMONTHDAY={rule.month_day}")
+    return ";".join(parts)
+
+
+def normalize(text: str | None, first_day: int | None = None) -> str:
+    """Parse user input and return its canonical stored form (ValueError if invalid).
+
+    first_day is the task's first due day, used to anchor() monthly rules.
+    """
+    return format_rule(anchor(parse(text), first_day))
+
+
+def describe(text: str | None) -> str:
+    """Human-readable summary of a stored recurrence, e.g. "Every 2 weeks on Tue"."""
+    try:
+        rule = parse(text)
+    except ValueError:
+        return str(text)
+    if rule is None:
+        return "None"
+    if rule.freq == DAILY:
+        return "Daily" if rule.interval == 1 else f"Every {rule.interval} days"
+    if rule.freq == WEEKLY:
+        every = "Weekly" if rule.interval == 1 else f"Every {rule.interval} weeks"
+        if not rule.weekdays:
+            return every
+        days = ", ".join(_WEEKDAY_NAMES[d] for d in rule.weekdays)
+        return days if rule.interval == 1 else f"{every} on {days}"
+    every = "Monthly" if rule.interval == 1 else f"Every {rule.interval} months"
+    return f"{every} on day {rule.month_day}" if rule.month_day else every
+
+
+# ── Next Occurrence ───────────────────────────────────────────
+
+def _week(day: int) -> int:
+    return (day + 3) // 7  # Monday-based week number
+
+
+@functools.lru_cache(maxsize=4096)
+def _month_index(day: int) -> tuple[int, int]:
+    """(year * 12 + month - 1, day of month) for a day number."""
+    date = datetime.date.fromordinal(_EPOCH_ORDINAL + day)
+    return date.year * 12 + date.month - 1, date.day
+
+
+@functools.lru_cache(maxsize=4096)
+def _day_in_month(month_index: int, month_day: int) -> int:
+    """Day number of month_day in a month, clamped to the month's last day."""
+    year, month = divmod(month_index, 12)
+    first = datetime.date(year, month + 1, 1).toordinal()
+    next_year, next_month = divmod(month_index + 1, 12)
+    length = datetime.date(next_year, next_month + 1, 1).toordinal() - first
+    return first - _EPOCH_ORDINAL + min(month_day, length) - 1
+
+
+def next_occurrence(rule: Rule, base: int, after: int | None = None) -> int:
+    """First occurrence of the series anchored at day `base` that is after `after`.
+
+    `after` defaults to `base`, giving the instance that follows the one due
+    on `base`. Occurrences the series has missed since are skipped in O(1),
+    never by stepping through them.
+    """
+    start = base if after is None or after < base else after
+    n = rule.interval
+
+    if rule.freq == DAILY or (rule.freq == WEEKLY and not rule.weekdays):
+        step = n if rule.freq == DAILY else 7 * n
+        return base + ((start - base) // step + 1) * step
+
+    if rule.freq == WEEKLY:
+        t = start + 1
+        week0 = _week(base)
+        week = _week(t)
+        offset = (week - week0) % n
+        if offset:
+            week += n - offset
+            wd = -1
+        else:
+            wd = weekday(t) - 1
+        for d in rule.weekdays:
+            if d > wd:
+                return week * 7 - 3 + d
+        return (week + n) * 7 - 3 + rule.weekdays[0]
+
+    month0, base_dom = _month_index(base)
+    month_day = rule.month_day or base_dom
+    t = start + 1
+    month, _ = _month_index(t)
+    offset = (month - month0) % n
+    if offset:
+        month += n - offset
+    else:
+        candidate = _day_in_month(month, month_day)
+        if candidate >= t:
+            return candidate
+        month += n
+    return _day_in_month(month, month_day)
+
+
+def _weekday_gaps(weekdays: tuple[int, ...]) -> tuple[int, ...]:
+    """For each weekday, days until the first of `weekdays` on or after it."""
+    return tuple(min((d - w) % 7 for d in weekdays) for w in range(7))
+
+
+def _table_occurrences(rule: Rule, bases: list[int], floor: int) -> list[int]:
+    """Multi-week BYDAY and monthly rules for a group of series sharing a rule.
+
+    Every series of the rule falls into one of `interval` phases (which
+    weeks or months are "on"). One sorted table of occurrence days per phase
+    is built across the group's date range, after which each series is a
+    bisect into its phase's table instead of a run of date conversions.
+    """
+    n = rule.interval
+    lo = min(bases)
+    hi = max(floor, max(bases)) + 1
+    tables: list[list[int]] = [[] for _ in range(n)]
+
+    if rule.freq == WEEKLY:
+        for week in range(_week(lo), _week(hi) + n + 1):
+            monday = week * 7 - 3
+            tables[week % n].extend(monday + d for d in rule.weekdays)
+        phases = [_week(b) % n for b in bases]
+    else:
+        first_month = _month_index(lo)[0]
+        last_month = _month_index(hi)[0] + n + 1
+        month_of: list[int] = []
+        for month in range(first_month, last_month + 1):
+            day = _day_in_month(month, rule.month_day)
+            tables[month % n].append(day)
+            length = _day_in_month(month + 1, 1) - _day_in_month(month, 1)
+            month_of.extend([month] * length)
+        origin = _day_in_month(first_month, 1)
+        phases = [month_of[b - origin] % n for b in bases]
+
+    return [
+        table[bisect.bisect_right(table, floor if floor > b else b)]
+        for table, b in zip((tables[p] for p in phases), bases)
+    ]
+
+
+def next_occurrences(
+    recurrences: Sequence[str],
+    bases: Sequence[int],
+    after: int | None = None,
+) -> list[int | None]:
+    """next_occurrence() over many series at once.
+
+    recurrences are stored strings, parsed once per distinct value; the
+    result is None for series that don't repeat or whose rule doesn't parse.
+    Series are grouped by rule and each group runs one specialised loop:
+    fixed-step rules are pure arithmetic, weekly BYDAY rules a table lookup
+    and the rest a bisect into per-phase occurrence tables.
+    """
+    groups: dict[str, list[int]] = {}
+    for i, text in enumerate(recurrences):
+        groups.setdefault(text, []).append(i)
+
+    out: list[int | None] = [None] * len(recurrences)
+    floor = after if after is not None else -(1 << 62)
+    for text, indices in groups.items():
+        try:
+            rule = parse(text)
+        except ValueError:
+            rule = None
+        if rule is None:
+            continue
+        group_bases = [bases[i] for i in indices]
+        if rule.freq == DAILY or (rule.freq == WEEKLY and not rule.weekdays):
+            step = rule.interval * (1 if rule.freq == DAILY else 7)
+            days = [
+                b + ((floor - b) // step + 1) * step if floor > b else b + step
+                for b in group_bases
+            ]
+        elif rule.freq == WEEKLY and rule.interval == 1:
+            gaps = _weekday_gaps(rule.weekdays)
+            days = [
+                t + gaps[(t + 3) % 7]  # weekday(t), inlined for the hot loop
+                for t in ((floor if floor > b else b) + 1 for b in group_bases)
+            ]
+        elif rule.freq == MONTHLY and rule.month_day is None:
+            # Day of month comes from each series' own base
+            days = [next_occurrence(rule, b, after) for b in group_bases]
+        else:
+            days = _table_occurrences(rule, group_bases, floor)
+        for i, day in zip(indices, days):
+            out[i] = day
+    return out
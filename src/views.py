@@ -1,146 +1,173 @@
 """ALL discord.ui.View and Button subclasses live here."""
 
-import datetime
+import asyncio
 import logging
+import re
 
 import discord
 
-from src import db
-from src.embeds import build_task_embed, build_celebration_embed, build_snooze_embed
+from src import db, events, recurrence
+from src.dates import from_day_number, today_day_number
+from src.embeds import build_task_embed
+from src.messaging import LANE_NOTIFY
 from src.scoring import calculate_completion_score, calculate_snooze_penalty
 
 log = logging.getLogger("bother-bot")
 
+# Strong references to fire-and-forget work so it isn't garbage collected
+_background_tasks: set[asyncio.Task] = set()
 
-class TaskView(discord.ui.View):
-    """Persistent view with Done and Snooze buttons for a task.
 
-    timeout=None ensures this view survives bot restarts when
-    re-registered in setup_hook().
+def _spawn(coro, name: str) -> None:
+    """Run follow-up work for an interaction after it has been acknowledged."""
+    task = asyncio.create_task(coro, name=name)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_done)
+
+
+def _background_done(task: asyncio.Task) -> None:
+    _background_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        log.error("Background job %s failed: %s", task.get_name(), task.exception())
+
+
+async def _acknowledge(interaction: discord.Interaction) -> float:
+    """Defer the component interaction and return ms since Discord created it."""
+    await interaction.response.defer()
+    return (discord.utils.utcnow() - interaction.created_at).total_seconds() * 1000
+
+
+class TaskButton(
+    discord.ui.DynamicItem[discord.ui.Button],
+    template=r"(?P<action>done|snooze)_(?P<task_id>[0-9]+)",
+):
+    """Done or Snooze button for a task, routed by its custom ID.
+
+    One class handles every task's buttons: discord.py matches an incoming
+    done_<id>/snooze_<id> custom ID against the template and rebuilds the
+    item from it, so buttons survive restarts without per-task registration.
     """
 
-    def __init__(self, task_id: int):
-        super().__init__(timeout=None)
+    def __init__(self, action: str, task_id: int):
+        if action == "done":
+            button = discord.ui.Button(
+                style=discord.ButtonStyle.success,
+                label="Mark Done",
+                custom_id=f"done_{task_id}",
+            )
+        else:
+            button = discord.ui.Button(
+                style=discord.ButtonStyle.secondary,
+                label="Snooze (1 Day)",
+                custom_id=f"snooze_{task_id}",
+            )
+        super().__init__(button)
+        self.action = action
         self.task_id = task_id
 
-        done_button = discord.ui.Button(
-            style=discord.ButtonStyle.success,
-            label="Mark Done",
-            custom_id=f"done_{task_id}",
-        )
-        done_button.callback = self.done_callback
-        self.add_item(done_button)
-
-        snooze_button = discord.ui.Button(
-            style=discord.ButtonStyle.secondary,
-            label="Snooze (1 Day)",
-            custom_id=f"snooze_{task_id}",
-        )
-        snooze_button.callback = self.snooze_callback
-        self.add_item(snooze_button)
+    @classmethod
+    async def from_custom_id(
+        cls,
+        interaction: discord.Interaction,
+        item: discord.ui.Button,
+        match: re.Match[str],
+    ) -> "TaskButton":
+        return cls(match["action"], int(match["task_id"]))
+
+    async def callback(self, interaction: discord.Interaction) -> None:
+        if self.action == "done":
+            await self.done_callback(interaction)
+        else:
+            await self.snooze_callback(interaction)
 
     async def done_callback(self, interaction: discord.Interaction) -> None:
-        """Mark the task as completed, update score, edit embed, remove buttons."""
-        task = await db.get_task(self.task_id)
-        if not task:
-            await interaction.response.send_message("Task not found.", ephemeral=True)
-            return
+        """Mark the task as completed, update score, edit embed, remove buttons.
 
-        if task["status"] == "completed":
-            await interaction.response.send_message(
-                "This task is already done!", ephemeral=True
-            )
+        Acknowledges first so slow DB or Discord calls can't miss the
+        3-second interaction deadline; recurring task regeneration runs in
+        the background afterwards and the celebration post is left to the
+        event bus subscribers.
+        """
+        ack_ms = await _acknowledge(interaction)
+
+        # Compare-and-set: only one of several concurrent clicks wins
+        score_delta = calculate_completion_score()
+        task = await db.complete_task(self.task_id, score_delta)
+        if not task:
+            existing = await db.get_task(self.task_id)
+            message = "This task is already done!" if existing else "Task not found."
+            await interaction.followup.send(message, ephemeral=True)
             return
 
         uid = task["discord_id"]
-
-        # Update DB
-        await db.update_task_status(self.task_id, "completed")
-        score_delta = calculate_completion_score()
-        await db.update_score(uid, score_delta)
+        await interaction.client.events.publish(
+            events.TASK_COMPLETED,
+            task_id=self.task_id,
+            discord_id=uid,
+            description=task["description"],
+            score_delta=score_delta,
+        )
 
         # Edit the message: green embed, no buttons
         embed = build_task_embed(
             task["description"], "completed", task["due_date"], task["recurrence"]
         )
         try:
-            await interaction.response.edit_message(embed=embed, view=None)
+            await interaction.edit_original_response(embed=embed, view=None)
         except discord.HTTPException as e:
             log.error("Failed to edit task %d message: %s", self.task_id, e)
 
-        # Send celebration to meat grinder (if configured)
-        meat_grinder_id = await db.get_config("meat_grinder_channel_id")
-        if meat_grinder_id:
-            channel = interaction.client.get_channel(int(meat_grinder_id))
-            if channel:
-                try:
-                    member = interaction.guild.get_member(int(uid))
-                    name = member.display_name if member else f"User {uid}"
-                    celeb_embed = build_celebration_embed(name, task["description"])
-                    await channel.send(embed=celeb_embed)
-                except (discord.Forbidden, discord.HTTPException) as e:
-                    log.warning("Failed to send celebration for task %d: %s", self.task_id, e)
-
-        # Regenerate recurring task immediately
-        if task["recurrence"] != "none":
-            if task["due_date"]:
-                try:
-                    base = datetime.datetime.strptime(task["due_date"], "%Y-%m-%d")
-                except ValueError:
-                    base = datetime.datetime.now(datetime.timezone.utc)
-            else:
-                base = datetime.datetime.now(datetime.timezone.utc)
-
-            delta = datetime.timedelta(
-                days=1 if task["recurrence"] == "daily" else 7
-            )
-            next_due = (base + delta).strftime("%Y-%m-%d")
-
-            new_id = await db.add_task(
-                uid, task["description"], next_due, task["recurrence"]
-            )
-            new_embed = build_task_embed(
-                task["description"], "pending", next_due, task["recurrence"]
-            )
-            new_view = TaskView(task_id=new_id)
+        _spawn(self._after_done(interaction, task), f"after-done-{self.task_id}")
+        log.info(
+            "Task %d completed by %s (+%d pts, acked in %.0f ms)",
+            self.task_id, uid, score_delta, ack_ms,
+        )
 
-            # Send to user's private channel
-            user = await db.get_user(uid)
-            if user and user["private_channel_id"]:
-                priv_ch = interaction.client.get_channel(
-                    int(user["private_channel_id"])
-                )
-                if priv_ch:
-                    try:
-                        new_msg = await priv_ch.send(embed=new_embed, view=new_view)
-                        await db.update_task_message_id(new_id, str(new_msg.id))
-                    except (discord.Forbidden, discord.HTTPException) as e:
-                        log.warning("Failed to send recurring task %d: %s", new_id, e)
-
-            interaction.client.add_view(new_view)
-            log.info(
-                "Recurring task regenerated: %d -> %d (%s, due %s)",
-                self.task_id, new_id, task["recurrence"], next_due,
-            )
+    async def _after_done(self, interaction: discord.Interaction, task) -> None:
+        """Regenerate a completed recurring task."""
+        uid = task["discord_id"]
 
-        # Auto-refresh the board
+        # Regenerate recurring task immediately
         try:
-            from src.cogs.accountability import refresh_board
-            await refresh_board(interaction.client)
-        except Exception as e:
-            log.warning("Failed to refresh board after task %d completion: %s", self.task_id, e)
-
-        log.info("Task %d completed by %s (+%d pts)", self.task_id, uid, score_delta)
+            rule = recurrence.parse(task["recurrence"])
+        except ValueError:
+            log.warning("Task %d has an unreadable recurrence %r", self.task_id, task["recurrence"])
+            return
+        if rule is not None:
+            base = task["due_day"] if task["due_day"] is not None else today_day_number()
+            next_due = from_day_number(recurrence.next_occurrence(rule, base))
+
+            # Idempotent: a series gets one next instance however often this
+            # runs; the outbox worker posts it to the user's private channel
+            for new in await db.create_next_instances(
+                {self.task_id: next_due}, post_lane=LANE_NOTIFY
+            ):
+                await interaction.client.events.publish(
+                    events.TASK_CREATED,
+                    task_id=new["id"],
+                    discord_id=uid,
+                    description=new["description"],
+                    due_date=new["due_date"],
+                )
+                log.info(
+                    "Recurring task regenerated: %d -> %d (%s, due %s)",
+                    self.task_id, new["id"], new["recurrence"], next_due,
+                )
 
     async def snooze_callback(self, interaction: discord.Interaction) -> None:
-        """Snooze the task by 1 day, deduct points, update embed."""
+        """Snooze the task by 1 day, deduct points, update embed.
+
+        Acknowledges first; the meat grinder notification is left to the
+        event bus subscribers.
+        """
+        ack_ms = await _acknowledge(interaction)
         task = await db.get_task(self.task_id)
         if not task:
-            await interaction.response.send_message("Task not found.", ephemeral=True)
+            await interaction.followup.send("Task not found.", ephemeral=True)
             return
 
         if task["status"] == "completed":
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 "This task is already done!", ephemeral=True
             )
             return
@@ -148,55 +175,50 @@ class TaskView(discord.ui.View):
         uid = task["discord_id"]
 
         # Calculate new due date
-        if task["due_date"]:
-            try:
-                current_due = datetime.datetime.strptime(task["due_date"], "%Y-%m-%d")
-            except ValueError:
-                current_due = datetime.datetime.now(datetime.timezone.utc)
-        else:
-            current_due = datetime.datetime.now(datetime.timezone.utc)
+        current_due = task["due_day"] if task["due_day"] is not None else today_day_number()
+        new_due_str = from_day_number(current_due + 1)
 
-        new_due = current_due + datetime.timedelta(days=1)
-        new_due_str = new_due.strftime("%Y-%m-%d")
-
-        # Update DB
-        await db.update_task_due_date(self.task_id, new_due_str)
-        # Reset status to pending if it was overdue
-        if task["status"] == "overdue":
-            await db.update_task_status(self.task_id, "pending")
+        # Compare-and-set against the due date we read; an overdue task goes
+        # back to pending. A concurrent snooze or completion makes this lose.
         score_delta = calculate_snooze_penalty()
-        await db.update_score(uid, score_delta)
+        if not await db.snooze_task(self.task_id, task["due_day"], new_due_str, score_delta):
+            await interaction.followup.send(
+                "This task just changed. Try again.", ephemeral=True
+            )
+            return
+        await interaction.client.events.publish(
+            events.TASK_SNOOZED,
+            task_id=self.task_id,
+            discord_id=uid,
+            description=task["description"],
+            due_date=new_due_str,
+            score_delta=score_delta,
+        )
 
         # Edit the message with updated due date
         embed = build_task_embed(
             task["description"], "pending", new_due_str, task["recurrence"]
         )
         try:
-            await interaction.response.edit_message(embed=embed, view=self)
+            await interaction.edit_original_response(embed=embed)
         except discord.HTTPException as e:
             log.error("Failed to edit task %d on snooze: %s", self.task_id, e)
 
-        # Send snooze notification to meat grinder (if configured)
-        meat_grinder_id = await db.get_config("meat_grinder_channel_id")
-        if meat_grinder_id:
-            channel = interaction.client.get_channel(int(meat_grinder_id))
-            if channel:
-                try:
-                    member = interaction.guild.get_member(int(uid))
-                    name = member.display_name if member else f"User {uid}"
-                    snooze_embed = build_snooze_embed(name, task["description"])
-                    await channel.send(embed=snooze_embed)
-                except (discord.Forbidden, discord.HTTPException) as e:
-                    log.warning("Failed to send snooze notification for task %d: %s", self.task_id, e)
-
-        # Auto-refresh the board
-        try:
-            from src.cogs.accountability import refresh_board
-            await refresh_board(interaction.client)
-        except Exception as e:
-            log.warning("Failed to refresh board after task %d snooze: %s", self.task_id, e)
-
         log.info(
-            "Task %d snoozed by %s to %s (%d pts)",
-            self.task_id, uid, new_due_str, score_delta,
+            "Task %d snoozed by %s to %s (%d pts, acked in %.0f ms)",
+            self.task_id, uid, new_due_str, score_delta, ack_ms,
         )
+
+
+class TaskView(discord.ui.View):
+    """Done and Snooze buttons for a task message.
+
+    Both buttons are TaskButton dynamic items, which setup_hook() registers
+    once for all tasks, so the view itself is never re-registered.
+    """
+
+    def __init__(self, task_id: int):
+        super().__init__(timeout=None)
+        self.task_id = task_id
+        self.add_item(TaskButton("done", task_id))
+        self.add_item(TaskButton("snooze", task_id))
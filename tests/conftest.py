@@ -0,0 +1,31 @@
+"""Shared fixtures: a throwaway SQLite file and the connection pool over it."""
+
+import pytest
+import pytest_asyncio
+
+import src.constants
+import src.db as db_module
+
+
+@pytest.fixture
+def tmp_db(tmp_path, monkeypatch):
+    """Point DB_PATH at a temp file."""
+    db_path = str(tmp_path / "test.db")
+    monkeypatch.setattr(src.constants, "DB_PATH", db_path)
+    monkeypatch.setattr(db_module, "DB_PATH", db_path)
+    return db_path
+
+
+@pytest_asyncio.fixture
+async def bare_db_pool(tmp_db):
+    """The shared connection pool over an empty DB; the test runs init_db()."""
+    await db_module.open_pool()
+    yield
+    await db_module.close_pool()
+
+
+@pytest_asyncio.fixture
+async def db_pool(bare_db_pool):
+    """The shared connection pool over a fully migrated DB, as the bot runs."""
+    await db_module.init_db()
+    yield
@@ -0,0 +1,414 @@
+"""Tests for src/board.py — board data assembly and refresh scheduling."""
+
+import asyncio
+import datetime
+import json
+import types
+
+import discord
+import pytest
+
+import src.db as db_module
+from src import board
+from src.embeds import build_board_embed
+
+
+class _Member:
+    def __init__(self, name):
+        self.display_name = name
+
+
+class _Guild:
+    def __init__(self, members):
+        self.members = members
+
+    def get_member(self, member_id):
+        return self.members.get(member_id)
+
+
+class _Partial:
+    def __init__(self, channel, message_id):
+        self.channel = channel
+        self.id = message_id
+
+    async def edit(self, **fields):
+        if self.id not in self.channel.messages:
+            raise discord.NotFound(types.SimpleNamespace(status=404, reason="Not Found"), "gone")
+        self.channel.messages[self.id] = fields["embed"]
+        self.channel.edits += 1
+
+    async def delete(self):
+        if self.channel.messages.pop(self.id, None) is None:
+            raise discord.NotFound(types.SimpleNamespace(status=404, reason="Not Found"), "gone")
+        self.channel.deletes += 1
+
+
+class _SentMessage:
+    def __init__(self, message_id):
+        self.id = message_id
+
+
+class _Channel:
+    def __init__(self, guild):
+        self.guild = guild
+        self.messages: dict[int, discord.Embed] = {}
+        self.next_id = 500
+        self.edits = self.sends = self.deletes = 0
+
+    def get_partial_message(self, message_id):
+        return _Partial(self, message_id)
+
+    async def send(self, **fields):
+        self.sends += 1
+        self.next_id += 1
+        self.messages[self.next_id] = fields["embed"]
+        return _SentMessage(self.next_id)
+
+    def titles(self):
+        return [self.messages[mid].title for mid in sorted(self.messages)]
+
+
+class _Bot:
+    def __init__(self, channel):
+        self.channel = channel
+
+    def get_channel(self, channel_id):
+        return self.channel
+
+
+# ── build_users_data ────────────────────────────────────────────
+
+def test_build_users_data_groups_rows_by_user():
+    rows = [
+        {"discord_id": "1", "score": 10, "task_id": 1, "description": "A", "status": "pending"},
+        {"discord_id": "1", "score": 10, "task_id": 2, "description": "B", "status": "overdue"},
+        {"discord_id": "2", "score": 0, "task_id": None, "description": None, "status": None},
+    ]
+    users = board.build_users_data(_Guild({1: _Member("Alice")}), rows)
+    assert users[0] == {
+        "name": "Alice",
+        "score": 10,
+        "tasks": [
+            {"description": "A", "status": "pending"},
+            {"description": "B", "status": "overdue"},
+        ],
+    }
+    assert users[1] == {"name": "User 2", "score": 0, "tasks": []}
+
+
+# ── BoardModel ──────────────────────────────────────────────────
+
+@pytest.mark.asyncio
+async def test_model_load_matches_db_query(db_pool):
+    await db_module.add_user("1")
+    await db_module.add_user("2")
+    await db_module.update_score("2", 5)
+    await db_module.add_task("1", "A", "2026-12-31", "none")
+    tid = await db_module.add_task("2", "B", "2026-12-31", "none")
+    await db_module.update_task_status(tid, "overdue")
+
+    model = board.BoardModel()
+    await model.load()
+    guild = _Guild({})
+    rows = await db_module.get_all_users_with_tasks()
+    key = lambda u: u["name"]
+    assert sorted(model.users_data(guild), key=key) == sorted(
+        board.build_users_data(guild, rows), key=key
+    )
+
+
+def test_model_applies_lifecycle_changes():
+    changes = []
+    model = board.BoardModel(on_change=lambda: changes.append(1))
+    model.user_added("1")
+    model.task_added(10, "1", "Laundry")
+    model.task_added(11, "1", "Dishes")
+    model.task_updated(10, status="completed")
+    model.score_changed("1", 10)
+    model.task_updated(11, description="Wash dishes")
+    model.task_removed(11)
+    model.task_updated(99, status="overdue")  # unknown task is ignored
+
+    [user] = model.users_data(_Guild({1: _Member("Alice")}))
+    assert user == {
+        "name": "Alice",
+        "score": 10,
+        "tasks": [{"description": "Laundry", "status": "completed"}],
+    }
+    assert len(changes) == 7
+
+
+def test_model_caps_recent_completions():
+    model = board.BoardModel(recent_completed=2)
+    for tid in range(1, 5):
+        model.task_added(tid, "1", f"T{tid}")
+        model.task_updated(tid, status="completed")
+    model.task_added(5, "1", "Active")
+    [user] = model.users_data(_Guild({}))
+    assert [t["description"] for t in user["tasks"]] == ["T3", "T4", "Active"]
+
+    model.task_removed(4)
+    model.task_updated(5, status="completed")
+    [user] = model.users_data(_Guild({}))
+    assert [t["description"] for t in user["tasks"]] == ["T3", "Active"]
+
+
+@pytest.mark.asyncio
+async def test_refresh_board_renders_from_loaded_model(db_pool, monkeypatch):
+    channel = _Channel(_Guild({}))
+    bot = _Bot(channel)
+    bot.board_model = board.BoardModel()
+    await bot.board_model.load()
+    await db_module.set_config("board_channel_id", "10")
+
+    async def no_query():
+        raise AssertionError("board query should not run with a loaded model")
+
+    monkeypatch.setattr(db_module, "get_all_users_with_tasks", no_query)
+    bot.board_model.task_added(1, "1", "From memory")
+    await board.refresh_board(bot)
+    assert channel.sends == 1
+
+
+# ── Content hash ────────────────────────────────────────────────
+
+def test_content_hash_ignores_timestamp():
+    users = [{"name": "A", "score": 1, "tasks": []}]
+    first = build_board_embed(users)
+    second = build_board_embed(users)
+    second.timestamp = first.timestamp + datetime.timedelta(minutes=5)
+    assert board.board_content_hash(first) == board.board_content_hash(second)
+
+
+def test_content_hash_changes_with_content():
+    a = build_board_embed([{"name": "A", "score": 1, "tasks": []}])
+    b = build_board_embed([{"name": "A", "score": 2, "tasks": []}])
+    assert board.board_content_hash(a) != board.board_content_hash(b)
+
+
+@pytest.mark.asyncio
+async def test_refresh_board_skips_unchanged_content(db_pool):
+    channel = _Channel(_Guild({}))
+    bot = _Bot(channel)
+    await db_module.add_user("1")
+    await db_module.set_config("board_channel_id", "10")
+
+    await board.refresh_board(bot)  # first render posts the board
+    skipped = board.stats["edits_skipped"]
+    await board.refresh_board(bot)
+    assert (channel.sends, channel.edits) == (1, 0)
+    assert board.stats["edits_skipped"] == skipped + 1
+
+    await db_module.update_score("1", 10)
+    await board.refresh_board(bot)
+    assert channel.edits == 1
+
+
+
+@pytest.mark.asyncio
+async def test_refresh_board_reports_pages_it_could_not_publish(db_pool, monkeypatch):
+    channel = _Channel(_Guild({}))
+    bot = _Bot(channel)
+    await db_module.add_user("1")
+    await db_module.set_config("board_channel_id", "10")
+    assert await board.refresh_board(bot) is True
+
+    async def unavailable(self, **fields):
+        raise discord.HTTPException(types.SimpleNamespace(status=503, reason="down"), "down")
+
+    monkeypatch.setattr(_Partial, "edit", unavailable)
+    monkeypatch.setattr(_Channel, "send", unavailable)
+    await db_module.update_score("1", 10)
+    assert await board.refresh_board(bot) is False  # edit failed
+
+    await board.clear_board_messages()
+    assert await board.refresh_board(bot) is False  # send failed
+
+
+# ── Pagination ──────────────────────────────────────────────────
+
+async def _add_users(count, tasks_each=0):
+    for i in range(count):
+        uid = str(i + 1)
+        await db_module.add_user(uid)
+        for t in range(tasks_each):
+            await db_module.add_task(uid, f"Task {t} " + "z" * 120, "2026-12-31", "none")
+
+
+@pytest.mark.asyncio
+async def test_refresh_board_posts_one_message_per_page(db_pool):
+    channel = _Channel(_Guild({}))
+    await _add_users(60)
+    await db_module.set_config("board_channel_id", "10")
+
+    await board.refresh_board(_Bot(channel))
+
+    assert channel.sends == 3
+    assert channel.titles() == [f"Accountability Board ({i}/3)" for i in (1, 2, 3)]
+    ids = json.loads(await db_module.get_config("board_message_ids"))
+    assert ids == [str(mid) for mid in sorted(channel.messages)]
+
+
+@pytest.mark.asyncio
+async def test_refresh_board_edits_only_changed_pages(db_pool):
+    channel = _Channel(_Guild({}))
+    await _add_users(60)
+    await db_module.update_score("60", -1)  # lowest score: last page
+    await db_module.set_config("board_channel_id", "10")
+    bot = _Bot(channel)
+    await board.refresh_board(bot)
+
+    await db_module.add_task("60", "New", "2026-12-31", "none")
+    await board.refresh_board(bot)
+    assert channel.edits == 1
+    assert "New" in channel.messages[max(channel.messages)].fields[-1].value
+
+
+@pytest.mark.asyncio
+async def test_refresh_board_shrinks_and_grows_pages(db_pool, monkeypatch):
+    channel = _Channel(_Guild({}))
+    await db_module.set_config("board_channel_id", "10")
+    bot = _Bot(channel)
+    page_count = 3
+
+    def fake_pages(users_data):
+        return [
+            build_board_embed([], page=i, pages=page_count)
+            for i in range(1, page_count + 1)
+        ]
+
+    monkeypatch.setattr(board, "build_board_pages", fake_pages)
+    await board.refresh_board(bot)
+    assert len(channel.messages) == 3
+
+    page_count = 1
+    await board.refresh_board(bot)
+    assert channel.titles() == ["Accountability Board"]
+    assert channel.deletes == 2
+    assert len(json.loads(await db_module.get_config("board_message_ids"))) == 1
+
+    page_count = 2
+    await board.refresh_board(bot)
+    assert channel.titles() == ["Accountability Board (1/2)", "Accountability Board (2/2)"]
+
+
+@pytest.mark.asyncio
+async def test_refresh_board_reposts_after_deleted_page(db_pool):
+    channel = _Channel(_Guild({}))
+    await _add_users(60)
+    await db_module.set_config("board_channel_id", "10")
+    bot = _Bot(channel)
+    await board.refresh_board(bot)
+    first, second, third = sorted(channel.messages)
+    del channel.messages[second]
+
+    # Forget the published hashes so every page is re-checked
+    await db_module.delete_config("board_content_hashes")
+    await board.refresh_board(bot)
+
+    assert first in channel.messages and third not in channel.messages
+    assert channel.titles() == [f"Accountability Board ({i}/3)" for i in (1, 2, 3)]
+
+
+@pytest.mark.asyncio
+async def test_refresh_board_adopts_legacy_single_message(db_pool):
+    channel = _Channel(_Guild({}))
+    await _add_users(1)
+    await db_module.set_config("board_channel_id", "10")
+    channel.messages[42] = None
+    await db_module.set_config("board_message_id", "42")
+
+    await board.refresh_board(_Bot(channel))
+    assert channel.sends == 0 and channel.edits == 1
+    assert await db_module.get_config("board_message_ids") == json.dumps(["42"])
+    assert await db_module.get_config("board_message_id") is None
+
+
+# ── BoardRefreshScheduler ───────────────────────────────────────
+
+@pytest.fixture
+def renders(monkeypatch):
+    calls = []
+
+    async def fake_refresh(bot):
+        calls.append(bot)
+        return True
+
+    monkeypatch.setattr(board, "refresh_board", fake_refresh)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_scheduler_coalesces_bursts(renders):
+    scheduler = board.BoardRefreshScheduler(bot="bot", interval=0.05)
+    scheduler.start()
+    for _ in range(50):
+        scheduler.mark_dirty()
+    await asyncio.sleep(0.01)
+    for _ in range(50):
+        scheduler.mark_dirty()
+    await asyncio.sleep(0.1)
+    await scheduler.stop()
+    assert scheduler.requests == 100
+    assert len(renders) == 2
+
+
+@pytest.mark.asyncio
+async def test_scheduler_idle_without_requests(renders):
+    scheduler = board.BoardRefreshScheduler(bot="bot", interval=0.01)
+    scheduler.start()
+    await asyncio.sleep(0.03)
+    await scheduler.stop()
+    assert renders == []
+
+
+@pytest.mark.asyncio
+async def test_flush_renders_immediately_and_absorbs_pending(renders):
+    scheduler = board.BoardRefreshScheduler(bot="bot", interval=0.01)
+    scheduler.mark_dirty()
+    await scheduler.flush()
+    assert len(renders) == 1
+    scheduler.start()
+    await asyncio.sleep(0.03)
+    await scheduler.stop()
+    assert len(renders) == 1
+
+
+@pytest.mark.asyncio
+async def test_retry_if_stale_only_after_a_failed_render(monkeypatch):
+    async def failing_refresh(bot):
+        raise discord.HTTPException(types.SimpleNamespace(status=503, reason="down"), "down")
+
+    scheduler = board.BoardRefreshScheduler(bot="bot", interval=0.01)
+    scheduler.retry_if_stale()
+    assert scheduler.requests == 0
+
+    monkeypatch.setattr(board, "refresh_board", failing_refresh)
+    await scheduler.flush()
+    assert scheduler.stale
+    scheduler.retry_if_stale()
+    assert scheduler.requests == 1
+
+    async def ok_refresh(bot):
+        return True
+
+    monkeypatch.setattr(board, "refresh_board", ok_refresh)
+    await scheduler.flush()
+    assert not scheduler.stale
+
+
+@pytest.mark.asyncio
+async def test_scheduler_marks_partial_render_stale(monkeypatch):
+    results = [False, True]
+
+    async def partial_refresh(bot):
+        return results.pop(0)
+
+    monkeypatch.setattr(board, "refresh_board", partial_refresh)
+    scheduler = board.BoardRefreshScheduler(bot="bot", interval=0.01)
+    await scheduler.flush()
+    assert scheduler.stale
+    scheduler.retry_if_stale()
+    assert scheduler.requests == 1
+    await scheduler.flush()
+    assert not scheduler.stale
@@ -0,0 +1,96 @@
+"""Tests for src/command_sync.py — fingerprint-gated command tree sync."""
+
+import types
+
+import discord
+import pytest
+from discord import app_commands
+
+import src.db as db_module
+from src import command_sync
+
+GUILD = discord.Object(id=1234)
+
+
+def _tree():
+    tree = app_commands.CommandTree(discord.Client(intents=discord.Intents.none()))
+
+    @tree.command(name="ping", description="Ping")
+    async def ping(interaction: discord.Interaction) -> None:
+        pass
+
+    synced = []
+
+    async def sync(*, guild=None):
+        synced.append(guild)
+        return []
+
+    tree.sync = sync
+    return tree, synced
+
+
+def test_fingerprint_tracks_command_changes():
+    tree, _ = _tree()
+    before = command_sync.tree_fingerprint(tree)
+    assert command_sync.tree_fingerprint(tree) == before
+
+    @tree.command(name="pong", description="Pong")
+    async def pong(interaction: discord.Interaction) -> None:
+        pass
+
+    assert command_sync.tree_fingerprint(tree) != before
+
+
+@pytest.mark.asyncio
+async def test_sync_only_when_tree_changes(db_pool):
+    tree, synced = _tree()
+    assert await command_sync.sync_commands(tree) is True
+    assert await command_sync.sync_commands(tree) is False
+    assert synced == [None]
+    assert await db_module.get_config("command_tree_hash:global") == command_sync.tree_fingerprint(tree)
+
+    tree.get_command("ping").description = "Ping the bot"
+    assert await command_sync.sync_commands(tree) is True
+    assert len(synced) == 2
+
+
+@pytest.mark.asyncio
+async def test_scopes_are_tracked_separately_and_force_always_syncs(db_pool):
+    tree, synced = _tree()
+    tree.copy_global_to(guild=GUILD)
+    await command_sync.sync_commands(tree)
+    assert await command_sync.sync_commands(tree, GUILD) is True
+    assert await db_module.get_config("command_tree_hash:1234") is not None
+
+    assert await command_sync.sync_commands(tree, GUILD, force=True) is True
+    assert synced == [None, GUILD, GUILD]
+
+
+class _Interaction:
+    def __init__(self):
+        self.user = types.SimpleNamespace(id=1)
+        self.replies = []
+        self.response = types.SimpleNamespace(defer=self._defer)
+        self.followup = types.SimpleNamespace(send=self._send)
+
+    async def _defer(self, **kwargs):
+        self.replies.append("defer")
+
+    async def _send(self, content, **kwargs):
+        self.replies.append(content)
+
+
+@pytest.mark.asyncio
+async def test_force_sync_reports_http_failure(db_pool):
+    from src.cogs.accountability import AccountabilityCog
+
+    tree, _ = _tree()
+
+    async def failing_sync(*, guild=None):
+        raise discord.HTTPException(types.SimpleNamespace(status=503, reason="down"), "down")
+
+    tree.sync = failing_sync
+    cog = AccountabilityCog(types.SimpleNamespace(tree=tree, command_scope=None))
+    interaction = _Interaction()
+    await AccountabilityCog.force_sync.callback(cog, interaction)
+    assert interaction.replies == ["defer", "Command sync failed: 503 down"]
@@ -0,0 +1,41 @@
+"""Tests for src/dates.py — pure due-date conversions."""
+
+import datetime
+
+from src.dates import from_day_number, to_day_number, today_day_number, weekday
+
+
+def test_epoch_is_day_zero():
+    assert to_day_number("1970-01-01") == 0
+
+
+def test_day_number_round_trip():
+    assert from_day_number(to_day_number("2026-03-01")) == "2026-03-01"
+
+
+def test_day_numbers_are_ordered():
+    assert to_day_number("2026-02-28") + 1 == to_day_number("2026-03-01")
+
+
+def test_day_number_ignores_time_suffix():
+    assert to_day_number("2026-03-01 10:30:00") == to_day_number("2026-03-01")
+
+
+def test_unparseable_due_date_is_none():
+    assert to_day_number("whenever") is None
+    assert to_day_number("") is None
+    assert to_day_number(None) is None
+
+
+def test_today_day_number_uses_utc():
+    # 23:30 in New York on Mar 1 is already Mar 2 in UTC
+    ny = datetime.timezone(datetime.timedelta(hours=-5))
+    now = datetime.datetime(2026, 3, 1, 23, 30, tzinfo=ny)
+    assert today_day_number(now) == to_day_number("2026-03-02")
+
+
+def test_weekday_is_monday_based():
+    assert weekday(to_day_number("1970-01-01")) == 3  # Thursday
+    for offset in range(14):
+        day = to_day_number("2026-10-12") + offset  # a Monday
+        assert weekday(day) == (datetime.date(2026, 10, 12) + datetime.timedelta(offset)).weekday()
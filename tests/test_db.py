@@ -1,23 +1,19 @@
 """Tests for src/db.py — database CRUD operations."""
 
 import asyncio
+import contextlib
 import os
 import tempfile
 
 import pytest
-import pytest_asyncio  # noqa: F401 — needed for async fixtures
 
-import src.constants
 import src.db as db_module
+from src.dates import to_day_number
 
 
-@pytest.fixture(autouse=True)
-def tmp_db(tmp_path, monkeypatch):
-    """Point DB_PATH at a temp file for every test."""
-    db_path = str(tmp_path / "test.db")
-    monkeypatch.setattr(src.constants, "DB_PATH", db_path)
-    monkeypatch.setattr(db_module, "DB_PATH", db_path)
-    return db_path
+# Every test runs through the shared connection pool, as the bot does,
+# and calls init_db() itself
+pytestmark = pytest.mark.usefixtures("bare_db_pool")
 
 
 # ── Schema ───────────────────────────────────────────────────────
@@ -36,6 +32,109 @@ async def test_init_db_creates_tables(tmp_db):
     assert "tasks" in tables
 
 
+@pytest.mark.asyncio
+async def test_init_db_applies_all_migrations():
+    await db_module.init_db()
+    assert await db_module.get_schema_version() == db_module.MIGRATIONS[-1][0]
+
+
+@pytest.mark.asyncio
+async def test_init_db_is_idempotent():
+    await db_module.init_db()
+    await db_module.add_user("u1")
+    await db_module.init_db()
+    assert await db_module.get_user("u1") is not None
+    assert await db_module.get_schema_version() == db_module.MIGRATIONS[-1][0]
+
+
+@pytest.mark.asyncio
+async def test_migrations_upgrade_legacy_schema(tmp_db):
+    import aiosqlite
+
+    # A deployment created before migrations existed: tables, no schema_version
+    async with aiosqlite.connect(tmp_db) as conn:
+        for statement in db_module.MIGRATIONS[0][2]:
+            await conn.execute(statement)
+        await conn.execute("INSERT INTO users (discord_id) VALUES ('old')")
+        await conn.execute(
+            "INSERT INTO tasks (discord_id, description, due_date) "
+            "VALUES ('old', 'Dated', '2020-01-02'), ('old', 'Undated', 'someday')"
+        )
+        await conn.commit()
+
+    await db_module.init_db()
+    assert await db_module.get_user("old") is not None
+    tasks = {t["description"]: t for t in await db_module.get_tasks_for_user("old")}
+    assert tasks["Dated"]["due_day"] == 18263
+    assert tasks["Undated"]["due_day"] is None
+    assert await db_module.get_schema_version() == db_module.MIGRATIONS[-1][0]
+
+
+@pytest.mark.asyncio
+async def test_migrations_link_legacy_recurring_copies(tmp_db):
+    import aiosqlite
+
+    # Nightly resets used to copy every completed recurring task again
+    async with aiosqlite.connect(tmp_db) as conn:
+        for statement in db_module.MIGRATIONS[0][2]:
+            await conn.execute(statement)
+        await conn.execute("INSERT INTO users (discord_id) VALUES ('old')")
+        await conn.execute(
+            "INSERT INTO tasks (discord_id, description, due_date, status, recurrence) VALUES "
+            "('old', 'Gym', '2020-01-01', 'completed', 'daily'), "
+            "('old', 'Gym', '2020-01-02', 'completed', 'daily'), "
+            "('old', 'Gym', '2020-01-03', 'pending', 'daily'), "
+            "('old', 'Read', '2020-01-01', 'completed', 'weekly')"
+        )
+        await conn.commit()
+
+    await db_module.init_db()
+    tasks = await db_module.get_tasks_for_user("old")
+    links = {t["id"]: (t["series_id"], t["successor_id"]) for t in tasks}
+    assert links == {1: (None, 2), 2: (1, 3), 3: (1, None), 4: (None, None)}
+    due = await db_module.get_series_due_for_next_instance(to_day_number("2020-01-10"))
+    assert [t["description"] for t in due] == ["Read"]
+
+
+@pytest.mark.asyncio
+async def test_hot_path_queries_use_indexes(tmp_db):
+    import aiosqlite
+
+    await db_module.init_db()
+    async with aiosqlite.connect(tmp_db) as conn:
+        cursor = await conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM tasks WHERE discord_id = ? AND status = ?",
+            ("u1", "pending"),
+        )
+        plan = " ".join(row[3] for row in await cursor.fetchall())
+        assert "idx_tasks_user_status" in plan
+
+        cursor = await conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM tasks WHERE status IN ('pending', 'overdue') "
+            "AND due_day <= ?",
+            (20000,),
+        )
+        plan = " ".join(row[3] for row in await cursor.fetchall())
+        assert "idx_tasks_status_due_day" in plan
+
+        cursor = await conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM tasks WHERE status = 'completed' "
+            "AND recurrence != 'none'"
+        )
+        plan = " ".join(row[3] for row in await cursor.fetchall())
+        # Either status-leading index turns the full scan into a search
+        assert plan.startswith("SEARCH tasks USING INDEX idx_tasks_status")
+
+        cursor = await conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM tasks INDEXED BY idx_tasks_series_open "
+            "WHERE status = 'completed' "
+            "AND recurrence != 'none' AND successor_id IS NULL AND due_day <= ?",
+            (20000,),
+        )
+        plan = " ".join(row[3] for row in await cursor.fetchall())
+        assert "idx_tasks_series_open" in plan
+
+
 # ── Users ────────────────────────────────────────────────────────
 
 @pytest.mark.asyncio
@@ -75,6 +174,7 @@ async def test_add_and_get_task():
     assert task is not None
     assert task["description"] == "Test task"
     assert task["status"] == "pending"
+    assert task["due_day"] == to_day_number("2026-12-31")
 
 
 @pytest.mark.asyncio
@@ -153,37 +253,13 @@ async def test_update_score_accumulates():
     assert user["score"] == 15
 
 
-# ── Overdue Candidates ──────────────────────────────────────────
-
-@pytest.mark.asyncio
-async def test_get_overdue_candidates():
-    await db_module.init_db()
-    await db_module.add_user("u123")
-    # Past due date — should be returned
-    await db_module.add_task("u123", "Old task", "2020-01-01", "none")
-    # Future due date — should NOT be returned
-    await db_module.add_task("u123", "Future task", "2099-12-31", "none")
-    candidates = await db_module.get_overdue_candidates()
-    assert len(candidates) == 1
-    assert candidates[0]["description"] == "Old task"
-
+# ── Recurring Series ────────────────────────────────────────────
 
 @pytest.mark.asyncio
-async def test_get_overdue_excludes_completed():
-    await db_module.init_db()
-    await db_module.add_user("u123")
-    tid = await db_module.add_task("u123", "Done task", "2020-01-01", "none")
-    await db_module.update_task_status(tid, "completed")
-    candidates = await db_module.get_overdue_candidates()
-    assert len(candidates) == 0
-
-
-# ── Completed Recurring Tasks ───────────────────────────────────
-
-@pytest.mark.asyncio
-async def test_get_completed_recurring_tasks():
+async def test_get_series_due_for_next_instance():
     await db_module.init_db()
     await db_module.add_user("u123")
+    today = to_day_number("2026-12-31")
     # Completed + recurring — should be returned
     t1 = await db_module.add_task("u123", "Daily task", "2026-12-31", "daily")
     await db_module.update_task_status(t1, "completed")
@@ -192,11 +268,42 @@ async def test_get_completed_recurring_tasks():
     await db_module.update_task_status(t2, "completed")
     # Pending + recurring — should NOT be returned
     await db_module.add_task("u123", "Pending daily", "2026-12-31", "daily")
+    # Completed early, not due until later — should NOT be returned
+    t3 = await db_module.add_task("u123", "Next year", "2027-01-05", "weekly")
+    await db_module.update_task_status(t3, "completed")
 
-    results = await db_module.get_completed_recurring_tasks()
+    results = await db_module.get_series_due_for_next_instance(today)
     assert len(results) == 1
     assert results[0]["description"] == "Daily task"
 
+    # Once its next instance exists it drops out
+    await db_module.create_next_instances({t1: "2027-01-01"})
+    assert await db_module.get_series_due_for_next_instance(today) == []
+
+
+@pytest.mark.asyncio
+async def test_create_next_instances_is_idempotent():
+    await db_module.init_db()
+    await db_module.add_user("u1")
+    t1 = await db_module.add_task("u1", "Gym", "2026-03-01", "daily")
+    await db_module.update_task_status(t1, "completed")
+
+    first, second = await asyncio.gather(
+        db_module.create_next_instances({t1: "2026-03-02"}, post_lane=3),
+        db_module.create_next_instances({t1: "2026-03-02"}, post_lane=3),
+    )
+    created = first + second
+    assert len(created) == 1
+    new = await db_module.get_task(created[0]["id"])
+    assert (new["due_date"], new["series_id"], new["status"]) == ("2026-03-02", t1, "pending")
+    assert (await db_module.get_task(t1))["successor_id"] == new["id"]
+    assert len(await db_module.get_due_outbox(10**12, 10)) == 1
+
+    # The next generation stays in the same series
+    await db_module.update_task_status(new["id"], "completed")
+    [third] = await db_module.create_next_instances({new["id"]: "2026-03-03"})
+    assert (await db_module.get_task(third["id"]))["series_id"] == t1
+
 
 # ── Private Channel ─────────────────────────────────────────────
 
@@ -221,3 +328,156 @@ async def test_get_all_users_with_tasks():
     await db_module.add_task("u2", "Task C", "2026-12-31", "none")
     rows = await db_module.get_all_users_with_tasks()
     assert len(rows) == 3  # 2 tasks for u1, 1 for u2
+
+
+# ── Connection Pool ─────────────────────────────────────────────
+
+@pytest.mark.asyncio
+async def test_pool_reuses_connections():
+    await db_module.init_db()
+    pool = db_module._pool
+    readers_before = list(pool._reader_conns)
+    writer_before = pool._writer
+    await db_module.add_user("u1")
+    await db_module.get_user("u1")
+    assert pool._reader_conns == readers_before
+    assert pool._writer is writer_before
+
+
+@pytest.mark.asyncio
+async def test_pool_concurrent_reads_and_writes():
+    await db_module.init_db()
+    await db_module.add_user("u1")
+    await asyncio.gather(*(db_module.update_score("u1", 1) for _ in range(20)))
+    users = await asyncio.gather(*(db_module.get_user("u1") for _ in range(20)))
+    assert all(u["score"] == 20 for u in users)
+
+
+@pytest.mark.asyncio
+async def test_functions_work_without_pool():
+    await db_module.close_pool()
+    await db_module.init_db()
+    await db_module.add_user("u1")
+    user = await db_module.get_user("u1")
+    assert user["discord_id"] == "u1"
+
+
+@pytest.mark.asyncio
+async def test_board_query_limits_completed_per_user():
+    await db_module.init_db()
+    await db_module.add_user("u1")
+    await db_module.add_task("u1", "Active", "2026-12-31", "none")
+    for i in range(5):
+        tid = await db_module.add_task("u1", f"Done {i}", "2026-12-31", "none")
+        await db_module.update_task_status(tid, "completed")
+    rows = await db_module.get_all_users_with_tasks(recent_completed=2)
+    assert [r["description"] for r in rows] == ["Active", "Done 3", "Done 4"]
+
+
+# ── Compare-and-set transitions ─────────────────────────────────
+
+@pytest.mark.asyncio
+async def test_complete_task_wins_once():
+    await db_module.init_db()
+    await db_module.add_user("u1")
+    tid = await db_module.add_task("u1", "Task", "2026-12-31", "none")
+    results = await asyncio.gather(*(db_module.complete_task(tid, 10) for _ in range(5)))
+    assert sum(r is not None for r in results) == 1
+    assert (await db_module.get_user("u1"))["score"] == 10
+    assert (await db_module.get_task(tid))["status"] == "completed"
+
+
+@pytest.mark.asyncio
+async def test_complete_task_missing_returns_none():
+    await db_module.init_db()
+    assert await db_module.complete_task(999, 10) is None
+
+
+@pytest.mark.asyncio
+async def test_snooze_task_requires_expected_due_day():
+    await db_module.init_db()
+    await db_module.add_user("u1")
+    tid = await db_module.add_task("u1", "Task", "2026-03-01", "none")
+    await db_module.update_task_status(tid, "overdue")
+    day = to_day_number("2026-03-01")
+
+    won = await db_module.snooze_task(tid, day, "2026-03-02", -2)
+    lost = await db_module.snooze_task(tid, day, "2026-03-02", -2)
+
+    assert won["status"] == "pending" and won["due_day"] == day + 1
+    assert lost is None
+    assert (await db_module.get_user("u1"))["score"] == -2
+
+
+@pytest.mark.asyncio
+async def test_snooze_task_rejects_completed():
+    await db_module.init_db()
+    await db_module.add_user("u1")
+    tid = await db_module.add_task("u1", "Task", "2026-03-01", "none")
+    await db_module.complete_task(tid, 10)
+    assert await db_module.snooze_task(tid, to_day_number("2026-03-01"), "2026-03-02", -2) is None
+
+
+# ── User Cache ──────────────────────────────────────────────────
+
+@pytest.mark.asyncio
+async def test_get_user_reads_through_cache():
+    await db_module.init_db()
+    await db_module.add_user("u1")
+    before = dict(db_module.user_cache_stats)
+    await db_module.get_user("u1")
+    await db_module.get_user("u1")
+    assert db_module.user_cache_stats["misses"] == before["misses"] + 1
+    assert db_module.user_cache_stats["hits"] == before["hits"] + 1
+
+
+@pytest.mark.asyncio
+async def test_prime_user_cache_loads_every_user():
+    await db_module.init_db()
+    await db_module.add_user("u1")
+    await db_module.add_user("u2")
+    assert await db_module.prime_user_cache() == 2
+    misses = db_module.user_cache_stats["misses"]
+    assert (await db_module.get_user("u2"))["score"] == 0
+    assert db_module.user_cache_stats["misses"] == misses
+
+
+@pytest.mark.asyncio
+async def test_user_writes_invalidate_cache():
+    await db_module.init_db()
+    assert await db_module.get_user("u1") is None
+    await db_module.add_user("u1")
+    assert await db_module.get_user("u1") is not None
+
+    await db_module.set_user_private_channel("u1", "c1")
+    assert (await db_module.get_user("u1"))["private_channel_id"] == "c1"
+    await db_module.update_score("u1", 3)
+    assert (await db_module.get_user("u1"))["score"] == 3
+
+    tid = await db_module.add_task("u1", "Task", "2026-03-01", "none")
+    await db_module.snooze_task(tid, to_day_number("2026-03-01"), "2026-03-02", -1)
+    assert (await db_module.get_user("u1"))["score"] == 2
+    await db_module.mark_overdue_tasks(to_day_number("2026-03-05"))
+    overdue_score = (await db_module.get_user("u1"))["score"]
+    assert overdue_score < 2
+    await db_module.complete_task(tid, 10)
+    assert (await db_module.get_user("u1"))["score"] == overdue_score + 10
+
+
+@pytest.mark.asyncio
+async def test_read_racing_a_write_is_not_cached(monkeypatch):
+    await db_module.init_db()
+    await db_module.add_user("u1")
+    real_reader = db_module._reader
+
+    @contextlib.asynccontextmanager
+    async def reader_then_write():
+        async with real_reader() as db:
+            yield db
+        # A score update commits after get_user's SELECT saw the old row
+        await db_module.update_score("u1", 5)
+
+    monkeypatch.setattr(db_module, "_reader", reader_then_write)
+    assert (await db_module.get_user("u1"))["score"] == 0
+    monkeypatch.setattr(db_module, "_reader", real_reader)
+    assert (await db_module.get_user("u1"))["score"] == 5
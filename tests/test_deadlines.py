@@ -0,0 +1,100 @@
+"""Tests for src/deadlines.py — deadline-driven overdue scheduling."""
+
+import asyncio
+
+import pytest
+
+import src.db as db_module
+from src import events
+from src.dates import to_day_number
+from src.deadlines import SECONDS_PER_DAY, DeadlineScheduler
+
+
+pytestmark = pytest.mark.usefixtures("db_pool")
+
+
+async def _wait_for(predicate, timeout: float = 2.0) -> None:
+    """Yield to the scheduler until predicate() holds, failing after `timeout`."""
+    async def poll():
+        while not predicate():
+            await asyncio.sleep(0.001)
+
+    await asyncio.wait_for(poll(), timeout)
+
+
+@pytest.mark.asyncio
+async def test_get_pending_due_days():
+    await db_module.add_user("u1")
+    await db_module.add_task("u1", "A", "2026-03-01", "none")
+    await db_module.add_task("u1", "B", "2026-03-01", "none")
+    done = await db_module.add_task("u1", "C", "2026-03-05", "none")
+    await db_module.update_task_status(done, "completed")
+    await db_module.add_task("u1", "D", "someday", "none")
+
+    assert await db_module.get_pending_due_days() == [to_day_number("2026-03-01")]
+
+
+@pytest.mark.asyncio
+async def test_scheduler_wakes_when_due_day_begins():
+    due = to_day_number("2026-03-02")
+    await db_module.add_user("u1")
+    await db_module.add_task("u1", "Task", "2026-03-02", "none")
+    fired = []
+
+    async def on_deadline(today):
+        fired.append(today)
+
+    # The clock stands still just before the due day until we advance it
+    now = [due * SECONDS_PER_DAY - 0.05]
+    scheduler = DeadlineScheduler(on_deadline, clock=lambda: now[0])
+    scheduler.start()
+    await _wait_for(lambda: scheduler.next_deadline() == due)
+    assert fired == []
+
+    now[0] = due * SECONDS_PER_DAY
+    await _wait_for(lambda: fired)
+    await scheduler.stop()
+    assert fired == [due]
+    assert scheduler.next_deadline() is None
+
+
+@pytest.mark.asyncio
+async def test_earlier_deadline_from_event_wakes_scheduler():
+    today = to_day_number("2026-03-01")
+    fired = []
+
+    async def on_deadline(day):
+        fired.append(day)
+
+    # Nothing due; the clock sits an hour into `today`
+    scheduler = DeadlineScheduler(on_deadline, clock=lambda: today * SECONDS_PER_DAY + 3600)
+    scheduler.start()
+
+    # A task created already due today is flagged straight away; rebuild()
+    # keeps queued days, so this holds whether or not it has run yet
+    await scheduler.handle_event(events.Event(
+        events.TASK_CREATED,
+        {"task_id": 1, "discord_id": "u1", "description": "x", "due_date": "2026-03-01"},
+    ))
+    await _wait_for(lambda: fired)
+    await scheduler.stop()
+    assert fired == [today]
+
+
+@pytest.mark.asyncio
+async def test_scheduler_survives_handler_errors():
+    due = to_day_number("2026-03-01")
+    calls = []
+
+    async def on_deadline(day):
+        calls.append(day)
+        raise RuntimeError("boom")
+
+    scheduler = DeadlineScheduler(on_deadline, clock=lambda: due * SECONDS_PER_DAY + 1)
+    scheduler.add(due)
+    scheduler.start()
+    await _wait_for(lambda: len(calls) == 1)
+    scheduler.add(due)  # popped before the first call, so this queues it again
+    await _wait_for(lambda: len(calls) == 2)
+    await scheduler.stop()
+    assert calls == [due, due]
@@ -0,0 +1,130 @@
+"""Tests for src/due_dates.py — due-date parsing fast path, cache and worker thread."""
+
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+from src import due_dates, recurrence
+from src.dates import from_day_number, to_day_number, weekday
+
+# A Sunday
+TODAY = to_day_number("2026-10-18")
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    due_dates._cache.clear()
+    yield
+    due_dates._cache.clear()
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("2026-11-03", "2026-11-03"),
+    ("2026/1/5", "2026-01-05"),
+    ("today", "2026-10-18"),
+    ("Tomorrow", "2026-10-19"),
+    ("friday", "2026-10-23"),
+    ("Fri", "2026-10-23"),
+    ("sunday", "2026-10-18"),
+    ("next sunday", "2026-10-25"),
+    ("next  Friday", "2026-10-23"),
+    ("this wed", "2026-10-21"),
+    ("in 3 days", "2026-10-21"),
+    ("in 2 weeks", "2026-11-01"),
+])
+def test_parse_fast(text, expected):
+    assert from_day_number(due_dates.parse_fast(text, TODAY)) == expected
+
+
+@pytest.mark.parametrize("text", ["2026-02-30", "march 5", "next week", "someday"])
+def test_parse_fast_defers_everything_else(text):
+    assert due_dates.parse_fast(text, TODAY) is None
+
+
+@pytest.mark.asyncio
+async def test_fast_path_never_calls_dateparser(monkeypatch):
+    def fail(text):
+        raise AssertionError("slow path used")
+
+    monkeypatch.setattr(due_dates, "_parse_slow", fail)
+    assert await due_dates.parse_due_date("next friday", TODAY) == "2026-10-23"
+
+
+@pytest.mark.asyncio
+async def test_slow_path_runs_off_the_event_loop_and_is_cached(monkeypatch):
+    calls = []
+
+    def slow(text):
+        calls.append(threading.current_thread() is threading.main_thread())
+        return "2027-03-05"
+
+    monkeypatch.setattr(due_dates, "_parse_slow", slow)
+    assert await due_dates.parse_due_date("March 5", TODAY) == "2027-03-05"
+    assert await due_dates.parse_due_date("march  5", TODAY) == "2027-03-05"
+    assert calls == [False]
+
+    # The same words are parsed afresh on another day
+    await due_dates.parse_due_date("march 5", TODAY + 1)
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_unparseable_input_returns_none(monkeypatch):
+    monkeypatch.setattr(due_dates, "_parse_slow", lambda text: None)
+    assert await due_dates.parse_due_date("whenever", TODAY) is None
+
+
+@pytest.mark.asyncio
+async def test_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(due_dates, "DUE_DATE_CACHE_SIZE", 3)
+    for days in range(5):
+        await due_dates.parse_due_date(f"in {days} days", TODAY)
+    assert len(due_dates._cache) == 3
+
+
+def test_importing_the_module_does_not_import_dateparser():
+    code = "import sys, src.due_dates; print('dateparser' in sys.modules)"
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(__file__).parent.parent, capture_output=True, text=True, check=True,
+    )
+    assert out.stdout.strip() == "False"
+
+
+@pytest.mark.asyncio
+async def test_warm_up_loads_dateparser_once(monkeypatch):
+    monkeypatch.setattr(due_dates, "_dateparser", None)
+    assert await due_dates.warm_up() > 0
+    assert due_dates._dateparser is not None
+    assert await due_dates.warm_up() == 0
+
+
+@pytest.mark.parametrize("word", ["thurs", "weds", "tues", "sun"])
+def test_weekday_words_agree_with_recurrence(word):
+    day = due_dates.parse_fast(word, TODAY)
+    rule = recurrence.parse(word)
+    assert rule.weekdays == (weekday(day),)
+
+
+@pytest.mark.asyncio
+async def test_start_warm_up_runs_in_background_unless_disabled(monkeypatch):
+    calls = []
+
+    async def fake_warm_up():
+        calls.append(True)
+        return 0.0
+
+    monkeypatch.setattr(due_dates, "warm_up", fake_warm_up)
+    monkeypatch.setattr(due_dates, "_warm_up_task", None)
+    monkeypatch.setattr(due_dates, "WARM_UP_DATEPARSER", False)
+    assert due_dates.start_warm_up() is None
+    assert due_dates._warm_up_task is None
+
+    monkeypatch.setattr(due_dates, "WARM_UP_DATEPARSER", True)
+    due_dates.start_warm_up()
+    due_dates.start_warm_up()  # already started
+    await due_dates._warm_up_task
+    assert calls == [True]
@@ -5,6 +5,7 @@ import discord
 from src.constants import COLOR_BOARD, COLOR_COMPLETE, COLOR_DEFAULT_TASK, COLOR_OVERDUE
 from src.embeds import (
     build_board_embed,
+    build_board_pages,
     build_celebration_embed,
     build_shame_embed,
     build_task_embed,
@@ -136,6 +137,52 @@ def test_board_footer():
     assert "Last updated" in embed.footer.text
 
 
+def test_board_field_truncates_with_more_marker():
+    tasks = [{"description": f"Task number {i}", "status": "pending"} for i in range(200)]
+    embed = build_board_embed([{"name": "Alice", "score": 0, "tasks": tasks}])
+    value = embed.fields[0].value
+    assert len(value) <= 1024
+    assert value.splitlines()[-1].startswith("+")
+    shown = len(value.splitlines()) - 1
+    assert value.endswith(f"+{200 - shown} more")
+
+
+def test_board_long_description_truncated():
+    tasks = [{"description": "x" * 5000, "status": "pending"}]
+    embed = build_board_embed([{"name": "Alice", "score": 0, "tasks": tasks}])
+    assert len(embed.fields[0].value) <= 1024
+
+
+def test_board_stays_within_embed_limits():
+    tasks = [{"description": "y" * 150, "status": "pending"} for _ in range(10)]
+    users = [{"name": f"User {i}", "score": i, "tasks": tasks} for i in range(40)]
+    embed = build_board_embed(users)
+    assert len(embed) <= 6000
+    assert len(embed.fields) <= 25
+    shown = len(embed.fields)
+    assert f"+{40 - shown} more users" in embed.footer.text
+
+
+def test_board_pages_fit_large_guild():
+    tasks = [{"description": "y" * 150, "status": "pending"} for _ in range(3)]
+    users = [{"name": f"User {i}", "score": i, "tasks": tasks} for i in range(120)]
+    pages = build_board_pages(users)
+    assert len(pages) > 1
+    assert all(len(p) <= 6000 and len(p.fields) <= 25 for p in pages)
+    assert sum(len(p.fields) for p in pages) == 120
+    assert "User 119" in pages[0].fields[0].name  # highest score first
+    assert pages[-1].title == f"Accountability Board ({len(pages)}/{len(pages)})"
+
+
+def test_board_pages_single_page_title():
+    pages = build_board_pages([{"name": "Alice", "score": 0, "tasks": []}])
+    assert [p.title for p in pages] == ["Accountability Board"]
+
+
+def test_board_pages_empty_board():
+    assert len(build_board_pages([])) == 1
+
+
 # ── Celebration Embed ───────────────────────────────────────────
 
 def test_celebration_color():
@@ -0,0 +1,119 @@
+"""Tests for src/events.py — task lifecycle event bus."""
+
+import asyncio
+
+import pytest
+
+from src import events
+from src.board import BoardModel
+from src.events import EventBus, EventCounter
+
+
+@pytest.mark.asyncio
+async def test_publish_fans_out_to_matching_subscribers():
+    bus = EventBus()
+    seen_all, seen_done = [], []
+
+    async def record_all(event):
+        seen_all.append(event.name)
+
+    async def record_done(event):
+        seen_done.append(event.name)
+
+    bus.subscribe("all", record_all)
+    bus.subscribe("done", record_done, events=(events.TASK_COMPLETED,))
+    bus.start()
+    await bus.publish(events.TASK_CREATED, task_id=1, discord_id="u1", description="A")
+    await bus.publish(events.TASK_COMPLETED, task_id=1, discord_id="u1", description="A", score_delta=10)
+    await bus.drain()
+    await bus.stop()
+
+    assert seen_all == [events.TASK_CREATED, events.TASK_COMPLETED]
+    assert seen_done == [events.TASK_COMPLETED]
+    assert bus.published[events.TASK_COMPLETED] == 1
+
+
+@pytest.mark.asyncio
+async def test_failing_subscriber_does_not_affect_others():
+    bus = EventBus()
+    counter = EventCounter()
+
+    async def explode(event):
+        raise RuntimeError("boom")
+
+    bus.subscribe("broken", explode)
+    bus.subscribe("metrics", counter.handle_event)
+    bus.start()
+    await bus.publish(events.TASK_OVERDUE, task_id=1, discord_id="u1", score_delta=-5)
+    await bus.publish(events.TASK_OVERDUE, task_id=2, discord_id="u1", score_delta=-5)
+    await bus.drain()
+    await bus.stop()
+
+    stats = bus.stats()
+    assert stats["broken"] == {"processed": 0, "failed": 2, "queued": 0}
+    assert stats["metrics"]["processed"] == 2
+    assert counter.counts[events.TASK_OVERDUE] == 2
+    assert counter.score_delta == -10
+
+
+@pytest.mark.asyncio
+async def test_unsubscribe_stops_delivery_and_consumer():
+    bus = EventBus()
+    seen = []
+
+    async def record(event):
+        seen.append(event.name)
+
+    bus.subscribe("gone", record)
+    bus.start()
+    await bus.unsubscribe("gone")
+    await bus.publish(events.TASK_CREATED, task_id=1, discord_id="u1", description="A")
+    await bus.stop()
+
+    assert seen == []
+    assert bus.stats() == {}
+
+
+@pytest.mark.asyncio
+async def test_full_queue_applies_back_pressure():
+    bus = EventBus(maxsize=1)
+    release = asyncio.Event()
+
+    async def slow(event):
+        await release.wait()
+
+    bus.subscribe("slow", slow)
+    bus.start()
+    await bus.publish(events.USER_OPTED_IN, discord_id="u1")
+    await asyncio.sleep(0)  # worker takes the first event
+    await bus.publish(events.USER_OPTED_IN, discord_id="u2")  # fills the queue
+
+    blocked = asyncio.create_task(bus.publish(events.USER_OPTED_IN, discord_id="u3"))
+    await asyncio.sleep(0.01)
+    assert not blocked.done()
+
+    release.set()
+    await blocked
+    await bus.drain()
+    await bus.stop()
+    assert bus.stats()["slow"]["processed"] == 3
+
+
+@pytest.mark.asyncio
+async def test_board_model_follows_lifecycle_events():
+    model = BoardModel()
+    model.loaded = True
+    bus = EventBus()
+    bus.subscribe("board", model.handle_event)
+    bus.start()
+
+    await bus.publish(events.USER_OPTED_IN, discord_id="u1")
+    await bus.publish(events.TASK_CREATED, task_id=1, discord_id="u1", description="Write")
+    await bus.publish(events.TASK_COMPLETED, task_id=1, discord_id="u1", description="Write", score_delta=10)
+    await bus.publish(events.TASK_CREATED, task_id=2, discord_id="u1", description="Read")
+    await bus.publish(events.TASK_DELETED, task_id=2, discord_id="u1")
+    await bus.drain()
+    await bus.stop()
+
+    assert model._scores["u1"] == 10
+    assert 2 not in model._tasks["u1"]
@@ -0,0 +1,57 @@
+"""Tests for src/lifecycle.py — run-once warm-up vs reconnect catch-up."""
+
+import logging
+
+import pytest
+
+from src.lifecycle import Lifecycle
+
+
+@pytest.mark.asyncio
+async def test_warm_up_runs_once_then_reconnect_steps(caplog):
+    calls = []
+    lifecycle = Lifecycle()
+
+    async def sync():
+        calls.append("sync")
+
+    lifecycle.add_warm_up("sync", sync)
+    lifecycle.add_warm_up("board", lambda: calls.append("board"))
+    lifecycle.add_reconnect("outbox", lambda: calls.append("outbox"))
+
+    with caplog.at_level(logging.INFO, logger="bother-bot"):
+        await lifecycle.on_ready()
+        await lifecycle.on_ready()
+        await lifecycle.on_ready()
+
+    assert calls == ["sync", "board", "outbox", "outbox"]
+    assert lifecycle.reconnects == 2
+    assert list(lifecycle.timings) == ["sync", "board", "to_ready"]
+    messages = [r.getMessage() for r in caplog.records]
+    assert sum(m.startswith("Startup timing: sync") for m in messages) == 1
+    assert sum(m.startswith("Reconnect #") for m in messages) == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_step_does_not_stop_the_rest():
+    calls = []
+    lifecycle = Lifecycle()
+
+    async def broken():
+        raise RuntimeError("boom")
+
+    lifecycle.add_warm_up("broken", broken)
+    lifecycle.add_warm_up("after", lambda: calls.append("after"))
+    await lifecycle.on_ready()
+    assert calls == ["after"]
+    assert "broken" in lifecycle.timings
+
+
+def test_phase_accumulates():
+    lifecycle = Lifecycle()
+    with lifecycle.phase("cogs"):
+        pass
+    first = lifecycle.timings["cogs"]
+    with lifecycle.phase("cogs"):
+        pass
+    assert lifecycle.timings["cogs"] >= first
@@ -1,21 +1,17 @@
 """Tests for Phase 3 — loops cog DB queries, /prod data flow, recurring generation."""
 
+import asyncio
 import datetime
 
 import pytest
-import pytest_asyncio  # noqa: F401
 
-import src.constants
 import src.db as db_module
+from src.dates import to_day_number
+from src.events import EventBus
 
 
-@pytest.fixture(autouse=True)
-def tmp_db(tmp_path, monkeypatch):
-    """Point DB_PATH at a temp file for every test."""
-    db_path = str(tmp_path / "test.db")
-    monkeypatch.setattr(src.constants, "DB_PATH", db_path)
-    monkeypatch.setattr(db_module, "DB_PATH", db_path)
-    return db_path
+# Every test runs through the shared connection pool and calls init_db() itself
+pytestmark = pytest.mark.usefixtures("bare_db_pool")
 
 
 # ── get_pending_tasks_due_today ──────────────────────────────────
@@ -87,50 +83,59 @@ async def test_config_upsert():
     assert val == "v2"
 
 
-# ── update_task_due_date ─────────────────────────────────────────
+# ── mark_overdue_tasks ──────────────────────────────────────────
 
 @pytest.mark.asyncio
-async def test_update_task_due_date():
+async def test_mark_overdue_tasks_flips_status_and_scores():
     await db_module.init_db()
     await db_module.add_user("u1")
-    tid = await db_module.add_task("u1", "Task", "2026-01-01", "none")
-    await db_module.update_task_due_date(tid, "2026-02-01")
-    task = await db_module.get_task(tid)
-    assert task["due_date"] == "2026-02-01"
-
+    await db_module.add_user("u2")
+    await db_module.set_user_private_channel("u1", "ch_1")
+    today = to_day_number("2026-03-10")
+    t1 = await db_module.add_task("u1", "Two days late", "2026-03-08", "none")
+    t2 = await db_module.add_task("u1", "Due today", "2026-03-10", "none")
+    t3 = await db_module.add_task("u2", "One day late", "2026-03-09", "none")
+    t4 = await db_module.add_task("u2", "Future", "2026-03-11", "none")
+
+    overdue = await db_module.mark_overdue_tasks(today)
+
+    assert {t["id"] for t in overdue} == {t1, t2, t3}
+    by_id = {t["id"]: t for t in overdue}
+    assert by_id[t1]["private_channel_id"] == "ch_1"
+    assert by_id[t3]["private_channel_id"] is None
+    assert by_id[t1]["penalty"] == -10
+    assert by_id[t2]["penalty"] == 0
+    assert (await db_module.get_user("u1"))["score"] == -10
+    assert (await db_module.get_user("u2"))["score"] == -5
+    assert (await db_module.get_task(t2))["status"] == "overdue"
+    assert (await db_module.get_task(t4))["status"] == "pending"
 
-# ── get_active_task_ids ──────────────────────────────────────────
 
 @pytest.mark.asyncio
-async def test_get_active_task_ids():
+async def test_mark_overdue_tasks_only_takes_pending_tasks_due_by_today():
     await db_module.init_db()
     await db_module.add_user("u1")
-    t1 = await db_module.add_task("u1", "Pending", "2026-12-31", "none")
-    t2 = await db_module.add_task("u1", "Overdue", "2020-01-01", "none")
-    await db_module.update_task_status(t2, "overdue")
-    t3 = await db_module.add_task("u1", "Done", "2026-12-31", "none")
-    await db_module.update_task_status(t3, "completed")
-    ids = await db_module.get_active_task_ids()
-    assert t1 in ids
-    assert t2 in ids
-    assert t3 not in ids
+    today = await db_module.add_task("u1", "Today", "2026-03-01", "none")
+    await db_module.add_task("u1", "Tomorrow", "2026-03-02", "none")
+    await db_module.add_task("u1", "Someday", "whenever", "none")
+    done = await db_module.add_task("u1", "Done", "2026-02-01", "none")
+    await db_module.update_task_status(done, "completed")
 
+    flagged = await db_module.mark_overdue_tasks(to_day_number("2026-03-01"))
+    assert [t["id"] for t in flagged] == [today]
 
-# ── Overdue candidates with multiple users ───────────────────────
 
 @pytest.mark.asyncio
-async def test_overdue_candidates_multiple_users():
+async def test_mark_overdue_tasks_is_idempotent():
     await db_module.init_db()
     await db_module.add_user("u1")
-    await db_module.add_user("u2")
-    await db_module.add_task("u1", "U1 old task", "2020-01-01", "none")
-    await db_module.add_task("u2", "U2 old task", "2020-06-01", "none")
-    await db_module.add_task("u2", "U2 future", "2099-12-31", "none")
-    candidates = await db_module.get_overdue_candidates()
-    assert len(candidates) == 2
-    descs = {c["description"] for c in candidates}
-    assert "U1 old task" in descs
-    assert "U2 old task" in descs
+    await db_module.add_task("u1", "Late", "2020-01-01", "none")
+    first = await db_module.mark_overdue_tasks()
+    score = (await db_module.get_user("u1"))["score"]
+    second = await db_module.mark_overdue_tasks()
+    assert len(first) == 1
+    assert second == []
+    assert (await db_module.get_user("u1"))["score"] == score
 
 
 # ── Recurring task regeneration logic ────────────────────────────
@@ -153,23 +158,24 @@ async def test_recurring_weekly_next_due_date():
 
 @pytest.mark.asyncio
 async def test_completed_recurring_creates_new_task():
-    """Full flow: complete a recurring task, verify new task is creatable."""
+    """Full flow: complete a recurring task, verify its next instance is created once."""
     await db_module.init_db()
     await db_module.add_user("u1")
     t1 = await db_module.add_task("u1", "Daily task", "2026-03-01", "daily")
     await db_module.update_task_status(t1, "completed")
 
     # Simulate regeneration
-    completed = await db_module.get_completed_recurring_tasks()
+    today = to_day_number("2026-03-01")
+    completed = await db_module.get_series_due_for_next_instance(today)
     assert len(completed) == 1
     task = completed[0]
 
     base = datetime.datetime.strptime(task["due_date"], "%Y-%m-%d")
     next_due = (base + datetime.timedelta(days=1)).strftime("%Y-%m-%d")
-    new_id = await db_module.add_task(
-        task["discord_id"], task["description"], next_due, task["recurrence"]
-    )
-    new_task = await db_module.get_task(new_id)
+    [created] = await db_module.create_next_instances({task["id"]: next_due})
+    # A second nightly run has nothing left to do
+    assert await db_module.get_series_due_for_next_instance(today) == []
+    new_task = await db_module.get_task(created["id"])
     assert new_task["description"] == "Daily task"
     assert new_task["due_date"] == "2026-03-02"
     assert new_task["recurrence"] == "daily"
@@ -215,3 +221,98 @@ async def test_prod_gets_overdue_tasks_only():
     overdue = await db_module.get_tasks_for_user("u1", status="overdue")
     assert len(overdue) == 1
     assert overdue[0]["description"] == "Overdue task"
+
+
+# ── Overdue embed updates ───────────────────────────────────────
+
+class _FakeMessage:
+    def __init__(self, channel):
+        self.channel = channel
+
+    async def edit(self, **kwargs):
+        self.channel.in_flight += 1
+        self.channel.peak = max(self.channel.peak, self.channel.in_flight)
+        await asyncio.sleep(0.01)
+        self.channel.in_flight -= 1
+        self.channel.edits += 1
+
+
+class _FakeChannel:
+    def __init__(self, channel_id):
+        self.id = channel_id
+        self.in_flight = self.peak = self.edits = 0
+
+    def get_partial_message(self, message_id):
+        return _FakeMessage(self)
+
+
+class _FakeBot:
+    def __init__(self, channels):
+        self.channels = channels
+
+    def get_channel(self, channel_id):
+        return self.channels.get(channel_id)
+
+
+@pytest.mark.asyncio
+async def test_overdue_embed_updates_are_paced_by_outbound_queue(monkeypatch):
+    from src import messaging
+    from src.cogs.loops import LoopsCog
+
+    queue = messaging.OutboundQueue(concurrency=8, burst=100, period=1.0)
+    monkeypatch.setattr(messaging, "outbound", queue)
+    queue.start()
+    channels = {1: _FakeChannel(1), 2: _FakeChannel(2)}
+    cog = LoopsCog(_FakeBot(channels))
+    overdue = [
+        {
+            "id": i, "discord_id": "u", "description": f"T{i}",
+            "due_date": "2020-01-01", "recurrence": "none",
+            "message_id": str(100 + i), "private_channel_id": str(1 + i % 2),
+        }
+        for i in range(10)
+    ]
+    overlapped = False
+
+    async def watch():
+        nonlocal overlapped
+        while not overlapped:
+            overlapped = all(ch.in_flight for ch in channels.values())
+            await asyncio.sleep(0)
+
+    watcher = asyncio.create_task(watch())
+    await cog._update_overdue_embeds(overdue)
+    await queue.stop()
+    watcher.cancel()
+
+    assert channels[1].edits == 5 and channels[2].edits == 5
+    # One edit in flight per channel, but the two channels overlap
+    assert all(ch.peak == 1 for ch in channels.values())
+    assert overlapped
+
+
+# ── Cog lifecycle ───────────────────────────────────────────────
+
+class _NeverReadyBot:
+    def __init__(self):
+        self.events = EventBus()
+        self._ready = asyncio.Event()
+
+    async def wait_until_ready(self):
+        await self._ready.wait()
+
+
+@pytest.mark.asyncio
+async def test_reloading_loops_cog_keeps_one_deadline_subscriber():
+    from src.cogs.loops import LoopsCog
+
+    await db_module.init_db()
+    bot = _NeverReadyBot()
+    bot.events.start()
+    for _ in range(3):  # load, then two reloads
+        cog = LoopsCog(bot)
+        await cog.cog_load()
+        assert list(bot.events.stats()) == ["deadlines"]
+        await cog.cog_unload()
+    assert bot.events.stats() == {}
+    await bot.events.stop()
@@ -0,0 +1,171 @@
+"""Tests for src/messaging.py — fetch-free edits and stale message cleanup."""
+
+import asyncio
+import types
+
+import discord
+import pytest
+import pytest_asyncio
+
+import src.db as db_module
+from src import messaging
+
+
+pytestmark = pytest.mark.usefixtures("db_pool")
+
+
+def _not_found() -> discord.NotFound:
+    return discord.NotFound(types.SimpleNamespace(status=404, reason="Not Found"), "gone")
+
+
+class _FakePartial:
+    def __init__(self, channel, message_id):
+        self.channel = channel
+        self.id = message_id
+
+    async def edit(self, **fields):
+        self.channel.log.append(("edit", self.id, fields))
+        if self.id not in self.channel.messages:
+            raise _not_found()
+        self.channel.messages[self.id] = fields
+
+    async def delete(self):
+        if self.channel.messages.pop(self.id, None) is None:
+            raise _not_found()
+
+
+class _FakeChannel:
+    def __init__(self, *message_ids, channel_id=1):
+        self.id = channel_id
+        self.messages = {mid: {} for mid in message_ids}
+        self.log = []
+
+    def get_partial_message(self, message_id):
+        return _FakePartial(self, message_id)
+
+    async def fetch_message(self, message_id):
+        raise AssertionError("helpers must not fetch before editing")
+
+
+@pytest.mark.asyncio
+async def test_edit_message_edits_by_id_without_fetch():
+    channel = _FakeChannel(42)
+    before = messaging.stats["fetches_saved"]
+    assert await messaging.edit_message(channel, "42", content="hi")
+    assert channel.messages[42] == {"content": "hi"}
+    assert messaging.stats["fetches_saved"] == before + 1
+
+
+@pytest.mark.asyncio
+async def test_edit_message_returns_false_when_missing():
+    assert not await messaging.edit_message(_FakeChannel(), 42, content="hi")
+
+
+@pytest.mark.asyncio
+async def test_delete_message():
+    channel = _FakeChannel(42)
+    assert await messaging.delete_message(channel, 42)
+    assert not await messaging.delete_message(channel, 42)
+
+
+@pytest.mark.asyncio
+async def test_edit_task_message_clears_stale_id():
+    await db_module.add_user("u1")
+    task_id = await db_module.add_task("u1", "Task", "2026-12-31", "none")
+    await db_module.update_task_message_id(task_id, "42")
+
+    assert not await messaging.edit_task_message(_FakeChannel(), task_id, "42", content="x")
+    assert (await db_module.get_task(task_id))["message_id"] is None
+
+
+# ── Outbound queue ──────────────────────────────────────────────
+
+@pytest_asyncio.fixture
+async def queue(monkeypatch):
+    q = messaging.OutboundQueue(concurrency=1, burst=100, period=1.0)
+    monkeypatch.setattr(messaging, "outbound", q)
+    q.start()
+    yield q
+    await q.stop()
+
+
+@pytest.mark.asyncio
+async def test_outbound_runs_higher_lanes_first(queue):
+    gate = asyncio.Event()
+    order = []
+
+    async def blocker():
+        await gate.wait()
+
+    async def record(name):
+        order.append(name)
+
+    first = asyncio.create_task(queue.submit(messaging.LANE_BULK, _FakeChannel(channel_id=1), blocker, {}))
+    await asyncio.sleep(0)
+    jobs = [
+        asyncio.create_task(queue.submit(lane, _FakeChannel(channel_id=cid), record, {"name": name}))
+        for lane, cid, name in [
+            (messaging.LANE_BULK, 2, "bulk"),
+            (messaging.LANE_NOTIFY, 3, "notify"),
+            (messaging.LANE_INTERACTIVE, 4, "interactive"),
+        ]
+    ]
+    await asyncio.sleep(0)
+    assert queue.depth() == {"interactive": 1, "board": 0, "notify": 1, "bulk": 1}
+
+    gate.set()
+    await asyncio.gather(first, *jobs)
+    assert order == ["interactive", "notify", "bulk"]
+    assert queue.snapshot()["waits"]["bulk"]["started"] == 2
+
+
+@pytest.mark.asyncio
+async def test_outbound_coalesces_pending_edits(queue):
+    gate = asyncio.Event()
+    channel = _FakeChannel(42)
+
+    async def blocker():
+        await gate.wait()
+
+    first = asyncio.create_task(queue.submit(messaging.LANE_BULK, _FakeChannel(channel_id=9), blocker, {}))
+    await asyncio.sleep(0)
+    edits = [
+        asyncio.create_task(messaging.edit_message(channel, 42, lane=messaging.LANE_BULK, content=f"v{i}"))
+        for i in range(3)
+    ]
+    await asyncio.sleep(0)
+    gate.set()
+
+    assert await asyncio.gather(*edits) == [True, True, True]
+    await first
+    assert channel.log == [("edit", 42, {"content": "v2"})]
+    assert queue.stats["coalesced"] == 2
+
+
+@pytest.mark.asyncio
+async def test_outbound_paces_each_channel():
+    q = messaging.OutboundQueue(concurrency=4, burst=2, period=0.1)
+    q.start()
+    loop = asyncio.get_running_loop()
+    times = []
+
+    async def stamp():
+        times.append(loop.time())
+
+    channel = _FakeChannel()
+    started = loop.time()
+    await asyncio.gather(*(q.submit(messaging.LANE_BULK, channel, stamp, {}) for _ in range(4)))
+    await q.stop()
+
+    # Two go out on the burst, the other two wait for refills of 0.05s each
+    assert times[3] - started >= 0.09
+
+
+@pytest.mark.asyncio
+async def test_outbound_propagates_errors(queue):
+    async def fail():
+        raise _not_found()
+
+    with pytest.raises(discord.NotFound):
+        await queue.submit(messaging.LANE_INTERACTIVE, _FakeChannel(), fail, {})
+    assert queue.stats["failed"] == 1
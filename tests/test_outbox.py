@@ -0,0 +1,155 @@
+"""Tests for src/outbox.py — durable task posts with retries."""
+
+import time
+import types
+
+import discord
+import pytest
+
+import src.constants
+import src.db as db_module
+from src import outbox
+from src.messaging import LANE_BULK, LANE_INTERACTIVE
+from src.outbox import OutboxWorker, backoff_delay
+
+
+pytestmark = pytest.mark.usefixtures("db_pool")
+
+
+def _http_error(status: int) -> discord.HTTPException:
+    return discord.HTTPException(types.SimpleNamespace(status=status, reason="err"), "err")
+
+
+class _Channel:
+    def __init__(self, failures=()):
+        self.failures = list(failures)
+        self.sent = []
+
+    async def send(self, **fields):
+        if self.failures:
+            raise self.failures.pop(0)
+        self.sent.append(fields)
+        return types.SimpleNamespace(id=1000 + len(self.sent))
+
+
+class _Bot:
+    def __init__(self, channel):
+        self.channel = channel
+
+    def get_channel(self, channel_id):
+        return self.channel
+
+
+async def _due_rows():
+    return await db_module.get_due_outbox(time.time() + 10**6, 100)
+
+
+async def _task_with_post(lane=LANE_INTERACTIVE):
+    await db_module.add_user("u1")
+    await db_module.set_user_private_channel("u1", "555")
+    return await db_module.add_task("u1", "Task", "2026-12-31", "none", post_lane=lane)
+
+
+@pytest.mark.asyncio
+async def test_add_task_writes_outbox_row_only_when_asked():
+    await db_module.add_user("u1")
+    await db_module.add_task("u1", "Quiet", "2026-12-31", "none")
+    task_id = await db_module.add_task("u1", "Posted", "2026-12-31", "none", post_lane=LANE_BULK)
+
+    rows = await _due_rows()
+    assert [(r["task_id"], r["lane"]) for r in rows] == [(task_id, LANE_BULK)]
+
+
+@pytest.mark.asyncio
+async def test_deleting_a_task_removes_its_outbox_row():
+    task_id = await _task_with_post()
+    await db_module.delete_task(task_id)
+    assert await _due_rows() == []
+
+
+@pytest.mark.asyncio
+async def test_drain_posts_and_records_message_id():
+    task_id = await _task_with_post()
+    channel = _Channel()
+    worker = OutboxWorker(_Bot(channel))
+
+    assert await worker.drain() == 1
+    assert len(channel.sent) == 1
+    assert (await db_module.get_task(task_id))["message_id"] == "1001"
+    assert await _due_rows() == []
+    assert await db_module.get_next_outbox_attempt() is None
+
+
+@pytest.mark.asyncio
+async def test_transient_failure_is_retried_with_backoff():
+    task_id = await _task_with_post()
+    channel = _Channel(failures=[_http_error(503)])
+    worker = OutboxWorker(_Bot(channel))
+
+    before = time.time()
+    await worker.drain()
+    rows = await _due_rows()
+    assert rows[0]["attempts"] == 1
+    assert await db_module.get_next_outbox_attempt() >= before + backoff_delay(0)
+    assert worker.stats["retried"] == 1
+
+    # A restarted worker picks the row up once it is due
+    await worker.drain()
+    assert channel.sent == []
+    await db_module.retry_outbox(rows[0]["id"], 0, "forced due")
+    await OutboxWorker(_Bot(channel)).drain()
+    assert (await db_module.get_task(task_id))["message_id"] == "1001"
+
+
+@pytest.mark.asyncio
+async def test_unexpected_error_counts_as_an_attempt():
+    await _task_with_post()
+    await _task_with_post()
+    channel = _Channel(failures=[RuntimeError("Server disconnected")])
+    worker = OutboxWorker(_Bot(channel))
+
+    await worker.drain()
+    rows = await _due_rows()
+    assert [r["attempts"] for r in rows] == [1]
+    assert len(channel.sent) == 1  # the other row in the batch still went out
+    assert worker.stats["retried"] == 1
+
+
+@pytest.mark.asyncio
+async def test_permanent_failure_is_dropped():
+    await _task_with_post()
+    worker = OutboxWorker(_Bot(_Channel(failures=[_http_error(403)])))
+
+    await worker.drain()
+    assert await _due_rows() == []
+    assert worker.stats["dropped"] == 1
+
+
+@pytest.mark.asyncio
+async def test_gives_up_after_max_attempts(monkeypatch):
+    monkeypatch.setattr(outbox, "OUTBOX_MAX_ATTEMPTS", 2)
+    await _task_with_post()
+    worker = OutboxWorker(_Bot(None))  # channel never cached
+
+    await worker.drain()
+    row = (await _due_rows())[0]
+    await db_module.retry_outbox(row["id"], 0, "forced due")
+    await worker.drain()
+    assert await _due_rows() == []
+    assert worker.stats == {"posted": 0, "retried": 1, "dropped": 1}
+
+
+@pytest.mark.asyncio
+async def test_completed_task_is_not_posted():
+    task_id = await _task_with_post()
+    await db_module.complete_task(task_id, 10)
+    channel = _Channel()
+
+    await OutboxWorker(_Bot(channel)).drain()
+    assert channel.sent == []
+    assert await _due_rows() == []
+
+
+def test_backoff_is_exponential_and_capped():
+    assert backoff_delay(1) == 2 * backoff_delay(0)
+    assert backoff_delay(50) == src.constants.OUTBOX_RETRY_MAX
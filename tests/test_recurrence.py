@@ -0,0 +1,110 @@
+"""Tests for src/recurrence.py — recurrence rules and next occurrences."""
+
+import random
+
+import pytest
+
+from src import recurrence
+from src.dates import from_day_number, to_day_number
+from src.recurrence import DAILY, MONTHLY, WEEKLY, Rule
+
+
+def _next(text: str, base: str, after: str | None = None) -> str:
+    rule = recurrence.parse(text)
+    day = recurrence.next_occurrence(
+        rule, to_day_number(base), to_day_number(after) if after else None
+    )
+    return from_day_number(day)
+
+
+# ── Parsing ─────────────────────────────────────────────────────
+
+@pytest.mark.parametrize("text, rule", [
+    ("none", None),
+    ("daily", Rule(DAILY)),
+    ("Weekly", Rule(WEEKLY)),
+    ("every 3 days", Rule(DAILY, 3)),
+    ("every 2 weeks", Rule(WEEKLY, 2)),
+    ("mon, wed, fri", Rule(WEEKLY, weekdays=(0, 2, 4))),
+    ("Friday Tuesday", Rule(WEEKLY, weekdays=(1, 4))),
+    ("weekdays", Rule(WEEKLY, weekdays=(0, 1, 2, 3, 4))),
+    ("monthly on 15", Rule(MONTHLY, month_day=15)),
+    ("monthly on the 1st", Rule(MONTHLY, month_day=1)),
+    ("FREQ=WEEKLY;INTERVAL=2;BYDAY=TU", Rule(WEEKLY, 2, (1,))),
+    ("RRULE:FREQ=MONTHLY;BYMONTHDAY=31", Rule(MONTHLY, month_day=31)),
+])
+def test_parse(text, rule):
+    assert recurrence.parse(text) == rule
+
+
+@pytest.mark.parametrize("text", [
+    "fortnightly",
+    "every 0 days",
+    "FREQ=YEARLY",
+    "FREQ=DAILY;BYDAY=MO",
+    "FREQ=WEEKLY;COUNT=3",
+    "monthly on 32",
+])
+def test_parse_rejects_unsupported_rules(text):
+    with pytest.raises(ValueError):
+        recurrence.parse(text)
+
+
+def test_normalize_keeps_legacy_values_and_canonicalises_the_rest():
+    assert recurrence.normalize("Daily") == "daily"
+    assert recurrence.normalize("every 1 weeks") == "weekly"
+    assert recurrence.normalize("fri, mon") == "FREQ=WEEKLY;BYDAY=MO,FR"
+    assert recurrence.normalize(None) == "none"
+    # Plain "monthly" is pinned to the first due date's day of month
+    assert recurrence.normalize("monthly", to_day_number("2026-01-31")) == "FREQ=MONTHLY;BYMONTHDAY=31"
+
+
+def test_describe():
+    assert recurrence.describe("weekly") == "Weekly"
+    assert recurrence.describe("FREQ=DAILY;INTERVAL=3") == "Every 3 days"
+    assert recurrence.describe("FREQ=WEEKLY;INTERVAL=2;BYDAY=TU") == "Every 2 weeks on Tue"
+    assert recurrence.describe("FREQ=MONTHLY;BYMONTHDAY=15") == "Monthly on day 15"
+
+
+# ── Next occurrence ─────────────────────────────────────────────
+
+@pytest.mark.parametrize("text, base, expected", [
+    ("daily", "2026-03-01", "2026-03-02"),
+    ("weekly", "2026-03-01", "2026-03-08"),
+    ("every 3 days", "2026-03-01", "2026-03-04"),
+    ("mon, wed, fri", "2026-10-18", "2026-10-19"),   # Sun -> Mon
+    ("mon, wed, fri", "2026-10-23", "2026-10-26"),   # Fri -> next Mon
+    ("FREQ=WEEKLY;INTERVAL=2;BYDAY=TU,TH", "2026-10-20", "2026-10-22"),
+    ("FREQ=WEEKLY;INTERVAL=2;BYDAY=TU,TH", "2026-10-22", "2026-11-03"),
+    ("monthly on 15", "2026-01-10", "2026-01-15"),
+    ("monthly on 31", "2026-01-31", "2026-02-28"),
+    ("monthly on 31", "2026-02-28", "2026-03-31"),
+    ("FREQ=MONTHLY;INTERVAL=3;BYMONTHDAY=15", "2026-01-15", "2026-04-15"),
+])
+def test_next_occurrence(text, base, expected):
+    assert _next(text, base) == expected
+
+
+def test_next_occurrence_skips_missed_instances():
+    assert _next("every 3 days", "2026-01-01", after="2026-01-10") == "2026-01-13"
+    assert _next("FREQ=WEEKLY;INTERVAL=2;BYDAY=MO", "2026-01-05", after="2026-02-01") == "2026-02-02"
+    assert _next("FREQ=MONTHLY;INTERVAL=2;BYMONTHDAY=1", "2026-01-01", after="2026-04-15") == "2026-05-01"
+
+
+@pytest.mark.parametrize("after", [None, to_day_number("2026-06-01")])
+def test_next_occurrences_matches_next_occurrence(after):
+    rng = random.Random(7)
+    texts = [
+        "daily", "weekly", "none", "bogus", "FREQ=DAILY;INTERVAL=4",
+        "FREQ=WEEKLY;BYDAY=SA", "FREQ=WEEKLY;INTERVAL=3;BYDAY=MO,SU",
+        "FREQ=MONTHLY;BYMONTHDAY=30", "FREQ=MONTHLY;INTERVAL=5;BYMONTHDAY=29", "monthly",
+    ]
+    series = [(rng.choice(texts), to_day_number("2025-01-01") + rng.randrange(700)) for _ in range(2000)]
+
+    batch = recurrence.next_occurrences([t for t, _ in series], [b for _, b in series], after)
+
+    for (text, base), got in zip(series, batch):
+        if text in ("none", "bogus"):
+            assert got is None
+        else:
+            assert got == recurrence.next_occurrence(recurrence.parse(text), base, after), text
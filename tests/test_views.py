@@ -0,0 +1,149 @@
+"""Tests for src/views.py — task button routing."""
+
+import asyncio
+
+import discord
+import pytest
+
+import src.db as db_module
+from src import views
+from src.events import EventBus, TASK_COMPLETED
+from src.views import TaskButton, TaskView
+
+
+@pytest.mark.asyncio
+async def test_task_view_uses_dynamic_buttons():
+    view = TaskView(task_id=42)
+    assert [item.custom_id for item in view.children] == ["done_42", "snooze_42"]
+    assert all(isinstance(item, TaskButton) for item in view.children)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("custom_id, action, task_id", [
+    ("done_7", "done", 7),
+    ("snooze_12345", "snooze", 12345),
+])
+async def test_task_button_parses_custom_id(custom_id, action, task_id):
+    template = TaskButton.__discord_ui_compiled_template__
+    match = template.fullmatch(custom_id)
+    button = await TaskButton.from_custom_id(None, None, match)
+    assert (button.action, button.task_id) == (action, task_id)
+    assert button.custom_id == custom_id
+
+
+def test_task_button_rejects_foreign_custom_ids():
+    template = TaskButton.__discord_ui_compiled_template__
+    assert template.fullmatch("done_abc") is None
+    assert template.fullmatch("archive_7") is None
+
+
+# ── Button handlers ─────────────────────────────────────────────
+
+class _Response:
+    def __init__(self, events):
+        self.events = events
+
+    async def defer(self):
+        self.events.append("ack")
+
+
+class _Followup:
+    def __init__(self, events):
+        self.events = events
+
+    async def send(self, content, **kwargs):
+        self.events.append(("followup", content))
+
+
+class _Client:
+    def __init__(self):
+        self.events = EventBus()
+
+    def get_channel(self, channel_id):
+        return None
+
+
+class _Interaction:
+    def __init__(self):
+        self.events = []
+        self.response = _Response(self.events)
+        self.followup = _Followup(self.events)
+        self.client = _Client()
+        self.guild = None
+        self.created_at = discord.utils.utcnow()
+
+    async def edit_original_response(self, **fields):
+        self.events.append("edit")
+
+
+@pytest.mark.asyncio
+async def test_done_acknowledges_before_db_work(db_pool, monkeypatch):
+    await db_module.add_user("u1")
+    task_id = await db_module.add_task("u1", "Task", "2026-12-31", "none")
+    interaction = _Interaction()
+
+    real_complete_task = db_module.complete_task
+
+    async def complete_task(tid, delta):
+        interaction.events.append("db")
+        return await real_complete_task(tid, delta)
+
+    monkeypatch.setattr(db_module, "complete_task", complete_task)
+    await TaskButton("done", task_id).callback(interaction)
+    await asyncio.gather(*views._background_tasks)
+
+    assert interaction.events == ["ack", "db", "edit"]
+    assert (await db_module.get_task(task_id))["status"] == "completed"
+    assert (await db_module.get_user("u1"))["score"] == 10
+
+
+@pytest.mark.asyncio
+async def test_done_on_completed_task_replies_via_followup(db_pool):
+    await db_module.add_user("u1")
+    task_id = await db_module.add_task("u1", "Task", "2026-12-31", "none")
+    await db_module.update_task_status(task_id, "completed")
+    interaction = _Interaction()
+
+    await TaskButton("done", task_id).callback(interaction)
+
+    assert interaction.events == ["ack", ("followup", "This task is already done!")]
+    assert (await db_module.get_user("u1"))["score"] == 0
+
+
+@pytest.mark.asyncio
+async def test_done_regenerates_recurring_task_in_background(db_pool):
+    await db_module.add_user("u1")
+    task_id = await db_module.add_task("u1", "Daily", "2026-03-01", "daily")
+
+    await TaskButton("done", task_id).callback(_Interaction())
+    await asyncio.gather(*views._background_tasks)
+
+    pending = await db_module.get_tasks_for_user("u1", status="pending")
+    assert [t["due_date"] for t in pending] == ["2026-03-02"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_done_clicks_score_once(db_pool):
+    await db_module.add_user("u1")
+    task_id = await db_module.add_task("u1", "Task", "2026-12-31", "none")
+    clicks = [_Interaction() for _ in range(5)]
+
+    await asyncio.gather(*(TaskButton("done", task_id).callback(i) for i in clicks))
+    await asyncio.gather(*views._background_tasks)
+
+    assert (await db_module.get_user("u1"))["score"] == 10
+    assert sum("edit" in i.events for i in clicks) == 1
+    assert sum(i.client.events.published[TASK_COMPLETED] for i in clicks) == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_snooze_clicks_apply_once(db_pool):
+    await db_module.add_user("u1")
+    task_id = await db_module.add_task("u1", "Task", "2026-03-01", "none")
+    clicks = [_Interaction() for _ in range(3)]
+
+    await asyncio.gather(*(TaskButton("snooze", task_id).callback(i) for i in clicks))
+    await asyncio.gather(*views._background_tasks)
+
+    assert (await db_module.get_task(task_id))["due_date"] == "2026-03-02"
+    assert (await db_module.get_user("u1"))["score"] == -2